@@ -3,32 +3,42 @@
 생년월일 기반 매일 명언/시 제공 시스템
 Flask Backend
 """
-from flask import Flask, request, jsonify, render_template, redirect, send_file
+from flask import Blueprint, Flask, current_app, request, jsonify, render_template, redirect, url_for, abort, g
 from flask_cors import CORS
-from io import BytesIO
-import os
 import json
-import hashlib
-import string
-import random
+import os
+import re
 from datetime import datetime
+from typing import Optional
 import pytz
 
-# PIL/Pillow 임포트 (선택적)
-try:
-    from PIL import Image, ImageDraw, ImageFont
-    HAS_PIL = True
-except ImportError:
-    HAS_PIL = False
-    print("PIL/Pillow가 설치되지 않았습니다. OG 이미지 생성 기능이 제한됩니다.")
+from config import DEVELOPMENT, PRODUCTION, Settings, load_settings
+
 from quote_fetcher import QuoteFetcher
-from birthday_analyzer import BirthdayAnalyzer
+from quote_ingest import IngestedQuoteStore
+from birthday_analyzer import analyze_birth_date
 from color_suggester import ColorSuggester
 from drink_suggester import DrinkSuggester
 from shopping_suggester import ShoppingSuggester
+from shopping_catalog import ShoppingCatalog
+from naver_shopping_client import NaverShoppingClient
 from flower_suggester import FlowerSuggester
 from greeting_suggester import GreetingSuggester
 from user_history_service import UserHistoryService
+from storage_backend import create_backend
+from short_code import ShortCodeGenerator
+from birthday_cache import BirthdayCache
+from daily_bundle import DailyBundle
+from daily_table import DailyTableStore
+from daily_composer import DailyComposer, QuoteUnavailableError
+from response_cache import DailyResponseCache, create_response_cache
+from resilience import breaker_stats, clear_deadline, start_deadline
+from og_images import OgImageStore
+from og_cards import OgCardRenderer, RenderBusy, content_from_share_url
+from static_assets import AssetPipeline
+from page_prerender import USER_COOKIE, initial_data, user_id_from_cookie
+from http_cache import (add_cache_headers, content_version, kst_day_start, make_etag,
+                        not_modified_response, seconds_until_kst_midnight)
 
 # 한국시간대 설정
 KST = pytz.timezone('Asia/Seoul')
@@ -37,81 +47,235 @@ def get_kst_now():
     """한국시간(KST) 기준 현재 시간 반환"""
     return datetime.now(KST)
 
-app = Flask(__name__,
-            template_folder='templates',
-            static_folder='static')
-CORS(app)
+# 환경 변수 설정 (APP_ENV=development|production, python app.py로 실행하면 기본 development)
+settings = load_settings(default_profile=DEVELOPMENT if __name__ == '__main__' else PRODUCTION)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_FOLDER = os.path.join(BASE_DIR, 'static')
 
-# 개발 모드 설정
-app.config['TEMPLATES_AUTO_RELOAD'] = True
-app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 0
+# 라우트는 블루프린트에 등록하고 create_app()에서 앱에 연결
+bp = Blueprint('main', __name__)
 
 # 데이터 저장 폴더
 DATA_FOLDER = 'data'
 if not os.path.exists(DATA_FOLDER):
     os.makedirs(DATA_FOLDER)
 
-# 단축 URL 저장 파일
-SHORT_URL_FILE = os.path.join(DATA_FOLDER, 'short_urls.json')
+# 저장소 백엔드 (STORAGE_BACKEND=json|sqlite, 기본 json)
+storage = create_backend(
+    settings.storage_backend,
+    data_folder=DATA_FOLDER,
+    db_path=settings.sqlite_path
+)
 
-# 단축 URL 데이터 로드
-def load_short_urls():
-    """단축 URL 매핑 데이터 로드"""
-    if os.path.exists(SHORT_URL_FILE):
-        try:
-            with open(SHORT_URL_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except:
-            return {}
-    return {}
-
-# 단축 URL 데이터 저장
-def save_short_urls(data):
-    """단축 URL 매핑 데이터 저장"""
-    with open(SHORT_URL_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-# 짧은 코드 생성
-def generate_short_code(url, length=6):
-    """URL에서 짧은 코드 생성"""
-    # URL 해시 생성
-    url_hash = hashlib.md5(url.encode('utf-8')).hexdigest()
-    # 랜덤 문자 추가하여 더 짧은 코드 생성
-    chars = string.ascii_letters + string.digits
-    random_part = ''.join(random.choice(chars) for _ in range(length))
-    # 해시와 랜덤 조합
-    short_code = (url_hash[:3] + random_part)[:length]
-    return short_code
+# 사용자별 생년월일 캐시 (저장 시 write-through, 조회 시 저장소 버전 확인)
+birthday_cache = BirthdayCache(storage)
+
+# 저장된 생년월일 로드
+def load_birthday(user_id):
+    """저장된 생년월일 반환 (없으면 None)"""
+    return birthday_cache.get(user_id)
+
+# 짧은 코드 생성기 (순번 기반, 재시도 없이 고유)
+short_code_generator = ShortCodeGenerator(settings.short_code_secret.encode('utf-8'))
 
 # 명언 수집기 초기화
-quote_fetcher = QuoteFetcher()
+quote_fetcher = QuoteFetcher(store=IngestedQuoteStore(os.path.join(DATA_FOLDER, 'ingested_quotes.jsonl')))
 color_suggester = ColorSuggester()
 drink_suggester = DrinkSuggester()
 flower_suggester = FlowerSuggester()
 greeting_suggester = GreetingSuggester()
 
 # 히스토리 서비스 초기화
-history_service = UserHistoryService(data_folder=DATA_FOLDER)
+history_service = UserHistoryService(data_folder=DATA_FOLDER, backend=storage)
+
+# /api/daily 응답 캐시 ((사용자, KST 날짜) 단위, 자정 만료, 생년월일/히스토리 변경 시 무효화)
+# RESPONSE_CACHE=memory(워커별 LRU, 기본)|sqlite(워커 간 공유, 경로는 RESPONSE_CACHE_PATH)
+daily_response_cache = DailyResponseCache(
+    create_response_cache(
+        settings.response_cache,
+        data_folder=DATA_FOLDER,
+        db_path=settings.response_cache_path
+    ),
+    storage
+)
+
+# 응답 내용을 결정하는 코드/데이터 버전 (배포로 바뀌면 ETag도 바뀜)
+CONTENT_VERSION = content_version(
+    __name__, 'quote_corpus', 'quote_fetcher', 'birthday_analyzer', 'astro_attributes',
+    'color_suggester', 'drink_suggester', 'flower_suggester', 'greeting_suggester',
+    'shopping_suggester', 'daily_bundle'
+)
+
+# OG 이미지 변환본 (PNG/WebP/JPEG, 시작 시 백그라운드에서 준비)
+# 정적 이미지가 없으면 og_default.png, 그것도 없으면 생성한 기본 이미지 사용
+OG_IMAGE_MAX_AGE = settings.og_image_max_age
+_og_image_path = os.path.join(STATIC_FOLDER, 'images', 'og_image.png')
+if not os.path.exists(_og_image_path):
+    _og_image_path = os.path.join(STATIC_FOLDER, 'images', 'og_default.png')
+og_image_store = OgImageStore(_og_image_path, os.path.join(DATA_FOLDER, 'og_cache'))
+og_image_store.warm_async()
+
+# 공유 링크별 OG 카드 (같은 명언/컬러는 캐시된 이미지, 새로 그리기는 워커당 동시 실행 제한)
+og_card_renderer = OgCardRenderer(
+    os.path.join(DATA_FOLDER, 'og_cards'),
+    font_folder=os.path.join(STATIC_FOLDER, 'fonts'),
+    max_concurrent=settings.og_card_max_concurrent
+)
+
+# 축소/해시/사전 압축한 JS/CSS (원본이 바뀌었으면 시작 시 다시 빌드, ASSET_PIPELINE=0이면 원본 그대로)
+ASSET_MAX_AGE = 365 * 24 * 3600
+asset_pipeline = AssetPipeline(STATIC_FOLDER)
+if settings.asset_pipeline:
+    asset_pipeline.load()
+
+# 서버 렌더링한 메인 페이지 캐시 (PRERENDER_INDEX=1, /api/daily 응답 캐시와 같은 무효화 규칙)
+index_page_cache = DailyResponseCache(
+    create_response_cache(
+        settings.response_cache,
+        data_folder=DATA_FOLDER,
+        db_path=settings.response_cache_path
+    ),
+    storage,
+    prefix='page'
+)
+
+
+def _file_digest(path):
+    with open(path, encoding='utf-8') as f:
+        return make_etag(f.read())
+
+
+# 페이지 HTML을 결정하는 버전 (응답 내용, 빌드된 자산 이름, 템플릿이 바뀌면 캐시된 페이지 무효화)
+INDEX_PAGE_VERSION = make_etag(
+    CONTENT_VERSION,
+    asset_pipeline.built_path('css/style.css'), asset_pipeline.built_path('js/app.js'),
+    _file_digest(os.path.join(BASE_DIR, 'templates', 'index.html'))
+)
+
+
+@bp.app_template_global()
+def asset_url(filename):
+    """템플릿용 정적 자산 URL (빌드된 해시 파일이 있으면 그 주소)"""
+    built = asset_pipeline.built_path(filename)
+    if built is None:
+        return url_for('static', filename=filename)
+    return url_for('main.serve_asset', filename=built)
 
 # 네이버 쇼핑 API 키 설정 (환경 변수 또는 직접 설정)
-NAVER_CLIENT_ID = os.environ.get('NAVER_CLIENT_ID', '6uQXc6h4TnSMVS_h5ooY')
-NAVER_CLIENT_SECRET = os.environ.get('NAVER_CLIENT_SECRET', 'zBXyXbIxN4')
+NAVER_CLIENT_ID = settings.naver_client_id
+NAVER_CLIENT_SECRET = settings.naver_client_secret
+naver_shopping_client = NaverShoppingClient(NAVER_CLIENT_ID, NAVER_CLIENT_SECRET)
+
+# 쇼핑 상품 스냅숏 (요청 처리 중에는 스냅숏만 조회, 갱신은 백그라운드)
+# SHOPPING_CATALOG=0이면 요청마다 네이버 쇼핑 API로 조회
+shopping_catalog = None
+if settings.shopping_catalog:
+    shopping_catalog = ShoppingCatalog(
+        naver_shopping_client,
+        os.path.join(DATA_FOLDER, 'shopping_catalog.json'),
+        ShoppingSuggester.all_queries(),
+        max_age=settings.shopping_snapshot_max_age
+    )
+    shopping_catalog.start_refresher()
+
 shopping_suggester = ShoppingSuggester(
     client_id=NAVER_CLIENT_ID,
-    client_secret=NAVER_CLIENT_SECRET
+    client_secret=NAVER_CLIENT_SECRET,
+    client=naver_shopping_client,
+    catalog=shopping_catalog
 )
 
-# 사용자별 생년월일 저장 (실제로는 DB 사용 권장)
-user_birthdays = {}
+# 오늘의 추천 묶음 (생년월일 파싱과 시드 계산을 요청당 한 번만)
+# DAILY_BUNDLE_COMPAT=1이면 기존 카테고리별 시드를 사용하여 이전과 같은 추천 유지
+daily_bundle = DailyBundle(
+    color_suggester, drink_suggester, flower_suggester, greeting_suggester, shopping_suggester,
+    secret=settings.daily_seed_secret.encode('utf-8'),
+    compatible=settings.daily_bundle_compat
+)
 
+# 날짜별 추천 사전 계산 표 (모든 생년월일, 워커 간 메모리 맵 공유)
+# 백그라운드에서 오늘/내일 표를 만들고 매일 자정(KST)에 다음 날 표 생성 (DAILY_TABLE=0이면 끔)
+daily_table = DailyTableStore(os.path.join(DATA_FOLDER, 'daily_table'), daily_bundle)
+if settings.daily_table:
+    daily_table.start_scheduler()
 
-@app.route('/')
-def index():
-    """메인 페이지"""
-    return render_template('index.html')
+# /api/daily 항목 계산 (DAILY_FANOUT=concurrent면 외부 API 항목을 동시 실행, 기본 sequential)
+daily_composer = DailyComposer(
+    quote_fetcher, daily_table, shopping_suggester, history_service,
+    mode=settings.daily_fanout
+)
+
+# 요청 단위 기한(초): 요청 처리 중의 외부 API 호출은 남은 시간까지만 기다림
+REQUEST_DEADLINE = settings.request_deadline
+
+
+@bp.before_app_request
+def start_request_deadline():
+    g.deadline_token = start_deadline(REQUEST_DEADLINE)
 
 
-@app.route('/api/birthday', methods=['POST'])
+@bp.teardown_app_request
+def clear_request_deadline(exc=None):
+    token = g.pop('deadline_token', None)
+    if token is not None:
+        clear_deadline(token)
+
+
+@bp.route('/')
+def index():
+    """메인 페이지 (단축 URL로 공유된 링크면 OG 이미지로 공유 카드 사용)"""
+    user_id = user_id_from_cookie(request.cookies.get(USER_COOKIE)) if settings.prerender_index else None
+    if user_id:
+        today = get_kst_now().strftime('%Y-%m-%d')
+        # 한잔 추천의 시간대 메시지가 바뀌면 페이지도 다시 렌더링
+        variant = request.url + INDEX_PAGE_VERSION + drink_suggester.get_time_of_day()
+        # 템플릿 자동 리로드 중(개발)에는 템플릿 수정이 바로 보이도록 페이지 캐시 사용 안 함
+        use_cache = not current_app.config['TEMPLATES_AUTO_RELOAD']
+        cached = index_page_cache.get(user_id, today, variant) if use_cache else None
+        if cached is not None:
+            return _private_page(current_app.response_class(cached, mimetype='text/html'))
+
+    og_image_url = url_for('main.generate_og_image')
+    if request.query_string:
+        short_code = storage.find_short_code(request.url)
+        if short_code:
+            og_image_url = url_for('main.generate_og_card', short_code=short_code)
+    if not user_id:
+        return render_template('index.html', og_image_url=og_image_url)
+
+    # 오늘의 응답을 서버에서 미리 계산하여 페이지에 포함 (프런트엔드의 API 왕복 생략)
+    birth_date = load_birthday(user_id)
+    body, complete = None, False
+    if birth_date:
+        body = daily_response_cache.get(user_id, today)
+        complete = body is not None
+        if body is not None:
+            body = _with_time_of_day(body, drink_suggester.get_time_of_day())
+        if body is None:
+            try:
+                body, complete = _render_daily(user_id, birth_date, today)
+            except QuoteUnavailableError as e:
+                # 명언을 못 가져오면 프런트엔드가 /api/daily로 다시 시도
+                print(f"메인 페이지 서버 렌더링 오류: {e}")
+    else:
+        complete = True
+    html = render_template('index.html', og_image_url=og_image_url,
+                           initial_data=initial_data(user_id, birth_date, body))
+    if complete and use_cache:
+        index_page_cache.set(user_id, today, html.encode('utf-8'), variant)
+    return _private_page(current_app.response_class(html, mimetype='text/html'))
+
+
+def _private_page(response):
+    """사용자별로 다른 페이지는 공유 캐시(CDN/프록시)에 저장되지 않도록"""
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    response.vary.add('Cookie')
+    return response
+
+
+@bp.route('/api/birthday', methods=['POST'])
 def save_birthday():
     """생년월일 저장"""
     try:
@@ -134,13 +298,8 @@ def save_birthday():
                 'error': '생년월일 형식이 올바르지 않습니다. (YYYY-MM-DD)'
             }), 400
         
-        # 저장
-        user_birthdays[user_id] = birth_date
-        
-        # 파일로도 저장 (영구 보존)
-        file_path = os.path.join(DATA_FOLDER, f'{user_id}_birthday.json')
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump({'birth_date': birth_date, 'saved_at': get_kst_now().isoformat()}, f, ensure_ascii=False)
+        # 저장 (저장소에 영구 보존, 캐시도 함께 갱신)
+        birthday_cache.set(user_id, {'birth_date': birth_date, 'saved_at': get_kst_now().isoformat()})
         
         return jsonify({
             'success': True,
@@ -153,18 +312,11 @@ def save_birthday():
         }), 500
 
 
-@app.route('/api/birthday/<user_id>', methods=['GET'])
+@bp.route('/api/birthday/<user_id>', methods=['GET'])
 def get_birthday(user_id):
     """생년월일 조회"""
     try:
-        # 파일에서 먼저 확인
-        file_path = os.path.join(DATA_FOLDER, f'{user_id}_birthday.json')
-        if os.path.exists(file_path):
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                birth_date = data.get('birth_date')
-        else:
-            birth_date = user_birthdays.get(user_id)
+        birth_date = load_birthday(user_id)
         
         if not birth_date:
             return jsonify({
@@ -185,21 +337,19 @@ def get_birthday(user_id):
         }), 500
 
 
-@app.route('/api/analyze', methods=['POST'])
+@bp.route('/api/analyze', methods=['GET', 'POST'])
 def analyze_birthday():
-    """생년월일 분석"""
+    """생년월일 분석 (GET은 ETag/Cache-Control 조건부 캐시 지원)"""
     try:
-        data = request.json
+        data = request.args if request.method == 'GET' else request.json
         birth_date = data.get('birth_date')
         user_id = data.get('user_id', 'default')
         
+        # 요청에 생년월일이 있으면 응답이 요청만으로 결정되므로 공유 캐시 허용
+        explicit = bool(birth_date)
         if not birth_date:
             # 저장된 생년월일 사용
-            file_path = os.path.join(DATA_FOLDER, f'{user_id}_birthday.json')
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    saved_data = json.load(f)
-                    birth_date = saved_data.get('birth_date')
+            birth_date = load_birthday(user_id)
             
             if not birth_date:
                 return jsonify({
@@ -207,14 +357,23 @@ def analyze_birthday():
                     'error': '생년월일이 필요합니다.'
                 }), 400
         
+        # 분석 결과는 생년월일과 오늘 날짜(나이)로만 결정됨
+        # 저장된 생년월일은 바뀔 수 있으므로 생년월일이 든 ETag로 매번 재검증 (private, no-cache)
+        now = get_kst_now()
+        etag = make_etag('analyze', birth_date, now.strftime('%Y-%m-%d'), CONTENT_VERSION)
+        last_modified = kst_day_start(now) if explicit else None
+        max_age = seconds_until_kst_midnight(now) if explicit else None
+        not_modified = not_modified_response(etag, last_modified, max_age)
+        if not_modified is not None:
+            return not_modified
+        
         # 생년월일 분석
-        analyzer = BirthdayAnalyzer(birth_date)
-        analysis = analyzer.analyze()
+        analysis = analyze_birth_date(birth_date)
         
-        return jsonify({
+        return add_cache_headers(jsonify({
             'success': True,
             'data': analysis
-        })
+        }), etag, last_modified, max_age)
     except ValueError as e:
         return jsonify({
             'success': False,
@@ -227,7 +386,7 @@ def analyze_birthday():
         }), 500
 
 
-@app.route('/api/quote', methods=['GET'])
+@bp.route('/api/quote', methods=['GET'])
 def get_quote():
     """매일 명언/시 조회 (랜덤 옵션 지원)"""
     try:
@@ -236,12 +395,18 @@ def get_quote():
         random_seed = request.args.get('random')  # 랜덤 시드 (다른 한 줄 보기용)
         
         # 생년월일 가져오기
-        birth_date = None
-        file_path = os.path.join(DATA_FOLDER, f'{user_id}_birthday.json')
-        if os.path.exists(file_path):
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                birth_date = data.get('birth_date')
+        birth_date = load_birthday(user_id)
+        
+        # 랜덤이 아니면 (날짜, 생년월일)로 결정되므로 조건부 캐시 (분석의 나이는 오늘 날짜 기준)
+        # 생년월일은 사용자가 바꿀 수 있는 저장 값이므로 생년월일이 든 ETag로 매번 재검증 (private, no-cache)
+        etag = None
+        if not random_seed:
+            now = get_kst_now()
+            etag = make_etag('quote', date_str or now.strftime('%Y-%m-%d'), now.strftime('%Y-%m-%d'),
+                             birth_date, CONTENT_VERSION)
+            not_modified = not_modified_response(etag)
+            if not_modified is not None:
+                return not_modified
         
         # 랜덤 시드가 있으면 랜덤 명언/시 제공
         if random_seed:
@@ -254,18 +419,20 @@ def get_quote():
         analysis = None
         if birth_date:
             try:
-                analyzer = BirthdayAnalyzer(birth_date)
-                analysis = analyzer.analyze()
+                analysis = analyze_birth_date(birth_date)
             except:
                 pass
         
-        return jsonify({
+        response = jsonify({
             'success': True,
             'data': {
                 'quote': quote,
                 'analysis': analysis
             }
         })
+        if etag is not None:
+            add_cache_headers(response, etag)
+        return response
     except Exception as e:
         return jsonify({
             'success': False,
@@ -273,19 +440,88 @@ def get_quote():
         }), 500
 
 
-@app.route('/api/daily', methods=['GET'])
+def _render_daily(user_id, birth_date, today):
+    """
+    오늘의 /api/daily 응답 본문 생성 (/api/daily와 서버 렌더링한 메인 페이지가 공유)
+
+    Returns:
+        (JSON 본문 바이트, 모든 항목이 정상인지 여부 - 정상일 때만 응답 캐시에 저장)
+
+    Raises:
+        QuoteUnavailableError: 명언을 가져올 수 없을 때
+    """
+    # 히스토리는 한 번만 로드하여 메모리에서 중복 회피 확인 (응답 직전에 한 번 저장)
+    history = history_service.session(user_id)
+    
+    # 명언/분석/컬러/한잔/꽃/인사말/쇼핑 (외부 API 항목은 요청 기한 안에서 동시 실행)
+    parts = daily_composer.compose(history, birth_date, today)
+    
+    history.flush()
+    
+    body = jsonify({
+        'success': True,
+        'data': {
+            'quote': parts['quote'],
+            'analysis': parts['analysis'],
+            'color': parts['color'],
+            'drink': parts['drink'],
+            'flower': parts['flower'],
+            'greeting': parts['greeting'],
+            'shopping_items': parts['shopping_items'],
+            'date': today
+        }
+    }).get_data()
+    
+    # 모든 항목이 정상일 때만 캐시 (일시적 오류/시간 초과 결과를 하루 종일 보여주지 않도록)
+    complete = all(parts[name] is not None for name in ('analysis', 'color', 'drink', 'flower', 'greeting')) \
+        and bool(parts['shopping_items'])
+    if complete:
+        daily_response_cache.set(user_id, today, body)
+    return body, complete
+
+
+# 캐시된 /api/daily 본문의 한잔 추천 시간대 (오전/오후/저녁)
+_TIME_OF_DAY = re.compile(rb'"time_of_day":\s*"(\w+)"')
+
+
+def _with_time_of_day(body, time_of_day):
+    """
+    캐시된 /api/daily 본문의 한잔 추천 시간대/메시지를 현재 시간대로 바꿈
+    (다시 계산하면 히스토리 때문에 다른 추천이 나오므로 하루 동안 같은 본문을 쓰고 시간대 항목만 갱신)
+    """
+    match = _TIME_OF_DAY.search(body)
+    if match is None or match.group(1).decode('ascii') == time_of_day:
+        return body
+    payload = json.loads(body)
+    drink = payload['data']['drink']
+    drink['time_of_day'] = time_of_day
+    drink['time_message'] = drink_suggester.TIME_MESSAGES[time_of_day]
+    return jsonify(payload).get_data()
+
+
+@bp.route('/api/daily', methods=['GET'])
 def get_daily():
     """생년월일 기반 오늘의 명언/시 (통합 API)"""
     try:
         user_id = request.args.get('user_id', 'default')
+        today = get_kst_now().strftime('%Y-%m-%d')
+        
+        # 오늘 응답은 (날짜, 생년월일/히스토리 버전, 한잔 추천 시간대)로 결정되므로 클라이언트 캐시가 같으면 304
+        time_of_day = drink_suggester.get_time_of_day()
+        etag = make_etag('daily', user_id, today, daily_response_cache.version(user_id), time_of_day,
+                         CONTENT_VERSION)
+        not_modified = not_modified_response(etag)
+        if not_modified is not None:
+            return not_modified
+        
+        # 오늘 이미 만든 응답이 있으면 그대로 반환 (생년월일/히스토리가 바뀌었으면 다시 계산)
+        cached = daily_response_cache.get(user_id, today)
+        if cached is not None:
+            cached = _with_time_of_day(cached, time_of_day)
+            return add_cache_headers(current_app.response_class(cached, mimetype='application/json'), etag)
         
         # 생년월일 가져오기
-        birth_date = None
-        file_path = os.path.join(DATA_FOLDER, f'{user_id}_birthday.json')
-        if os.path.exists(file_path):
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                birth_date = data.get('birth_date')
+        birth_date = load_birthday(user_id)
         
         if not birth_date:
             return jsonify({
@@ -294,168 +530,22 @@ def get_daily():
                 'requires_birthday': True
             }), 400
         
-        # 생년월일 분석
-        try:
-            analyzer = BirthdayAnalyzer(birth_date)
-            analysis = analyzer.analyze()
-        except Exception as e:
-            print(f"생년월일 분석 오류: {e}")
-            analysis = None
-        
-        # 오늘의 명언/시 (생년월일 포함, 중복 회피)
         try:
-            quote = None
-            max_attempts = 10
-            for attempt in range(max_attempts):
-                # 날짜 기반 명언 가져오기 (시드에 시도 횟수 추가하여 변화 주기)
-                random_seed = f"{get_kst_now().strftime('%Y-%m-%d')}_{attempt}"
-                temp_quote = quote_fetcher.fetch_random_quote(birth_date=birth_date, random_seed=random_seed)
-                
-                # 명언 ID 생성 (텍스트 해시)
-                quote_id = history_service.get_content_hash(temp_quote.get('text', ''))
-                
-                # 중복 회피 확인
-                if not history_service.should_avoid(user_id, 'quote', quote_id):
-                    quote = temp_quote
-                    # 히스토리에 기록
-                    history_service.record_view(user_id, 'quote', quote_id)
-                    break
-            
-            # 모든 시도 실패 시 마지막 명언 사용
-            if quote is None:
-                quote = quote_fetcher.fetch_daily_quote(birth_date=birth_date)
-                quote_id = history_service.get_content_hash(quote.get('text', ''))
-                history_service.record_view(user_id, 'quote', quote_id)
-        except Exception as e:
+            body, complete = _render_daily(user_id, birth_date, today)
+        except QuoteUnavailableError as e:
             print(f"명언 가져오기 오류: {e}")
-            import traceback
-            traceback.print_exc()
             return jsonify({
                 'success': False,
                 'error': f'명언을 가져오는 중 오류가 발생했습니다: {str(e)}'
             }), 500
         
-        # 오늘의 컬러 추천 (날짜 기반 고정, 중복 회피는 다른 날짜에만 적용)
-        try:
-            # 오늘 날짜로 색상 가져오기 (같은 날짜에는 항상 같은 색상)
-            date_str = get_kst_now().strftime('%Y-%m-%d')
-            color = color_suggester.suggest_color(birth_date, date_str=date_str)
-            color_name = color.get('name', '')
-            
-            # 오늘 날짜의 색상은 항상 사용 (날짜 기반 고정)
-            # 히스토리 기록은 하지 않음 (같은 날짜에는 항상 같은 색상이 나와야 하므로)
-            # 중복 회피는 다음 날짜의 색상 선택 시에만 적용됨
-        except Exception as e:
-            print(f"컬러 추천 오류: {e}")
-            color = None
-        
-        # 오늘의 한잔 추천 (중복 회피)
-        try:
-            drink = None
-            max_attempts = 10
-            for attempt in range(max_attempts):
-                temp_drink = drink_suggester.suggest_drink(birth_date)
-                drink_name = temp_drink.get('name', '')
-                
-                if not history_service.should_avoid(user_id, 'drink', drink_name):
-                    drink = temp_drink
-                    history_service.record_view(user_id, 'drink', drink_name)
-                    break
-            
-            if drink is None:
-                drink = drink_suggester.suggest_drink(birth_date)
-                drink_name = drink.get('name', '')
-                history_service.record_view(user_id, 'drink', drink_name)
-        except Exception as e:
-            print(f"음료 추천 오류: {e}")
-            drink = None
+        response = current_app.response_class(body, mimetype='application/json')
+        if complete:
+            # 히스토리 저장 후의 버전으로 검증자 설정 (같은 상태면 다음 요청은 304)
+            add_cache_headers(response, make_etag('daily', user_id, today, daily_response_cache.version(user_id),
+                                                  time_of_day, CONTENT_VERSION))
         
-        # 오늘의 꽃 추천 (중복 회피)
-        try:
-            flower = None
-            max_attempts = 10
-            for attempt in range(max_attempts):
-                temp_flower = flower_suggester.suggest_flower(birth_date)
-                flower_name = temp_flower.get('name', '')
-                
-                if not history_service.should_avoid(user_id, 'flower', flower_name):
-                    flower = temp_flower
-                    history_service.record_view(user_id, 'flower', flower_name)
-                    break
-            
-            if flower is None:
-                flower = flower_suggester.suggest_flower(birth_date)
-                flower_name = flower.get('name', '')
-                history_service.record_view(user_id, 'flower', flower_name)
-        except Exception as e:
-            print(f"꽃 추천 오류: {e}")
-            flower = None
-        
-        # 오늘의 인사말 추천 (중복 회피)
-        try:
-            greeting = None
-            max_attempts = 10
-            for attempt in range(max_attempts):
-                temp_greeting = greeting_suggester.suggest_greeting(birth_date)
-                greeting_text = temp_greeting.get('text', '')
-                greeting_id = history_service.get_content_hash(greeting_text)
-                
-                if not history_service.should_avoid(user_id, 'greeting', greeting_id):
-                    greeting = temp_greeting
-                    history_service.record_view(user_id, 'greeting', greeting_id)
-                    break
-            
-            if greeting is None:
-                greeting = greeting_suggester.suggest_greeting(birth_date)
-                greeting_text = greeting.get('text', '')
-                greeting_id = history_service.get_content_hash(greeting_text)
-                history_service.record_view(user_id, 'greeting', greeting_id)
-        except Exception as e:
-            print(f"인사말 추천 오류: {e}")
-            greeting = None
-        
-        # 오늘의 쇼핑 아이템 추천 (중복 회피)
-        try:
-            shopping_items = []
-            max_attempts = 10
-            for attempt in range(max_attempts):
-                temp_items = shopping_suggester.suggest_shopping_items(birth_date, num_items=1)
-                if temp_items and len(temp_items) > 0:
-                    item = temp_items[0]
-                    item_title = item.get('title', '')
-                    item_id = history_service.get_content_hash(item_title)
-                    
-                    if not history_service.should_avoid(user_id, 'shopping', item_id):
-                        shopping_items = temp_items
-                        history_service.record_view(user_id, 'shopping', item_id)
-                        break
-            
-            if not shopping_items:
-                shopping_items = shopping_suggester.suggest_shopping_items(birth_date, num_items=1)
-                if shopping_items and len(shopping_items) > 0:
-                    item = shopping_items[0]
-                    item_title = item.get('title', '')
-                    item_id = history_service.get_content_hash(item_title)
-                    history_service.record_view(user_id, 'shopping', item_id)
-        except Exception as e:
-            print(f"쇼핑 아이템 추천 오류: {e}")
-            import traceback
-            traceback.print_exc()
-            shopping_items = []
-        
-        return jsonify({
-            'success': True,
-            'data': {
-                'quote': quote,
-                'analysis': analysis,
-                'color': color,
-                'drink': drink,
-                'flower': flower,
-                'greeting': greeting,
-                'shopping_items': shopping_items,
-                'date': get_kst_now().strftime('%Y-%m-%d')
-            }
-        })
+        return response
     except ValueError as e:
         print(f"ValueError: {e}")
         import traceback
@@ -474,7 +564,7 @@ def get_daily():
         }), 500
 
 
-@app.route('/api/shorten-url', methods=['POST'])
+@bp.route('/api/shorten-url', methods=['POST'])
 def shorten_url():
     """URL 단축"""
     try:
@@ -487,39 +577,10 @@ def shorten_url():
                 'error': 'URL이 필요합니다.'
             }), 400
         
-        # 기존 단축 URL 확인
-        short_urls = load_short_urls()
-        
-        # 이미 단축된 URL이 있는지 확인
-        for code, url_data in short_urls.items():
-            if url_data.get('original_url') == original_url:
-                short_code = code
-                short_url = f"{request.host_url}s/{short_code}"
-                return jsonify({
-                    'success': True,
-                    'data': {
-                        'short_url': short_url,
-                        'original_url': original_url,
-                        'code': short_code
-                    }
-                })
-        
-        # 새로운 단축 코드 생성
-        short_code = generate_short_code(original_url)
-        
-        # 중복 확인 및 재생성
-        max_attempts = 10
-        attempts = 0
-        while short_code in short_urls and attempts < max_attempts:
-            short_code = generate_short_code(original_url + str(random.random()))
-            attempts += 1
-        
-        # 단축 URL 저장
-        short_urls[short_code] = {
-            'original_url': original_url,
-            'created_at': get_kst_now().isoformat()
-        }
-        save_short_urls(short_urls)
+        # 이미 단축된 URL이 있으면 기존 코드, 없으면 새 코드 저장 (메모리 인덱스로 O(1) 조회)
+        short_code = storage.get_or_add_short_url(
+            original_url, get_kst_now().isoformat(), short_code_generator.code_for
+        )
         
         # 단축 URL 생성
         short_url = f"{request.host_url}s/{short_code}"
@@ -542,14 +603,14 @@ def shorten_url():
         }), 500
 
 
-@app.route('/s/<short_code>')
+@bp.route('/s/<short_code>')
 def redirect_short_url(short_code):
     """단축 URL 리다이렉트"""
     try:
-        short_urls = load_short_urls()
+        url_data = storage.get_short_url(short_code)
         
-        if short_code in short_urls:
-            original_url = short_urls[short_code].get('original_url')
+        if url_data:
+            original_url = url_data.get('original_url')
             if original_url:
                 return redirect(original_url, code=302)
         
@@ -560,7 +621,7 @@ def redirect_short_url(short_code):
         return redirect('/', code=302)
 
 
-@app.route('/api/history', methods=['GET'])
+@bp.route('/api/history', methods=['GET'])
 def get_history():
     """사용자 히스토리 조회 (조회 기록만)"""
     try:
@@ -593,7 +654,7 @@ def get_history():
         }), 500
 
 
-@app.route('/api/history/clear', methods=['POST'])
+@bp.route('/api/history/clear', methods=['POST'])
 def clear_history():
     """사용자 히스토리 초기화"""
     try:
@@ -615,43 +676,75 @@ def clear_history():
         }), 500
 
 
-@app.route('/og-image')
+@bp.route('/api/health/upstreams', methods=['GET'])
+def upstream_health():
+    """외부 API 서킷 브레이커 상태와 호출 통계 (모니터링용)"""
+    return jsonify({
+        'success': True,
+        'data': {
+            'breakers': breaker_stats(),
+            'naver_shopping': naver_shopping_client.stats(),
+            'shopping_catalog': shopping_catalog.stats() if shopping_catalog is not None else None
+        }
+    })
+
+
+@bp.route('/api/health/caches', methods=['GET'])
+def cache_health():
+    """서버 캐시 적중/실패 통계 (모니터링용)"""
+    return jsonify({
+        'success': True,
+        'data': {
+            'birthdays': birthday_cache.stats(),
+            'daily_responses': daily_response_cache.stats(),
+            'index_pages': index_page_cache.stats()
+        }
+    })
+
+
+@bp.route('/api/health/og-image', methods=['GET'])
+def og_image_health():
+    """OG 이미지 변환본 크기와 절약한 전송량, 공유 카드 캐시 통계 (모니터링용)"""
+    return jsonify({'success': True, 'data': dict(og_image_store.stats(), cards=og_card_renderer.stats())})
+
+
+@bp.route('/assets/<path:filename>')
+def serve_asset(filename):
+    """빌드된 정적 자산 (파일 이름에 내용 해시가 있으므로 1년 immutable 캐시, 사전 압축본 선택)"""
+    asset = asset_pipeline.get(filename)
+    if asset is None:
+        abort(404)
+    encoding = asset_pipeline.choose_encoding(asset, request.accept_encodings)
+    etag = asset.etag if encoding == 'identity' else f'{asset.etag}-{encoding}'
+    response = not_modified_response(etag, max_age=ASSET_MAX_AGE)
+    if response is None:
+        response = add_cache_headers(current_app.response_class(asset.encodings[encoding], content_type=asset.mimetype),
+                                     etag, max_age=ASSET_MAX_AGE)
+        if encoding != 'identity':
+            response.headers['Content-Encoding'] = encoding
+    response.cache_control.immutable = True
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+@bp.route('/og-image')
 def generate_og_image():
-    """OG 이미지 반환 (정적 이미지 사용)"""
+    """OG 이미지 반환 (미리 만든 변환본 중 Accept 헤더에 맞는 형식)"""
     try:
-        # 정적 이미지 파일 경로
-        og_image_path = os.path.join(app.static_folder, 'images', 'og_image.png')
-        
-        # 정적 이미지가 있으면 반환
-        if os.path.exists(og_image_path):
-            response = send_file(og_image_path, mimetype='image/png')
-            # 카카오톡 크롤러를 위한 헤더 설정
-            response.headers['Cache-Control'] = 'public, max-age=3600'  # 1시간 캐시
-            response.headers['Content-Type'] = 'image/png'
-            return response
-        
-        # 정적 이미지가 없으면 기본 이미지 반환
-        default_image_path = os.path.join(app.static_folder, 'images', 'og_default.png')
-        if os.path.exists(default_image_path):
-            response = send_file(default_image_path, mimetype='image/png')
-            response.headers['Cache-Control'] = 'public, max-age=3600'
-            return response
-        
-        # 이미지가 없으면 간단한 색상 이미지 생성
-        if HAS_PIL:
-            try:
-                img = Image.new('RGB', (1200, 630), color='#f8f9fa')
-                img_io = BytesIO()
-                img.save(img_io, 'PNG', optimize=True)
-                img_io.seek(0)
-                response = send_file(img_io, mimetype='image/png')
-                response.headers['Cache-Control'] = 'public, max-age=3600'
-                return response
-            except Exception as e:
-                print(f"이미지 생성 오류: {e}")
-        
-        return jsonify({'error': 'OG 이미지를 생성할 수 없습니다.'}), 404
-        
+        variant = og_image_store.choose(request.accept_mimetypes)
+        if variant is None:
+            return jsonify({'error': 'OG 이미지를 생성할 수 없습니다.'}), 404
+
+        response = not_modified_response(variant.etag, max_age=OG_IMAGE_MAX_AGE)
+        not_modified = response is not None
+        if not not_modified:
+            response = add_cache_headers(current_app.response_class(variant.data, mimetype=variant.mimetype),
+                                         variant.etag, max_age=OG_IMAGE_MAX_AGE)
+        response.vary.add('Accept')
+        # 원본 PNG 대비 절약한 바이트 수 (304면 원본 전체)
+        response.headers['X-Og-Bytes-Saved'] = str(og_image_store.record(variant, not_modified))
+        return response
+
     except Exception as e:
         print(f"OG 이미지 반환 오류: {e}")
         import traceback
@@ -659,9 +752,75 @@ def generate_og_image():
         return jsonify({'error': str(e)}), 500
 
 
+@bp.route('/og-image/<short_code>')
+def generate_og_card(short_code):
+    """단축 URL로 공유한 명언/컬러 카드 (내용을 알 수 없거나 렌더링이 밀리면 기본 OG 이미지)"""
+    try:
+        url_data = storage.get_short_url(short_code)
+        if not url_data:
+            return generate_og_image()
+        content, birth_date = content_from_share_url(url_data.get('original_url', ''))
+        if not content.text:
+            if not birth_date:
+                return generate_og_image()
+            # 명언 없이 공유했으면 공유한 날의 명언
+            quote = quote_fetcher.fetch_daily_quote(url_data.get('created_at', '')[:10] or None, birth_date)
+            content = content._replace(text=quote['text'], author=quote.get('author', ''))
+
+        # 단축 코드의 내용은 바뀌지 않으므로 캐시 키를 ETag로 사용 (렌더링 없이 304)
+        etag = og_card_renderer.cache_key(content)
+        not_modified = not_modified_response(etag, max_age=OG_IMAGE_MAX_AGE)
+        if not_modified is not None:
+            return not_modified
+        try:
+            data, etag = og_card_renderer.render(content)
+        except RenderBusy as e:
+            print(f"OG 카드 렌더링 지연: {e}")
+            return generate_og_image()
+        return add_cache_headers(current_app.response_class(data, mimetype='image/png'), etag, max_age=OG_IMAGE_MAX_AGE)
+
+    except Exception as e:
+        print(f"OG 카드 생성 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        return generate_og_image()
+
+
+# 미리 컴파일해 두는 템플릿 (운영 환경)
+PRECOMPILED_TEMPLATES = ('index.html',)
+
+
+def create_app(config: Optional[Settings] = None) -> Flask:
+    """
+    Flask 앱 생성 (서비스 객체는 모듈에서 한 번만 만들고 앱들이 공유)
+
+    Args:
+        config: 앱 설정 (None이면 환경 변수 설정)
+    """
+    config = config or settings
+    flask_app = Flask(__name__, template_folder='templates', static_folder='static')
+    CORS(flask_app)
+    flask_app.config.update(
+        DEBUG=config.debug,
+        TEMPLATES_AUTO_RELOAD=config.templates_auto_reload,
+        SEND_FILE_MAX_AGE_DEFAULT=config.send_file_max_age,
+        APP_SETTINGS=config
+    )
+    flask_app.register_blueprint(bp)
+
+    if config.precompile_templates:
+        # 자동 리로드가 꺼져 있으면 Jinja는 컴파일한 템플릿을 캐시하고 파일을 다시 확인하지 않음
+        for name in PRECOMPILED_TEMPLATES:
+            flask_app.jinja_env.get_template(name)
+
+    print(config.report())
+    return flask_app
+
+
+app = create_app()
+
+
 if __name__ == '__main__':
-    port = int(os.environ.get('PORT', 5003))
     print(f"생년월일 기반 명언/시 시스템이 시작됩니다.")
-    print(f"브라우저에서 http://localhost:{port} 접속하세요.")
-    app.run(host='0.0.0.0', port=port, debug=True)
-
+    print(f"브라우저에서 http://localhost:{settings.port} 접속하세요.")
+    app.run(host='0.0.0.0', port=settings.port, debug=settings.debug)
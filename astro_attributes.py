@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+별자리/타로/계절/생명수 공용 조회 모듈
+윤년 기준 366일을 모듈 로드 시 한 번 계산해 두고, 월/일로 O(1) 조회
+(컬러/꽃 추천과 생년월일 분석이 모두 같은 표를 사용)
+"""
+from typing import NamedTuple, Tuple
+
+# 별자리 시작일 (양력 기준, 시작일 순서)
+ZODIAC_SIGNS = {
+    (1, 20): ('물병자리', 'Aquarius'),
+    (2, 19): ('물고기자리', 'Pisces'),
+    (3, 21): ('양자리', 'Aries'),
+    (4, 20): ('황소자리', 'Taurus'),
+    (5, 21): ('쌍둥이자리', 'Gemini'),
+    (6, 21): ('게자리', 'Cancer'),
+    (7, 23): ('사자자리', 'Leo'),
+    (8, 23): ('처녀자리', 'Virgo'),
+    (9, 23): ('천칭자리', 'Libra'),
+    (10, 23): ('전갈자리', 'Scorpio'),
+    (11, 22): ('사수자리', 'Sagittarius'),
+    (12, 22): ('염소자리', 'Capricorn'),
+}
+
+# 타로 카드 (생일 숫자 기반)
+TAROT_CARDS = {
+    1: ('마법사', 'The Magician', '새로운 시작, 의지력, 창조력'),
+    2: ('여교황', 'The High Priestess', '직관, 내면의 지혜, 신비'),
+    3: ('여황제', 'The Empress', '풍요, 창조성, 자연'),
+    4: ('황제', 'The Emperor', '권위, 안정, 구조'),
+    5: ('교황', 'The Hierophant', '전통, 가르침, 영성'),
+    6: ('연인', 'The Lovers', '사랑, 선택, 조화'),
+    7: ('전차', 'The Chariot', '의지, 승리, 통제'),
+    8: ('힘', 'Strength', '인내, 용기, 내적 힘'),
+    9: ('은둔자', 'The Hermit', '성찰, 지혜, 내적 탐구'),
+    10: ('운명의 바퀴', 'Wheel of Fortune', '변화, 운명, 순환'),
+    11: ('정의', 'Justice', '공정, 균형, 책임'),
+    12: ('매달린 사람', 'The Hanged Man', '희생, 새로운 관점, 인내'),
+    13: ('죽음', 'Death', '변화, 종료, 재생'),
+    14: ('절제', 'Temperance', '균형, 조화, 인내'),
+    15: ('악마', 'The Devil', '유혹, 속박, 해방'),
+    16: ('탑', 'The Tower', '변화, 붕괴, 각성'),
+    17: ('별', 'The Star', '희망, 영감, 치유'),
+    18: ('달', 'The Moon', '직관, 환상, 잠재의식'),
+    19: ('태양', 'The Sun', '기쁨, 성공, 활력'),
+    20: ('심판', 'Judgement', '재생, 용서, 각성'),
+    21: ('세계', 'The World', '완성, 성취, 여행'),
+    22: ('바보', 'The Fool', '새로운 시작, 순수, 모험'),
+}
+
+# 월별 계절
+_MONTH_SEASONS = ('겨울', '겨울', '봄', '봄', '봄', '여름', '여름', '여름', '가을', '가을', '가을', '겨울')
+
+# 윤년 기준 월별 일수와 월 시작 위치 (2월 29일 포함 366일)
+_MONTH_DAYS = (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_MONTH_OFFSETS = tuple(sum(_MONTH_DAYS[:m]) for m in range(12))
+
+
+class DayAttributes(NamedTuple):
+    """월/일로 정해지는 속성 (불변 레코드)"""
+    month: int
+    day: int
+    zodiac_korean: str
+    zodiac_english: str
+    zodiac_month: int  # 별자리 시작 월
+    zodiac_day: int  # 별자리 시작 일
+    tarot_number: int
+    tarot_korean: str
+    tarot_english: str
+    tarot_meaning: str
+    season: str
+    month_day_digit_sum: int  # MMDD 각 자리 숫자 합 (생일 숫자 합 계산용)
+
+
+def _reduce_life_path(number: int) -> int:
+    """각 자리 숫자 합을 반복하여 한 자리로 (마스터 넘버 11, 22, 33은 유지)"""
+    while number > 9 and number not in (11, 22, 33):
+        number = sum(int(d) for d in str(number))
+    return number
+
+
+def _build_day_table() -> Tuple[DayAttributes, ...]:
+    """윤년 366일의 속성 표 생성"""
+    boundaries = sorted(ZODIAC_SIGNS)
+    table = []
+    for month, days in enumerate(_MONTH_DAYS, start=1):
+        for day in range(1, days + 1):
+            # 시작일이 지난 마지막 별자리 (1월 20일 이전은 전년도 12월 22일 시작 염소자리)
+            start = boundaries[-1]
+            for boundary in boundaries:
+                if (month, day) >= boundary:
+                    start = boundary
+            zodiac_korean, zodiac_english = ZODIAC_SIGNS[start]
+
+            tarot_number = ((month + day) % 22) or 22
+            tarot_korean, tarot_english, tarot_meaning = TAROT_CARDS[tarot_number]
+
+            table.append(DayAttributes(
+                month=month,
+                day=day,
+                zodiac_korean=zodiac_korean,
+                zodiac_english=zodiac_english,
+                zodiac_month=start[0],
+                zodiac_day=start[1],
+                tarot_number=tarot_number,
+                tarot_korean=tarot_korean,
+                tarot_english=tarot_english,
+                tarot_meaning=tarot_meaning,
+                season=_MONTH_SEASONS[month - 1],
+                month_day_digit_sum=sum(int(d) for d in f"{month:02d}{day:02d}")
+            ))
+    return tuple(table)
+
+
+# 일 순번(0~365)별 속성 표
+DAY_TABLE = _build_day_table()
+
+# 생일 숫자 합 -> 생명수 (연도 4자리 + MMDD 합은 최대 36+22)
+_LIFE_PATH = tuple(_reduce_life_path(n) for n in range(64))
+
+
+def day_of_year_index(month: int, day: int) -> int:
+    """윤년 기준 일 순번 (1월 1일 = 0, 2월 29일 = 59, 12월 31일 = 365)"""
+    if not 1 <= month <= 12 or not 1 <= day <= _MONTH_DAYS[month - 1]:
+        raise ValueError(f"잘못된 날짜입니다: {month}월 {day}일")
+    return _MONTH_OFFSETS[month - 1] + day - 1
+
+
+def lookup(month: int, day: int) -> DayAttributes:
+    """월/일의 별자리, 타로, 계절 속성 조회"""
+    return DAY_TABLE[day_of_year_index(month, day)]
+
+
+def life_path(year: int, month: int, day: int) -> Tuple[int, int]:
+    """
+    생명수 계산
+
+    Returns:
+        (생명수, 생일 숫자 합)
+    """
+    birth_sum = sum(int(d) for d in str(year)) + lookup(month, day).month_day_digit_sum
+    if birth_sum < len(_LIFE_PATH):
+        return _LIFE_PATH[birth_sum], birth_sum
+    return _reduce_life_path(birth_sum), birth_sum
+
+
+def _legacy_zodiac(month: int, day: int) -> str:
+    """기존 추천 모듈의 별자리 판정 (교차 검증용)"""
+    if (month == 1 and day >= 20) or (month == 2 and day < 19):
+        return '물병자리'
+    elif (month == 2 and day >= 19) or (month == 3 and day < 21):
+        return '물고기자리'
+    elif (month == 3 and day >= 21) or (month == 4 and day < 20):
+        return '양자리'
+    elif (month == 4 and day >= 20) or (month == 5 and day < 21):
+        return '황소자리'
+    elif (month == 5 and day >= 21) or (month == 6 and day < 21):
+        return '쌍둥이자리'
+    elif (month == 6 and day >= 21) or (month == 7 and day < 23):
+        return '게자리'
+    elif (month == 7 and day >= 23) or (month == 8 and day < 23):
+        return '사자자리'
+    elif (month == 8 and day >= 23) or (month == 9 and day < 23):
+        return '처녀자리'
+    elif (month == 9 and day >= 23) or (month == 10 and day < 23):
+        return '천칭자리'
+    elif (month == 10 and day >= 23) or (month == 11 and day < 22):
+        return '전갈자리'
+    elif (month == 11 and day >= 22) or (month == 12 and day < 22):
+        return '사수자리'
+    else:
+        return '염소자리'
+
+
+def _legacy_season(month: int) -> str:
+    """기존 계절 판정 (교차 검증용)"""
+    if month in [12, 1, 2]:
+        return '겨울'
+    elif month in [3, 4, 5]:
+        return '봄'
+    elif month in [6, 7, 8]:
+        return '여름'
+    return '가을'
+
+
+def _legacy_life_path(year: int, month: int, day: int) -> Tuple[int, int]:
+    """기존 생명수 계산 (교차 검증용)"""
+    birth_sum = sum(int(d) for d in f"{year}{month:02d}{day:02d}")
+    number = birth_sum
+    while number > 9 and number not in [11, 22, 33]:
+        number = sum(int(d) for d in str(number))
+    return number, birth_sum
+
+
+if __name__ == '__main__':
+    # 교차 검증: 366일 모두 기존 계산과 같은 결과인지 확인
+    import time
+    from datetime import date, timedelta
+
+    assert len(DAY_TABLE) == 366
+    for index, attrs in enumerate(DAY_TABLE):
+        month, day = attrs.month, attrs.day
+        assert day_of_year_index(month, day) == index
+        assert attrs.zodiac_korean == _legacy_zodiac(month, day), (month, day)
+        assert attrs.tarot_number == (((month + day) % 22) or 22)
+        assert attrs.season == _legacy_season(month)
+
+    # 생명수는 연도에도 의존하므로 1900~2100년 모든 날짜 확인
+    current, checked = date(1900, 1, 1), 0
+    while current <= date(2100, 12, 31):
+        assert life_path(current.year, current.month, current.day) == \
+            _legacy_life_path(current.year, current.month, current.day), current
+        current += timedelta(days=1)
+        checked += 1
+
+    start = time.perf_counter()
+    for _ in range(100):
+        for attrs in DAY_TABLE:
+            lookup(attrs.month, attrs.day)
+    elapsed = time.perf_counter() - start
+    print(f"교차 검증 통과: 366일, 생명수 {checked}일 / 조회 평균 {elapsed / 36600 * 1e6:.2f}us")
@@ -3,54 +3,19 @@
 생년월일을 분석하여 별자리, 타로, 생일 특성 등을 제공하는 모듈
 """
 from datetime import datetime
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 import calendar
 
+import astro_attributes
+
 
 class BirthdayAnalyzer:
     """생년월일 분석 클래스"""
     
-    # 별자리 정보 (양력 기준)
-    ZODIAC_SIGNS = {
-        (1, 20): ('물병자리', 'Aquarius'),
-        (2, 19): ('물고기자리', 'Pisces'),
-        (3, 21): ('양자리', 'Aries'),
-        (4, 20): ('황소자리', 'Taurus'),
-        (5, 21): ('쌍둥이자리', 'Gemini'),
-        (6, 21): ('게자리', 'Cancer'),
-        (7, 23): ('사자자리', 'Leo'),
-        (8, 23): ('처녀자리', 'Virgo'),
-        (9, 23): ('천칭자리', 'Libra'),
-        (10, 23): ('전갈자리', 'Scorpio'),
-        (11, 22): ('사수자리', 'Sagittarius'),
-        (12, 22): ('염소자리', 'Capricorn'),
-    }
-    
-    # 타로 카드 (생일 숫자 기반)
-    TAROT_CARDS = {
-        1: ('마법사', 'The Magician', '새로운 시작, 의지력, 창조력'),
-        2: ('여교황', 'The High Priestess', '직관, 내면의 지혜, 신비'),
-        3: ('여황제', 'The Empress', '풍요, 창조성, 자연'),
-        4: ('황제', 'The Emperor', '권위, 안정, 구조'),
-        5: ('교황', 'The Hierophant', '전통, 가르침, 영성'),
-        6: ('연인', 'The Lovers', '사랑, 선택, 조화'),
-        7: ('전차', 'The Chariot', '의지, 승리, 통제'),
-        8: ('힘', 'Strength', '인내, 용기, 내적 힘'),
-        9: ('은둔자', 'The Hermit', '성찰, 지혜, 내적 탐구'),
-        10: ('운명의 바퀴', 'Wheel of Fortune', '변화, 운명, 순환'),
-        11: ('정의', 'Justice', '공정, 균형, 책임'),
-        12: ('매달린 사람', 'The Hanged Man', '희생, 새로운 관점, 인내'),
-        13: ('죽음', 'Death', '변화, 종료, 재생'),
-        14: ('절제', 'Temperance', '균형, 조화, 인내'),
-        15: ('악마', 'The Devil', '유혹, 속박, 해방'),
-        16: ('탑', 'The Tower', '변화, 붕괴, 각성'),
-        17: ('별', 'The Star', '희망, 영감, 치유'),
-        18: ('달', 'The Moon', '직관, 환상, 잠재의식'),
-        19: ('태양', 'The Sun', '기쁨, 성공, 활력'),
-        20: ('심판', 'Judgement', '재생, 용서, 각성'),
-        21: ('세계', 'The World', '완성, 성취, 여행'),
-        22: ('바보', 'The Fool', '새로운 시작, 순수, 모험'),
-    }
+    # 별자리/타로 정보 (공용 표와 같은 데이터)
+    ZODIAC_SIGNS = astro_attributes.ZODIAC_SIGNS
+    TAROT_CARDS = astro_attributes.TAROT_CARDS
     
     def __init__(self, birth_date: str):
         """
@@ -67,63 +32,23 @@ class BirthdayAnalyzer:
         self.day = self.birth_date.day
     
     def get_zodiac_sign(self) -> Dict[str, str]:
-        """별자리 정보 반환"""
-        month_day = (self.month, self.day)
-        
-        # 별자리 경계일 처리
-        for (m, d), (korean, english) in self.ZODIAC_SIGNS.items():
-            if month_day < (m, d):
-                # 이전 별자리 반환
-                prev_month = m - 1 if m > 1 else 12
-                prev_day = 31 if prev_month == 12 else calendar.monthrange(self.year, prev_month)[1]
-                for (pm, pd), (pk, pe) in self.ZODIAC_SIGNS.items():
-                    if (prev_month, prev_day) >= (pm, pd):
-                        return {
-                            'korean': pk,
-                            'english': pe,
-                            'month': prev_month,
-                            'day': prev_day
-                        }
-        
-        # 12월 말 ~ 1월 초 처리 (염소자리)
-        if self.month == 12 and self.day >= 22:
-            return {
-                'korean': '염소자리',
-                'english': 'Capricorn',
-                'month': 12,
-                'day': 22
-            }
-        elif self.month == 1 and self.day < 20:
-            return {
-                'korean': '염소자리',
-                'english': 'Capricorn',
-                'month': 12,
-                'day': 22
-            }
-        
-        # 기본값 (물병자리)
+        """별자리 정보 반환 (month/day는 별자리 시작일)"""
+        astro = astro_attributes.lookup(self.month, self.day)
         return {
-            'korean': '물병자리',
-            'english': 'Aquarius',
-            'month': 1,
-            'day': 20
+            'korean': astro.zodiac_korean,
+            'english': astro.zodiac_english,
+            'month': astro.zodiac_month,
+            'day': astro.zodiac_day
         }
     
     def get_tarot_card(self) -> Dict[str, str]:
         """생일 숫자 기반 타로 카드 반환"""
-        # 생일 숫자를 1-22 범위로 변환
-        birth_number = ((self.month + self.day) % 22) or 22
-        
-        korean, english, meaning = self.TAROT_CARDS.get(
-            birth_number,
-            ('바보', 'The Fool', '새로운 시작, 순수, 모험')
-        )
-        
+        astro = astro_attributes.lookup(self.month, self.day)
         return {
-            'korean': korean,
-            'english': english,
-            'meaning': meaning,
-            'birth_number': birth_number
+            'korean': astro.tarot_korean,
+            'english': astro.tarot_english,
+            'meaning': astro.tarot_meaning,
+            'birth_number': astro.tarot_number
         }
     
     def get_birthday_characteristics(self) -> Dict:
@@ -134,45 +59,61 @@ class BirthdayAnalyzer:
             self.birth_date.weekday()
         ]
         
-        # 계절
-        if self.month in [12, 1, 2]:
-            season = '겨울'
-        elif self.month in [3, 4, 5]:
-            season = '봄'
-        elif self.month in [6, 7, 8]:
-            season = '여름'
-        else:
-            season = '가을'
-        
-        # 생일 숫자 합
-        birth_sum = sum(int(d) for d in f"{self.year}{self.month:02d}{self.day:02d}")
-        life_path_number = birth_sum
-        while life_path_number > 9 and life_path_number not in [11, 22, 33]:
-            life_path_number = sum(int(d) for d in str(life_path_number))
+        # 생일 숫자 합과 생명수
+        life_path_number, birth_sum = astro_attributes.life_path(self.year, self.month, self.day)
         
         return {
             'weekday': weekday,
             'weekday_korean': weekday_korean,
-            'season': season,
+            'season': astro_attributes.lookup(self.month, self.day).season,
             'life_path_number': life_path_number,
             'birth_sum': birth_sum
         }
     
     def analyze(self) -> Dict:
         """전체 분석 결과 반환"""
-        zodiac = self.get_zodiac_sign()
-        tarot = self.get_tarot_card()
-        characteristics = self.get_birthday_characteristics()
-        
+        return analyze_birth_date(self.birth_date.strftime('%Y-%m-%d'))
+    
+    def _analyze_static(self) -> Dict:
+        """날짜에 따라 변하지 않는 분석 결과 (나이 제외)"""
         return {
             'birth_date': self.birth_date.strftime('%Y-%m-%d'),
-            'age': (datetime.now() - self.birth_date).days // 365,
-            'zodiac': zodiac,
-            'tarot': tarot,
-            'characteristics': characteristics
+            'zodiac': self.get_zodiac_sign(),
+            'tarot': self.get_tarot_card(),
+            'characteristics': self.get_birthday_characteristics()
         }
 
 
+@lru_cache(maxsize=65536)
+def _cached_analysis(birth_date: str) -> Tuple[datetime, Dict]:
+    """
+    생년월일별 분석 결과 캐시 (나이처럼 오늘 날짜에 따라 바뀌는 값은 제외)
+    유효한 생년월일은 약 4만 개 수준이므로 사실상 전부 캐시됨
+    """
+    analyzer = BirthdayAnalyzer(birth_date)
+    return analyzer.birth_date, analyzer._analyze_static()
+
+
+def analyze_birth_date(birth_date: str) -> Dict:
+    """
+    생년월일 분석 (캐시 사용, 나이는 매번 계산)
+    
+    Args:
+        birth_date: 'YYYY-MM-DD' 형식의 생년월일
+    
+    Returns:
+        BirthdayAnalyzer.analyze()와 같은 형식의 분석 결과 (호출자가 수정해도 캐시는 그대로)
+    """
+    birth_dt, static = _cached_analysis(birth_date)
+    return {
+        'birth_date': static['birth_date'],
+        'age': (datetime.now() - birth_dt).days // 365,
+        'zodiac': dict(static['zodiac']),
+        'tarot': dict(static['tarot']),
+        'characteristics': dict(static['characteristics'])
+    }
+
+
 if __name__ == '__main__':
     # 테스트
     analyzer = BirthdayAnalyzer('1990-05-15')
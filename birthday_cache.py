@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+사용자별 생년월일 캐시 모듈
+저장소 앞단의 LRU 캐시로, 저장 시 write-through 하고
+조회 시에는 저장소 버전(JSON 파일은 mtime)만 확인하여 다른 워커의 변경도 반영
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from storage_backend import StorageBackend
+
+
+class BirthdayCache:
+    """LRU + 버전 검증 기반 생년월일 캐시"""
+
+    def __init__(self, backend: StorageBackend, max_size: int = 10000, ttl: float = 0.0):
+        """
+        Args:
+            backend: 저장소 백엔드
+            max_size: 최대 캐시 사용자 수 (초과 시 가장 오래 안 쓴 항목 제거)
+            ttl: 버전 확인 없이 캐시를 그대로 믿는 시간(초). 0이면 매 조회마다 버전 확인
+        """
+        self.backend = backend
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()  # user_id -> (birth_date, version, checked_at)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: str) -> Optional[str]:
+        """저장된 생년월일 반환 (없으면 None)"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None:
+                self._entries.move_to_end(user_id)
+
+        if entry is not None:
+            birth_date, version, checked_at = entry
+            # 생년월일이 있는 항목은 TTL 동안 버전 확인 생략
+            if birth_date is not None and now - checked_at < self.ttl:
+                self._count(hit=True)
+                return birth_date
+            # 버전이 같으면 파일을 다시 읽지 않음
+            if self.backend.birthday_version(user_id) == version:
+                self._store(user_id, birth_date, version, now)
+                self._count(hit=True)
+                return birth_date
+
+        self._count(hit=False)
+        version = self.backend.birthday_version(user_id)
+        record = self.backend.load_birthday(user_id)
+        birth_date = record.get('birth_date') if record else None
+        self._store(user_id, birth_date, version, now)
+        return birth_date
+
+    def set(self, user_id: str, record: Dict):
+        """생년월일 저장 (저장소에 쓰고 캐시도 갱신)"""
+        self.backend.save_birthday(user_id, record)
+        self._store(user_id, record.get('birth_date'), self.backend.birthday_version(user_id), time.monotonic())
+
+    def stats(self) -> Dict:
+        """캐시 적중/실패 통계"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / total, 4) if total else 0.0
+            }
+
+    def _store(self, user_id: str, birth_date: Optional[str], version, checked_at: float):
+        with self._lock:
+            self._entries[user_id] = (birth_date, version, checked_at)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def _count(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
@@ -2,10 +2,11 @@
 """
 생년월일 기반 오늘의 컬러 추천 모듈
 """
-import hashlib
 from datetime import datetime
 import pytz
 from typing import Dict, Optional, Tuple
+from seeded_random import seed_to_int
+import astro_attributes
 
 # 한국시간대 설정
 KST = pytz.timezone('Asia/Seoul')
@@ -107,28 +108,26 @@ class ColorSuggester:
         
         # 날짜와 생년월일을 조합하여 시드 생성
         seed_str = f"{date_str}_{birth_date}_color"
-        seed_hash = int(hashlib.md5(seed_str.encode()).hexdigest(), 16)
+        seed_hash = seed_to_int(seed_str)
         
-        # 생년월일에서 정보 추출
         birth_dt = datetime.strptime(birth_date, '%Y-%m-%d')
-        month = birth_dt.month
-        
-        # 계절 결정
-        if month in [12, 1, 2]:
-            season = '겨울'
-        elif month in [3, 4, 5]:
-            season = '봄'
-        elif month in [6, 7, 8]:
-            season = '여름'
-        else:
-            season = '가을'
-        
-        # 별자리 결정 (간단한 버전)
-        zodiac_korean = self._get_zodiac_from_month_day(month, birth_dt.day)
+        return self.color_from_seed(birth_dt, seed_hash, birth_date, date_str)
+    
+    def color_from_seed(self, birth_dt: datetime, seed_hash: int, birth_date: str, date_str: str) -> Dict:
+        """
+        이미 파싱한 생년월일과 시드로 컬러 추천 (DailyBundle에서 사용)
         
-        # 타로 카드 결정 (생일 숫자 기반)
-        tarot_number = ((month + birth_dt.day) % 22) or 22
-        tarot_name = self._get_tarot_name(tarot_number)
+        Args:
+            birth_dt: 파싱된 생년월일
+            seed_hash: 컬러 선택 시드 (정수)
+            birth_date: 생년월일 문자열 (응답용)
+            date_str: 날짜 (YYYY-MM-DD)
+        """
+        # 계절, 별자리, 타로 카드 (생일 숫자 기반)
+        astro = astro_attributes.lookup(birth_dt.month, birth_dt.day)
+        season = astro.season
+        zodiac_korean = astro.zodiac_korean
+        tarot_name = astro.tarot_korean
         
         # 컬러 선택 소스 결정 (시드 기반)
         source_type = seed_hash % 3  # 0: 별자리, 1: 계절, 2: 타로
@@ -159,42 +158,6 @@ class ColorSuggester:
         
         return color
     
-    def _get_zodiac_from_month_day(self, month: int, day: int) -> str:
-        """월과 일로 별자리 결정"""
-        if (month == 1 and day >= 20) or (month == 2 and day < 19):
-            return '물병자리'
-        elif (month == 2 and day >= 19) or (month == 3 and day < 21):
-            return '물고기자리'
-        elif (month == 3 and day >= 21) or (month == 4 and day < 20):
-            return '양자리'
-        elif (month == 4 and day >= 20) or (month == 5 and day < 21):
-            return '황소자리'
-        elif (month == 5 and day >= 21) or (month == 6 and day < 21):
-            return '쌍둥이자리'
-        elif (month == 6 and day >= 21) or (month == 7 and day < 23):
-            return '게자리'
-        elif (month == 7 and day >= 23) or (month == 8 and day < 23):
-            return '사자자리'
-        elif (month == 8 and day >= 23) or (month == 9 and day < 23):
-            return '처녀자리'
-        elif (month == 9 and day >= 23) or (month == 10 and day < 23):
-            return '천칭자리'
-        elif (month == 10 and day >= 23) or (month == 11 and day < 22):
-            return '전갈자리'
-        elif (month == 11 and day >= 22) or (month == 12 and day < 22):
-            return '사수자리'
-        else:
-            return '염소자리'
-    
-    def _get_tarot_name(self, number: int) -> str:
-        """타로 카드 번호로 이름 반환"""
-        tarot_names = [
-            '마법사', '여교황', '여황제', '황제', '교황', '연인', '전차', '힘', '은둔자',
-            '운명의 바퀴', '정의', '매달린 사람', '죽음', '절제', '악마', '탑', '별', '달',
-            '태양', '심판', '세계', '바보'
-        ]
-        return tarot_names[number - 1] if 1 <= number <= 22 else '바보'
-    
     def _get_color_meaning(self, color_name: str) -> str:
         """컬러 의미 반환"""
         meanings = {
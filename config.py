@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+설정 모듈
+환경 변수에서 앱 설정을 읽어 검증하고, 실행 환경(APP_ENV)별 기본값을 적용.
+
+- development: 템플릿 자동 리로드, 정적 파일 캐시 없음, 디버그 모드 (python app.py)
+- production: 템플릿을 시작 시 컴파일하여 캐시(파일 변경 확인 없음), 정적 파일 캐시, 디버그 끔 (gunicorn)
+
+사용 예:
+    settings = load_settings()
+    print(settings.report())
+"""
+import os
+from typing import Dict, List, Mapping, NamedTuple, Optional
+
+DEVELOPMENT = 'development'
+PRODUCTION = 'production'
+
+# 실행 환경별 기본값 (환경 변수로 개별 항목을 바꿀 수 있음)
+PROFILES = {
+    DEVELOPMENT: {'debug': True, 'templates_auto_reload': True, 'send_file_max_age': 0,
+                  'precompile_templates': False},
+    PRODUCTION: {'debug': False, 'templates_auto_reload': False, 'send_file_max_age': 3600,
+                 'precompile_templates': True},
+}
+
+# 운영 환경에서 바꿔야 하는 기본 비밀 값
+_DEFAULT_SECRET = 'life-quotes'
+
+_TRUE = ('1', 'true', 'yes', 'on')
+_FALSE = ('0', 'false', 'no', 'off')
+
+
+class ConfigError(ValueError):
+    """환경 변수 설정 오류 (시작 시 모든 오류를 한 번에 보고)"""
+
+
+class Settings(NamedTuple):
+    """검증된 앱 설정"""
+    profile: str
+    debug: bool
+    templates_auto_reload: bool
+    send_file_max_age: int  # 해시 이름이 없는 정적 파일(/static) 캐시 시간(초)
+    precompile_templates: bool
+    port: int
+
+    storage_backend: str
+    sqlite_path: Optional[str]
+    response_cache: str
+    response_cache_path: Optional[str]
+    short_code_secret: str
+    daily_seed_secret: str
+    daily_bundle_compat: bool
+
+    request_deadline: float
+    daily_table: bool
+    daily_fanout: str
+    shopping_catalog: bool
+    shopping_snapshot_max_age: float
+    naver_client_id: str
+    naver_client_secret: str
+
+    asset_pipeline: bool
+    prerender_index: bool
+    og_image_max_age: int
+    og_card_max_concurrent: int
+
+    def warnings(self) -> List[str]:
+        """운영 환경에서 확인이 필요한 설정"""
+        warnings = []
+        if self.profile == PRODUCTION:
+            if self.debug:
+                warnings.append('운영 환경에서 디버그 모드가 켜져 있습니다')
+            for name, value in (('SHORT_CODE_SECRET', self.short_code_secret),
+                                ('DAILY_SEED_SECRET', self.daily_seed_secret)):
+                if value == _DEFAULT_SECRET:
+                    warnings.append(f'{name}가 기본값입니다')
+        return warnings
+
+    def report(self) -> str:
+        """시작 시 출력할 성능 관련 유효 설정 (비밀 값 제외)"""
+        lines = [
+            f"설정 프로필: {self.profile}",
+            f"  디버그: {self.debug}, 템플릿 자동 리로드: {self.templates_auto_reload}, "
+            f"템플릿 사전 컴파일: {self.precompile_templates}",
+            f"  정적 파일 캐시: {self.send_file_max_age}초, 자산 빌드(/assets): {self.asset_pipeline}, "
+            f"메인 페이지 서버 렌더링: {self.prerender_index}",
+            f"  저장소: {self.storage_backend}, 응답 캐시: {self.response_cache}",
+            f"  요청 기한: {self.request_deadline}초, 추천 표: {self.daily_table}, /api/daily 실행: {self.daily_fanout}",
+            f"  쇼핑 스냅숏: {self.shopping_catalog} (갱신 주기 {self.shopping_snapshot_max_age:.0f}초)",
+            f"  OG 이미지 캐시: {self.og_image_max_age}초, OG 카드 동시 렌더링: {self.og_card_max_concurrent}",
+        ]
+        lines.extend(f"  경고: {warning}" for warning in self.warnings())
+        return '\n'.join(lines)
+
+
+def load_settings(environ: Optional[Mapping[str, str]] = None, default_profile: str = PRODUCTION) -> Settings:
+    """
+    환경 변수에서 설정 읽기
+
+    Args:
+        environ: 환경 변수 (None이면 os.environ)
+        default_profile: APP_ENV가 없을 때의 실행 환경
+
+    Raises:
+        ConfigError: 값이 잘못된 환경 변수가 있을 때 (모든 오류를 모아서)
+    """
+    environ = os.environ if environ is None else environ
+    errors: List[str] = []
+
+    def choice(name: str, default: str, choices) -> str:
+        value = environ.get(name, default).strip().lower()
+        if value not in choices:
+            errors.append(f"{name}={value!r} (가능한 값: {', '.join(choices)})")
+            return default
+        return value
+
+    profile = choice('APP_ENV', default_profile, tuple(PROFILES))
+    defaults: Dict = PROFILES[profile]
+
+    def flag(name: str, default: bool) -> bool:
+        value = environ.get(name)
+        if value is None or value.strip() == '':
+            return default
+        value = value.strip().lower()
+        if value in _TRUE:
+            return True
+        if value in _FALSE:
+            return False
+        errors.append(f"{name}={value!r} (0 또는 1)")
+        return default
+
+    def number(name: str, default, cast=float, minimum=0):
+        value = environ.get(name)
+        if value is None or value.strip() == '':
+            return default
+        try:
+            parsed = cast(value)
+        except ValueError:
+            errors.append(f"{name}={value!r} (숫자)")
+            return default
+        if parsed < minimum:
+            errors.append(f"{name}={value!r} ({minimum} 이상)")
+            return default
+        return parsed
+
+    def text(name: str, default: Optional[str] = None) -> Optional[str]:
+        value = environ.get(name)
+        return value if value else default
+
+    settings = Settings(
+        profile=profile,
+        # FLASK_DEBUG는 이전 배포 설정(render.yaml)과의 호환용
+        debug=flag('APP_DEBUG', flag('FLASK_DEBUG', defaults['debug'])),
+        templates_auto_reload=flag('TEMPLATES_AUTO_RELOAD', defaults['templates_auto_reload']),
+        send_file_max_age=number('STATIC_MAX_AGE', defaults['send_file_max_age'], int),
+        precompile_templates=defaults['precompile_templates'],
+        port=number('PORT', 5003, int, minimum=1),
+
+        storage_backend=choice('STORAGE_BACKEND', 'json', ('json', 'sqlite')),
+        sqlite_path=text('SQLITE_PATH'),
+        response_cache=choice('RESPONSE_CACHE', 'memory', ('memory', 'sqlite')),
+        response_cache_path=text('RESPONSE_CACHE_PATH'),
+        short_code_secret=text('SHORT_CODE_SECRET', _DEFAULT_SECRET),
+        daily_seed_secret=text('DAILY_SEED_SECRET', _DEFAULT_SECRET),
+        daily_bundle_compat=flag('DAILY_BUNDLE_COMPAT', False),
+
+        request_deadline=number('REQUEST_DEADLINE', 3.0, minimum=0.1),
+        daily_table=flag('DAILY_TABLE', True),
+        daily_fanout=choice('DAILY_FANOUT', 'sequential', ('sequential', 'concurrent')),
+        shopping_catalog=flag('SHOPPING_CATALOG', True),
+        shopping_snapshot_max_age=number('SHOPPING_SNAPSHOT_MAX_AGE', 6 * 3600.0, minimum=60),
+        naver_client_id=text('NAVER_CLIENT_ID', '6uQXc6h4TnSMVS_h5ooY'),
+        naver_client_secret=text('NAVER_CLIENT_SECRET', 'zBXyXbIxN4'),
+
+        asset_pipeline=flag('ASSET_PIPELINE', True),
+        prerender_index=flag('PRERENDER_INDEX', False),
+        og_image_max_age=number('OG_IMAGE_MAX_AGE', 86400, int),
+        og_card_max_concurrent=number('OG_CARD_MAX_CONCURRENT', 2, int, minimum=1),
+    )
+    # 자동 리로드를 켜면 템플릿을 미리 컴파일해도 요청마다 파일을 확인하므로 의미 없음
+    if settings.templates_auto_reload:
+        settings = settings._replace(precompile_templates=False)
+
+    if errors:
+        raise ConfigError('환경 변수 설정 오류: ' + '; '.join(errors))
+    return settings
+
+
+if __name__ == '__main__':
+    # 현재 환경 변수의 유효 설정 출력 / 검증 확인
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == 'check':
+        dev = load_settings({}, default_profile=DEVELOPMENT)
+        assert dev.debug and dev.templates_auto_reload and dev.send_file_max_age == 0
+        prod = load_settings({'FLASK_DEBUG': '0'})
+        assert not prod.debug and not prod.templates_auto_reload and prod.precompile_templates
+        assert prod.warnings() == ['SHORT_CODE_SECRET가 기본값입니다', 'DAILY_SEED_SECRET가 기본값입니다']
+        assert not load_settings({'APP_ENV': 'production', 'TEMPLATES_AUTO_RELOAD': '1'}).precompile_templates
+        try:
+            load_settings({'STORAGE_BACKEND': 'mysql', 'REQUEST_DEADLINE': 'soon', 'DAILY_TABLE': 'maybe'})
+            raise AssertionError('ConfigError 예상')
+        except ConfigError as e:
+            assert 'STORAGE_BACKEND' in str(e) and 'REQUEST_DEADLINE' in str(e) and 'DAILY_TABLE' in str(e)
+            print(e)
+        print("검증 통과")
+    else:
+        print(load_settings().report())
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+오늘의 추천 묶음 계산 모듈
+생년월일을 한 번만 파싱하고 (날짜, 생년월일)당 키 기반 다이제스트를 한 번만 계산한 뒤,
+다이제스트를 카테고리별 독립 시드로 나누어 컬러/한잔/꽃/인사말/쇼핑 추천을 함께 계산
+"""
+import hashlib
+from datetime import datetime
+from typing import Dict, Optional
+
+import pytz
+
+from color_suggester import ColorSuggester
+from drink_suggester import DrinkSuggester
+from flower_suggester import FlowerSuggester
+from greeting_suggester import GreetingSuggester
+from seeded_random import seed_to_int
+from shopping_suggester import ShoppingSuggester
+
+# 한국시간대 설정
+KST = pytz.timezone('Asia/Seoul')
+
+def get_kst_now():
+    """한국시간(KST) 기준 현재 시간 반환"""
+    return datetime.now(KST)
+
+
+class DailyBundle:
+    """(날짜, 생년월일) 단위로 다섯 가지 추천을 한 번에 계산하는 클래스"""
+
+    # 카테고리 순서 = 다이제스트 분할 순서 (바꾸면 모든 추천이 바뀜)
+    CATEGORIES = ('color', 'drink', 'flower', 'greeting', 'shopping')
+
+    # 카테고리별 시드 크기 (96비트, 5개 합 60바이트 <= blake2b 최대 64바이트)
+    SEED_BYTES = 12
+
+    def __init__(self, color_suggester: ColorSuggester, drink_suggester: DrinkSuggester,
+                 flower_suggester: FlowerSuggester, greeting_suggester: GreetingSuggester,
+                 shopping_suggester: ShoppingSuggester, secret: bytes = b'life-quotes',
+                 compatible: bool = False):
+        """
+        Args:
+            color_suggester ~ shopping_suggester: 추천 모듈 인스턴스
+            secret: 다이제스트 키 (같은 키면 같은 날짜/생년월일에 항상 같은 추천)
+            compatible: True면 기존 카테고리별 MD5 시드를 그대로 사용하여
+                        개별 suggest_*() 호출과 완전히 같은 결과를 반환
+        """
+        self.color_suggester = color_suggester
+        self.drink_suggester = drink_suggester
+        self.flower_suggester = flower_suggester
+        self.greeting_suggester = greeting_suggester
+        self.shopping_suggester = shopping_suggester
+        # blake2b 키는 최대 64바이트
+        self.key = hashlib.blake2b(secret, digest_size=32).digest()
+        self.compatible = compatible
+
+    def seeds(self, birth_date: str, date_str: str) -> Dict[str, int]:
+        """카테고리별 선택 시드 계산"""
+        if self.compatible:
+            # 기존 방식: 카테고리마다 별도 시드 문자열의 MD5
+            return {
+                category: seed_to_int(f"{date_str}_{birth_date}_{category}")
+                for category in self.CATEGORIES
+            }
+
+        # 다이제스트 한 번을 카테고리별 구간으로 분할
+        digest = hashlib.blake2b(
+            f"{date_str}_{birth_date}".encode(),
+            key=self.key,
+            digest_size=self.SEED_BYTES * len(self.CATEGORIES)
+        ).digest()
+        return {
+            category: int.from_bytes(digest[i * self.SEED_BYTES:(i + 1) * self.SEED_BYTES], 'big')
+            for i, category in enumerate(self.CATEGORIES)
+        }
+
+    def compute(self, birth_date: str, date_str: Optional[str] = None) -> Dict:
+        """
+        오늘의 추천 묶음 계산
+
+        Args:
+            birth_date: 생년월일 (YYYY-MM-DD)
+            date_str: 날짜 (YYYY-MM-DD), None이면 오늘 날짜
+
+        Returns:
+            {
+                'date', 'birth_date',
+                'color': 컬러 정보 딕셔너리 (날짜 기반 고정),
+                'drink' / 'flower' / 'greeting': 우선순위 순서의 후보 이터레이터,
+                'shopping': 검색어 후보 이터레이터 (build_item()으로 상품 정보 구성)
+            }
+            이터레이터의 첫 번째 후보가 해당 카테고리의 오늘의 추천
+        """
+        if date_str is None:
+            date_str = get_kst_now().strftime('%Y-%m-%d')
+
+        # 생년월일은 한 번만 파싱 (형식 검증 포함)
+        birth_dt = datetime.strptime(birth_date, '%Y-%m-%d')
+        seeds = self.seeds(birth_date, date_str)
+
+        return {
+            'date': date_str,
+            'birth_date': birth_date,
+            'color': self.color_suggester.color_from_seed(birth_dt, seeds['color'], birth_date, date_str),
+            'drink': self.drink_suggester.iter_from_seed(birth_dt, seeds['drink'], birth_date, date_str),
+            'flower': self.flower_suggester.iter_from_seed(birth_dt, seeds['flower'], birth_date, date_str),
+            'greeting': self.greeting_suggester.iter_from_seed(birth_dt, seeds['greeting'], birth_date, date_str),
+            'shopping': self.shopping_suggester.iter_from_seed(seeds['shopping'])
+        }
+
+    def recommend(self, birth_date: str, date_str: Optional[str] = None) -> Dict:
+        """
+        히스토리 없이 카테고리별 첫 번째 추천만 반환
+
+        Returns:
+            {'color', 'drink', 'flower', 'greeting', 'shopping_items'} 딕셔너리
+        """
+        bundle = self.compute(birth_date, date_str)
+        return {
+            'color': bundle['color'],
+            'drink': next(bundle['drink']),
+            'flower': next(bundle['flower']),
+            'greeting': next(bundle['greeting']),
+            'shopping_items': [self.shopping_suggester.build_item(next(bundle['shopping']), bundle['date'])]
+        }
+
+
+if __name__ == '__main__':
+    # 호환 모드 검증 및 벤치마크: 개별 suggest_*() 다섯 번 vs 묶음 계산 한 번
+    import time
+    from datetime import date, timedelta
+
+    suggesters = (ColorSuggester(), DrinkSuggester(), FlowerSuggester(), GreetingSuggester(), ShoppingSuggester())
+    color, drink, flower, greeting, shopping = suggesters
+    compatible_bundle = DailyBundle(*suggesters, compatible=True)
+    bundle = DailyBundle(*suggesters)
+
+    birth_dates = [(date(1950, 1, 1) + timedelta(days=i * 7)).isoformat() for i in range(3000)]
+    date_str = '2025-06-15'
+
+    def first_candidates(result):
+        return (
+            result['color'], next(result['drink']), next(result['flower']),
+            next(result['greeting']), next(result['shopping'])
+        )
+
+    # 호환 모드는 기존 개별 호출과 완전히 같아야 함
+    for birth_date in birth_dates:
+        expected = (
+            color.suggest_color(birth_date, date_str), drink.suggest_drink(birth_date, date_str),
+            flower.suggest_flower(birth_date, date_str), greeting.suggest_greeting(birth_date, date_str),
+            next(shopping.iter_candidates(birth_date, date_str))
+        )
+        assert first_candidates(compatible_bundle.compute(birth_date, date_str)) == expected, birth_date
+
+    def run_legacy():
+        for birth_date in birth_dates:
+            color.suggest_color(birth_date, date_str)
+            drink.suggest_drink(birth_date, date_str)
+            flower.suggest_flower(birth_date, date_str)
+            greeting.suggest_greeting(birth_date, date_str)
+            next(shopping.iter_candidates(birth_date, date_str))
+
+    def run_bundle(engine):
+        for birth_date in birth_dates:
+            first_candidates(engine.compute(birth_date, date_str))
+
+    for label, run in (('개별 호출', run_legacy),
+                       ('묶음 (호환 모드)', lambda: run_bundle(compatible_bundle)),
+                       ('묶음', lambda: run_bundle(bundle))):
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        print(f"{label}: 생년월일당 평균 {elapsed / len(birth_dates) * 1e6:.1f}us")
+
+    # 카테고리별 분포 확인 (시드 분할이 한쪽으로 치우치지 않는지)
+    drink_types = sum(next(bundle.compute(b, date_str)['drink'])['type'] == 'coffee' for b in birth_dates)
+    print(f"커피 비율: {drink_types / len(birth_dates):.3f} (기대값 약 0.5)")
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+"""
+오늘의 통합 응답(/api/daily) 구성 모듈
+명언/분석/컬러/한잔/꽃/인사말/쇼핑은 서로 독립이므로, 외부 API를 호출할 수 있는 항목
+(쇼핑)은 스레드 풀에서 동시에 실행하고 나머지(메모리 계산)는 요청 스레드에서 바로 처리.
+모든 항목은 요청 기한(resilience.deadline) 안에서만 기다리고, 기한을 넘긴 항목은 None으로
+두고 나머지 결과로 응답 구성
+
+조회 기록은 작업 스레드가 아닌 요청 스레드에서 항목 순서대로 한 번에 반영
+(순차 실행과 같은 히스토리가 저장됨)
+"""
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+import pytz
+
+from birthday_analyzer import analyze_birth_date
+from resilience import remaining
+
+# 한국시간대 설정
+KST = pytz.timezone('Asia/Seoul')
+
+def get_kst_now():
+    """한국시간(KST) 기준 현재 시간 반환"""
+    return datetime.now(KST)
+
+
+class QuoteUnavailableError(Exception):
+    """명언을 가져오지 못함 (명언은 응답의 필수 항목)"""
+
+
+class DailyComposer:
+    """/api/daily 응답 항목 계산 (순차 또는 동시 실행)"""
+
+    SEQUENTIAL = 'sequential'
+    CONCURRENT = 'concurrent'
+
+    # 응답 항목 순서 = 조회 기록 반영 순서
+    COMPONENTS = ('quote', 'analysis', 'color', 'drink', 'flower', 'greeting', 'shopping')
+
+    # 외부 API를 호출할 수 있어 스레드 풀에서 실행하는 항목
+    # (명언은 로컬 코퍼스/수집 저장소에서만 선택하므로 요청 스레드에서 계산)
+    IO_COMPONENTS = ('shopping',)
+
+    # 항목별 오류 로그 이름
+    LABELS = {
+        'quote': '명언 가져오기',
+        'analysis': '생년월일 분석',
+        'color': '컬러 추천',
+        'drink': '음료 추천',
+        'flower': '꽃 추천',
+        'greeting': '인사말 추천',
+        'shopping': '쇼핑 아이템 추천'
+    }
+
+    def __init__(self, quote_fetcher, daily_table, shopping_suggester, history_service,
+                 mode: str = SEQUENTIAL, max_workers: int = 16):
+        """
+        Args:
+            quote_fetcher: 명언 수집기
+            daily_table: 추천 사전 계산 표 (DailyTableStore, 또는 compute()가 있는 DailyBundle)
+            shopping_suggester: 쇼핑 추천 모듈 (build_item()으로 상품 정보 구성)
+            history_service: 히스토리 서비스 (중복 회피 선택)
+            mode: 'sequential'(기본) 또는 'concurrent'
+            max_workers: 동시 실행 스레드 수
+        """
+        if mode not in (self.SEQUENTIAL, self.CONCURRENT):
+            raise ValueError(f"지원하지 않는 실행 방식입니다: {mode} (sequential 또는 concurrent)")
+        self.quote_fetcher = quote_fetcher
+        self.daily_table = daily_table
+        self.shopping_suggester = shopping_suggester
+        self.history_service = history_service
+        self.mode = mode
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='daily') \
+            if mode == self.CONCURRENT else None
+
+    def compose(self, history, birth_date: str, date_str: str) -> Dict:
+        """
+        오늘의 응답 항목 계산 및 조회 기록 반영 (저장은 호출자가 history.flush())
+
+        Args:
+            history: 요청 단위 히스토리 세션 (HistorySession)
+            birth_date: 생년월일 (YYYY-MM-DD)
+            date_str: 날짜 (YYYY-MM-DD)
+
+        Returns:
+            {'quote', 'analysis', 'color', 'drink', 'flower', 'greeting', 'shopping_items', 'timed_out'}
+            실패하거나 기한을 넘긴 항목은 None (shopping_items는 빈 리스트),
+            timed_out은 기한을 넘긴 항목 이름 리스트
+
+        Raises:
+            QuoteUnavailableError: 명언을 가져오지 못했을 때
+        """
+        # 본 목록은 요청 스레드에서 미리 만들어 두고 작업 스레드는 읽기만 함
+        viewed = {component: history.viewed(component) for component in self.COMPONENTS
+                  if component not in ('analysis', 'color')}
+
+        # 추천 묶음 (사전 계산 표 조회, 표가 없으면 실시간 계산)
+        try:
+            bundle = self.daily_table.compute(birth_date, date_str=date_str)
+        except Exception as e:
+            print(f"추천 묶음 계산 오류: {e}")
+            bundle = None
+
+        tasks = {
+            'quote': lambda: self._quote(birth_date, date_str, viewed['quote']),
+            'analysis': lambda: (analyze_birth_date(birth_date), None),
+            # 컬러는 날짜 기반 고정이므로 조회 기록 없음
+            'color': lambda: (bundle['color'], None),
+            'drink': lambda: self._select(bundle['drink'], viewed['drink'], lambda d: d.get('name', '')),
+            'flower': lambda: self._select(bundle['flower'], viewed['flower'], lambda f: f.get('name', '')),
+            'greeting': lambda: self._select(bundle['greeting'], viewed['greeting'], self._text_hash),
+            'shopping': lambda: self._shopping(bundle['shopping'], viewed['shopping'], date_str)
+        }
+
+        if self.mode == self.CONCURRENT:
+            results, timed_out = self._run_concurrent(tasks)
+        else:
+            results, timed_out = {name: self._run(name, task) for name, task in tasks.items()}, []
+
+        quote = results['quote'][0]
+        if quote is None:
+            raise QuoteUnavailableError('요청 기한 초과' if 'quote' in timed_out else '명언 후보 계산 실패')
+
+        # 조회 기록은 항목 순서대로 요청 스레드에서 반영
+        for name in self.COMPONENTS:
+            value, content_id = results[name]
+            if value is not None and content_id is not None:
+                history.record_view(name, content_id)
+
+        shopping_item = results['shopping'][0]
+        return {
+            'quote': quote,
+            'analysis': results['analysis'][0],
+            'color': results['color'][0],
+            'drink': results['drink'][0],
+            'flower': results['flower'][0],
+            'greeting': results['greeting'][0],
+            'shopping_items': [shopping_item] if shopping_item else [],
+            'timed_out': timed_out
+        }
+
+    def _run(self, name: str, task: Callable[[], Tuple]) -> Tuple:
+        """항목 계산 (오류는 로그만 남기고 (None, None))"""
+        try:
+            return task()
+        except Exception as e:
+            print(f"{self.LABELS[name]} 오류: {e}")
+            return None, None
+
+    def _run_concurrent(self, tasks: Dict[str, Callable[[], Tuple]]) -> Tuple[Dict[str, Tuple], List[str]]:
+        """외부 API 항목은 스레드 풀에 넘기고, 나머지는 기다리는 동안 요청 스레드에서 계산"""
+        # 요청 기한이 작업 스레드의 외부 호출에도 적용되도록 컨텍스트 복사
+        futures = {
+            name: self._pool.submit(contextvars.copy_context().run, self._run, name, tasks[name])
+            for name in self.IO_COMPONENTS
+        }
+        results = {name: self._run(name, task) for name, task in tasks.items() if name not in futures}
+
+        timed_out = []
+        for name, future in futures.items():
+            left = remaining()
+            try:
+                results[name] = future.result(timeout=None if left is None else max(left, 0))
+            except FutureTimeoutError:
+                print(f"{self.LABELS[name]} 시간 초과")
+                timed_out.append(name)
+                results[name] = (None, None)
+        return results, timed_out
+
+    def _quote(self, birth_date: str, date_str: str, viewed: Set[str]) -> Tuple[Optional[Dict], Optional[str]]:
+        """날짜 기반 후보를 순서대로 확인하여 아직 보지 않은 명언 선택 (ID는 텍스트 해시)"""
+        return self.history_service.select_unviewed(
+            self.quote_fetcher.iter_candidates(birth_date=birth_date, date_str=date_str),
+            viewed,
+            self._text_hash
+        )
+
+    def _select(self, candidates, viewed: Set[str], get_id: Callable[[Dict], str]) -> Tuple:
+        return self.history_service.select_unviewed(candidates, viewed, get_id)
+
+    def _shopping(self, candidates, viewed: Set[str], date_str: str) -> Tuple[Optional[Dict], Optional[str]]:
+        """검색어 후보로 중복 확인 후, 선택된 하나만 상품 정보 조회"""
+        candidate, item_id = self.history_service.select_unviewed(
+            candidates,
+            viewed,
+            lambda c: self.history_service.get_content_hash(c.get('search_query', ''))
+        )
+        if candidate is None:
+            return None, None
+        return self.shopping_suggester.build_item(candidate, date_str=date_str), item_id
+
+    def _text_hash(self, item: Dict) -> str:
+        return self.history_service.get_content_hash(item.get('text', ''))
+
+
+if __name__ == '__main__':
+    # 벤치마크: 순차 실행 vs 동시 실행 p50/p99 (가짜 네이버 서버, 스냅숏 없이 API 직접 조회)
+    import argparse
+    import statistics
+    import tempfile
+    from color_suggester import ColorSuggester
+    from daily_bundle import DailyBundle
+    from drink_suggester import DrinkSuggester
+    from flower_suggester import FlowerSuggester
+    from greeting_suggester import GreetingSuggester
+    from naver_shopping_client import FakeNaverShoppingServer, NaverShoppingClient
+    from quote_fetcher import QuoteFetcher
+    from resilience import CircuitBreaker, deadline
+    from shopping_suggester import ShoppingSuggester
+    from user_history_service import UserHistoryService
+
+    parser = argparse.ArgumentParser(description='/api/daily 항목 계산 벤치마크')
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--latency', type=float, default=0.05, help='가짜 네이버 API 지연(초)')
+    parser.add_argument('--deadline', type=float, default=3.0, help='요청 기한(초)')
+    args = parser.parse_args()
+
+    def percentile(samples: List[float], p: float) -> float:
+        ordered = sorted(samples)
+        return ordered[min(int(len(ordered) * p), len(ordered) - 1)]
+
+    with FakeNaverShoppingServer(latency=args.latency) as server:
+        history_service = UserHistoryService(data_folder=tempfile.mkdtemp())
+        quote_fetcher = QuoteFetcher()
+        outputs = {}
+        modes = [(mode, latency) for latency in (0.0, args.latency)
+                 for mode in (DailyComposer.SEQUENTIAL, DailyComposer.CONCURRENT)]
+        for mode, latency in modes:
+            server.latency = latency
+            # 매 요청이 API를 호출하도록 검색 결과 캐시 끔
+            client = NaverShoppingClient('id', 'secret', api_url=server.url, cache_ttl=0, negative_ttl=0,
+                                         rate_per_second=10000,
+                                         breaker=CircuitBreaker(f'bench_{mode}_{latency}'))
+            shopping = ShoppingSuggester(client=client)
+            bundle = DailyBundle(ColorSuggester(), DrinkSuggester(), FlowerSuggester(), GreetingSuggester(),
+                                 shopping)
+            composer = DailyComposer(quote_fetcher, bundle, shopping, history_service, mode=mode)
+
+            latencies = []
+            outputs[mode] = []
+            for n in range(args.requests):
+                birth_date = f'19{50 + n % 50}-0{1 + n % 9}-1{n % 10}'
+                history = history_service.session(f'{mode}_{latency}_{n}')
+                start = time.perf_counter()
+                with deadline(args.deadline):
+                    result = composer.compose(history, birth_date, '2025-06-15')
+                latencies.append(time.perf_counter() - start)
+                outputs[mode].append((result, history.history))
+            print(f"API 지연 {latency * 1000:.0f}ms {mode:>10}: p50 {percentile(latencies, 0.5) * 1000:.1f}ms, "
+                  f"p99 {percentile(latencies, 0.99) * 1000:.1f}ms, 평균 {statistics.mean(latencies) * 1000:.1f}ms")
+
+        # 두 방식의 결과와 조회 기록은 같아야 함 (last_updated 제외)
+        for (a, history_a), (b, history_b) in zip(outputs[DailyComposer.SEQUENTIAL], outputs[DailyComposer.CONCURRENT]):
+            assert a == b
+            assert {k: v for k, v in history_a.items() if k != 'last_updated'} == \
+                {k: v for k, v in history_b.items() if k != 'last_updated'}
+
+        # 기한보다 느린 항목은 빼고 나머지로 응답
+        server.latency = 1.0
+        start = time.perf_counter()
+        history = history_service.session('slow')
+        with deadline(0.3):
+            result = composer.compose(history, '1990-05-15', '2025-06-15')
+        elapsed = time.perf_counter() - start
+        assert result['timed_out'] == ['shopping'] and result['shopping_items'] == [] and result['drink']
+        assert 'viewed_shoppings' not in history.history
+        print(f"기한 0.3초 / API 지연 1초: {elapsed * 1000:.0f}ms 만에 쇼핑 제외하고 응답")
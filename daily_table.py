@@ -0,0 +1,450 @@
+# -*- coding: utf-8 -*-
+"""
+날짜별 추천 사전 계산 표 모듈
+하루치 컬러/한잔/꽃/인사말/쇼핑 첫 번째 추천을 모든 생년월일에 대해 미리 계산하여
+메모리 맵 파일로 저장. 여러 gunicorn 워커가 같은 파일을 복사 없이 공유하며,
+/api/daily는 배열 한 번 조회로 추천을 얻고 표 범위 밖이면 실시간 계산으로 대체
+
+파일 구성 (data/daily_table/YYYY-MM-DD.bin):
+- MAGIC + 헤더 길이(uint32) + 헤더 JSON (날짜, 생년월일 범위, 카테고리별 추천 목록)
+- 생년월일 순번별 행: 카테고리 수 x uint16 (추천 목록 인덱스)
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Iterator, List, Optional
+
+import pytz
+
+from config import Settings, load_settings
+from daily_bundle import DailyBundle
+from json_storage import file_lock
+
+# 한국시간대 설정
+KST = pytz.timezone('Asia/Seoul')
+
+def get_kst_now():
+    """한국시간(KST) 기준 현재 시간 반환"""
+    return datetime.now(KST)
+
+
+MAGIC = b'LQDT1\n'
+HEADER_LENGTH = struct.Struct('<I')
+
+# 기본 생년월일 범위 (131년치, 약 4.8만 행)
+DEFAULT_START = date(1900, 1, 1)
+DEFAULT_END = date(2030, 12, 31)
+
+# 요청마다 달라지는 필드 (표에는 빼고 저장, 조회 시 다시 채움)
+VOLATILE_FIELDS = ('date', 'birth_date', 'time_of_day', 'time_message')
+
+
+def bundle_fingerprint(bundle: DailyBundle) -> str:
+    """시드 방식(키, 호환 모드) 식별값 (다른 설정으로 만든 표는 사용하지 않음)"""
+    return hashlib.blake2b(bundle.key + (b'compat' if bundle.compatible else b'keyed'), digest_size=8).hexdigest()
+
+
+class DailyTable:
+    """하루치 사전 계산 표 (읽기 전용 메모리 맵)"""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 표 파일 경로
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mm[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"사전 계산 표 형식이 아닙니다: {path}")
+        (header_length,) = HEADER_LENGTH.unpack_from(self._mm, len(MAGIC))
+        header_start = len(MAGIC) + HEADER_LENGTH.size
+        header = json.loads(self._mm[header_start:header_start + header_length].decode('utf-8'))
+
+        self.date = header['date']
+        self.fingerprint = header['fingerprint']
+        self.categories = header['categories']
+        self.start_ordinal = header['start_ordinal']
+        self.count = header['count']
+        self.vocab: Dict[str, List[Dict]] = header['vocab']
+        self._row = struct.Struct(f"<{len(self.categories)}H")
+        self._data_offset = header['data_offset']
+
+    def lookup(self, birth_ordinal: int) -> Optional[Dict[str, Dict]]:
+        """생년월일 순번(date.toordinal())으로 카테고리별 첫 번째 추천 조회 (범위 밖이면 None)"""
+        row = birth_ordinal - self.start_ordinal
+        if not 0 <= row < self.count:
+            return None
+        indexes = self._row.unpack_from(self._mm, self._data_offset + row * self._row.size)
+        return {
+            category: self.vocab[category][index]
+            for category, index in zip(self.categories, indexes)
+        }
+
+    def close(self):
+        self._mm.close()
+
+    @classmethod
+    def build(cls, bundle: DailyBundle, date_str: str, path: str,
+              start: date = DEFAULT_START, end: date = DEFAULT_END):
+        """
+        하루치 표 생성 (임시 파일에 쓴 뒤 교체하므로 읽는 워커는 항상 완전한 파일을 봄)
+
+        Args:
+            bundle: 추천 묶음 계산기
+            date_str: 날짜 (YYYY-MM-DD)
+            path: 저장 경로
+            start, end: 생년월일 범위 (양 끝 포함)
+        """
+        categories = list(DailyBundle.CATEGORIES)
+        vocab: Dict[str, List[Dict]] = {category: [] for category in categories}
+        vocab_index: Dict[str, Dict[str, int]] = {category: {} for category in categories}
+        rows = bytearray()
+        row_struct = struct.Struct(f"<{len(categories)}H")
+
+        start_ordinal, end_ordinal = start.toordinal(), end.toordinal()
+        for ordinal in range(start_ordinal, end_ordinal + 1):
+            birth_date = date.fromordinal(ordinal).isoformat()
+            result = bundle.compute(birth_date, date_str)
+            indexes = []
+            for category in categories:
+                first = result[category] if category == 'color' else next(result[category])
+                entry = {key: value for key, value in first.items() if key not in VOLATILE_FIELDS}
+                key = json.dumps(entry, ensure_ascii=False, sort_keys=True)
+                index = vocab_index[category].get(key)
+                if index is None:
+                    index = vocab_index[category][key] = len(vocab[category])
+                    vocab[category].append(entry)
+                indexes.append(index)
+            rows += row_struct.pack(*indexes)
+
+        header = {
+            'date': date_str,
+            'fingerprint': bundle_fingerprint(bundle),
+            'categories': categories,
+            'start_ordinal': start_ordinal,
+            'count': end_ordinal - start_ordinal + 1,
+            'vocab': vocab,
+            'data_offset': 0
+        }
+        # 헤더 길이가 data_offset 자릿수에 따라 바뀌므로 고정될 때까지 반복
+        while True:
+            header_bytes = json.dumps(header, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            data_offset = len(MAGIC) + HEADER_LENGTH.size + len(header_bytes)
+            data_offset += -data_offset % 8  # 행 데이터는 8바이트 정렬
+            if header['data_offset'] == data_offset:
+                break
+            header['data_offset'] = data_offset
+
+        header_end = len(MAGIC) + HEADER_LENGTH.size + len(header_bytes)
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(MAGIC)
+                f.write(HEADER_LENGTH.pack(len(header_bytes)))
+                f.write(header_bytes)
+                f.write(b'\0' * (data_offset - header_end))
+                f.write(rows)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+
+class DailyTableStore:
+    """날짜별 표 관리 (조회, 생성, 자정 갱신)"""
+
+    # 표 파일이 없을 때 다시 확인하기까지의 시간(초)
+    RECHECK_INTERVAL = 60.0
+
+    def __init__(self, folder: str, bundle: DailyBundle,
+                 start: date = DEFAULT_START, end: date = DEFAULT_END):
+        """
+        Args:
+            folder: 표 저장 폴더
+            bundle: 추천 묶음 계산기 (표가 없을 때 실시간 계산에도 사용)
+            start, end: 생년월일 범위
+        """
+        self.folder = folder
+        self.bundle = bundle
+        self.start = start
+        self.end = end
+        self.fingerprint = bundle_fingerprint(bundle)
+        self._tables: Dict[str, Optional[DailyTable]] = {}
+        self._checked_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._scheduler: Optional[threading.Thread] = None
+        os.makedirs(folder, exist_ok=True)
+
+    def path_for(self, date_str: str) -> str:
+        return os.path.join(self.folder, f'{date_str}.bin')
+
+    def table_for(self, date_str: str) -> Optional[DailyTable]:
+        """날짜의 표 반환 (없거나 설정이 다르면 None, 없을 때는 주기적으로 다시 확인)"""
+        table = self._tables.get(date_str)
+        if table is not None:
+            return table
+
+        now = time.monotonic()
+        with self._lock:
+            if date_str in self._tables and now - self._checked_at.get(date_str, 0.0) < self.RECHECK_INTERVAL:
+                return self._tables[date_str]
+            self._checked_at[date_str] = now
+            table = self._open(date_str)
+            self._tables[date_str] = table
+
+            # 오래된 날짜의 표는 참조만 제거 (사용 중인 요청이 끝나면 메모리 맵도 해제됨)
+            for old_date in sorted(self._tables)[:-3]:
+                del self._tables[old_date]
+                self._checked_at.pop(old_date, None)
+        return table
+
+    def _open(self, date_str: str) -> Optional[DailyTable]:
+        """표 파일 열기 및 검증 (시드 설정 확인 + 실시간 계산과 표본 비교)"""
+        path = self.path_for(date_str)
+        if not os.path.exists(path):
+            return None
+        try:
+            table = DailyTable(path)
+        except (OSError, ValueError) as e:
+            print(f"사전 계산 표 로드 오류: {e}")
+            return None
+        if table.fingerprint != self.fingerprint or table.date != date_str or not self._spot_check(table):
+            print(f"사전 계산 표가 현재 설정과 다릅니다: {path}")
+            table.close()
+            return None
+        return table
+
+    def _spot_check(self, table: DailyTable, samples: int = 16) -> bool:
+        """추천 코드가 바뀐 뒤의 오래된 표를 걸러내기 위해 일부 행을 실시간 계산과 비교"""
+        step = max(table.count // samples, 1)
+        for row in range(0, table.count, step):
+            birth_date = date.fromordinal(table.start_ordinal + row).isoformat()
+            live = self.bundle.compute(birth_date, table.date)
+            picks = table.lookup(table.start_ordinal + row)
+            for category in table.categories:
+                first = live[category] if category == 'color' else next(live[category])
+                expected = {key: value for key, value in first.items() if key not in VOLATILE_FIELDS}
+                # 튜플(rgb 등)은 JSON에서 리스트가 되므로 JSON 기준으로 비교
+                if json.dumps(expected, ensure_ascii=False, sort_keys=True) != \
+                        json.dumps(picks[category], ensure_ascii=False, sort_keys=True):
+                    return False
+        return True
+
+    def lookup(self, birth_date: str, date_str: str) -> Optional[Dict[str, Dict]]:
+        """
+        카테고리별 첫 번째 추천 조회 (응답용 필드까지 채운 새 딕셔너리)
+        표가 없거나 범위 밖이면 None
+        """
+        table = self.table_for(date_str)
+        if table is None:
+            return None
+        # 표는 정규화된 YYYY-MM-DD 생년월일만 다룸 (그 밖의 형식은 실시간 계산)
+        if len(birth_date) != 10:
+            return None
+        try:
+            birth_ordinal = date.fromisoformat(birth_date).toordinal()
+        except ValueError:
+            return None
+        picks = table.lookup(birth_ordinal)
+        if picks is None:
+            return None
+
+        result = {}
+        for category, entry in picks.items():
+            item = dict(entry)
+            if category != 'shopping':
+                item['date'] = date_str
+                item['birth_date'] = birth_date
+            if category == 'drink':
+                time_of_day = self.bundle.drink_suggester.get_time_of_day()
+                item['time_of_day'] = time_of_day
+                item['time_message'] = self.bundle.drink_suggester.TIME_MESSAGES[time_of_day]
+            result[category] = item
+        return result
+
+    def compute(self, birth_date: str, date_str: Optional[str] = None) -> Dict:
+        """
+        DailyBundle.compute()와 같은 형식의 추천 묶음 반환
+        첫 번째 후보는 표에서 가져오고, 그다음 후보가 필요할 때만 실시간 계산
+        """
+        if date_str is None:
+            date_str = get_kst_now().strftime('%Y-%m-%d')
+
+        picks = self.lookup(birth_date, date_str)
+        if picks is None:
+            return self.bundle.compute(birth_date, date_str)
+
+        live_results = []
+
+        def live() -> Dict:
+            # 실시간 계산은 필요할 때 한 번만
+            if not live_results:
+                live_results.append(self.bundle.compute(birth_date, date_str))
+            return live_results[0]
+
+        result = {'date': date_str, 'birth_date': birth_date, 'color': picks['color']}
+        for category in DailyBundle.CATEGORIES:
+            if category != 'color':
+                result[category] = self._chain(picks[category], live, category)
+        return result
+
+    @staticmethod
+    def _chain(first: Dict, live: Callable[[], Dict], category: str) -> Iterator[Dict]:
+        """표의 첫 번째 후보 다음에 실시간 후보를 이어서 반환"""
+        yield first
+        rest = live()[category]
+        next(rest, None)  # 첫 번째 후보는 표와 같으므로 건너뜀
+        yield from rest
+
+    def ensure(self, date_str: str) -> bool:
+        """
+        날짜의 표가 없으면 생성 (여러 워커 중 하나만 생성하고 나머지는 기다렸다가 사용)
+
+        Returns:
+            새로 생성했으면 True
+        """
+        path = self.path_for(date_str)
+        with file_lock(path):
+            existing = self._open(date_str)
+            if existing is not None:
+                existing.close()
+                return False
+            DailyTable.build(self.bundle, date_str, path, self.start, self.end)
+
+        # 실패 캐시 제거 (다음 조회 때 새 표를 열도록)
+        with self._lock:
+            if self._tables.get(date_str, False) is None:
+                del self._tables[date_str]
+        self._cleanup(date_str)
+        return True
+
+    def _cleanup(self, current_date: str):
+        """어제 이전의 표 파일 삭제"""
+        yesterday = (date.fromisoformat(current_date) - timedelta(days=1)).isoformat()
+        for name in os.listdir(self.folder):
+            if name.endswith(('.bin', '.bin.lock')) and name[:10] < yesterday:
+                try:
+                    os.unlink(os.path.join(self.folder, name))
+                except OSError:
+                    pass
+
+    def start_scheduler(self):
+        """
+        백그라운드 스레드에서 오늘/내일 표를 만들고, 이후 매일 한국시간 자정에 다음 날 표 생성
+        (자정이 되면 이미 만들어 둔 표를 바로 사용)
+        """
+        if self._scheduler is not None:
+            return
+
+        def run():
+            while True:
+                today = get_kst_now().date()
+                for day in (today, today + timedelta(days=1)):
+                    try:
+                        self.ensure(day.isoformat())
+                    except Exception as e:
+                        print(f"사전 계산 표 생성 오류 ({day}): {e}")
+                # 다음 자정(KST)까지 대기
+                now = get_kst_now()
+                midnight = KST.localize(datetime.combine(now.date() + timedelta(days=1), datetime.min.time()))
+                time.sleep(max((midnight - now).total_seconds(), 1.0))
+
+        self._scheduler = threading.Thread(target=run, name='daily-table', daemon=True)
+        self._scheduler.start()
+
+
+def _create_bundle(settings: Optional[Settings] = None) -> DailyBundle:
+    """
+    앱과 같은 설정으로 추천 묶음 계산기 생성 (명령행 작업용)
+
+    Args:
+        settings: 앱 설정 (None이면 환경 변수 설정, 검증 오류는 ConfigError)
+    """
+    settings = settings or load_settings()
+    from color_suggester import ColorSuggester
+    from drink_suggester import DrinkSuggester
+    from flower_suggester import FlowerSuggester
+    from greeting_suggester import GreetingSuggester
+    from shopping_suggester import ShoppingSuggester
+    return DailyBundle(
+        ColorSuggester(), DrinkSuggester(), FlowerSuggester(), GreetingSuggester(), ShoppingSuggester(),
+        secret=settings.daily_seed_secret.encode('utf-8'),
+        compatible=settings.daily_bundle_compat
+    )
+
+
+if __name__ == '__main__':
+    # 명령행: 표 생성(build, cron 등에서 KST 자정에 실행) / 검증 및 벤치마크(bench)
+    import argparse
+    import tempfile
+
+    parser = argparse.ArgumentParser(description='날짜별 추천 사전 계산 표')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    build_parser = subparsers.add_parser('build', help='표 생성')
+    build_parser.add_argument('--folder', default=os.path.join('data', 'daily_table'))
+    build_parser.add_argument('--date', help='시작 날짜 (YYYY-MM-DD, 기본 오늘 KST)')
+    build_parser.add_argument('--days', type=int, default=2, help='생성할 일수 (기본 오늘+내일)')
+    subparsers.add_parser('bench', help='표 조회와 실시간 계산 비교')
+    args = parser.parse_args()
+
+    bundle = _create_bundle()
+
+    if args.command == 'build':
+        store = DailyTableStore(args.folder, bundle)
+        first_day = date.fromisoformat(args.date) if args.date else get_kst_now().date()
+        for offset in range(args.days):
+            date_str = (first_day + timedelta(days=offset)).isoformat()
+            start_time = time.perf_counter()
+            built = store.ensure(date_str)
+            status = '생성' if built else '이미 있음'
+            print(f"{date_str}: {status} ({time.perf_counter() - start_time:.1f}초, {store.path_for(date_str)})")
+    else:
+        store = DailyTableStore(tempfile.mkdtemp(), bundle)
+        date_str = '2025-06-15'
+        start_time = time.perf_counter()
+        store.ensure(date_str)
+        size = os.path.getsize(store.path_for(date_str))
+        print(f"표 생성: {time.perf_counter() - start_time:.1f}초, {size / 1024:.0f}KB")
+
+        # 모든 생년월일에서 표 조회 결과가 실시간 계산과 같아야 함
+        birth_dates = [date.fromordinal(o).isoformat()
+                       for o in range(DEFAULT_START.toordinal(), DEFAULT_END.toordinal() + 1)]
+        for birth_date in birth_dates:
+            live = bundle.compute(birth_date, date_str)
+            picks = store.lookup(birth_date, date_str)
+            for category in DailyBundle.CATEGORIES:
+                expected = live[category] if category == 'color' else next(live[category])
+                assert json.dumps(expected, ensure_ascii=False, sort_keys=True) == \
+                    json.dumps(picks[category], ensure_ascii=False, sort_keys=True), (birth_date, category)
+        # 두 번째 이후 후보도 실시간 계산과 같아야 함
+        chained = store.compute('1990-05-15', date_str)
+        live = bundle.compute('1990-05-15', date_str)
+        assert [d['name'] for d in chained['drink']] == [d['name'] for d in live['drink']]
+        # 범위 밖 생년월일은 실시간 계산
+        assert store.lookup('1850-01-01', date_str) is None
+        print(f"검증 통과: 생년월일 {len(birth_dates)}개")
+
+        def first_live(birth_date):
+            result = bundle.compute(birth_date, date_str)
+            return [result['color']] + [next(result[c]) for c in DailyBundle.CATEGORIES[1:]]
+
+        sample = birth_dates[::10]
+        for label, run in (('실시간 계산', first_live),
+                           ('표 조회', lambda b: store.lookup(b, date_str))):
+            start_time = time.perf_counter()
+            for birth_date in sample:
+                run(birth_date)
+            elapsed = time.perf_counter() - start_time
+            print(f"{label}: 평균 {elapsed / len(sample) * 1e6:.1f}us")
@@ -2,10 +2,10 @@
 """
 생년월일 기반 오늘의 한잔 추천 모듈
 """
-import hashlib
 from datetime import datetime
 import pytz
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional
+from seeded_random import seed_to_int
 
 # 한국시간대 설정
 KST = pytz.timezone('Asia/Seoul')
@@ -121,6 +121,13 @@ class DrinkSuggester:
         {'name': '세이지', 'type': 'tea', 'description': '부드럽고 진정 효과가 있는 차로 마음을 평온하게 해줍니다.'},
     ]
     
+    # 시간대별 설명
+    TIME_MESSAGES = {
+        'morning': '아침에 마시기 좋은',
+        'afternoon': '오후에 즐기기 좋은',
+        'evening': '저녁에 마시기 좋은'
+    }
+    
     def __init__(self):
         pass
     
@@ -135,60 +142,80 @@ class DrinkSuggester:
         Returns:
             음료 정보 딕셔너리
         """
+        return next(self.iter_candidates(birth_date, date_str))
+    
+    def iter_candidates(self, birth_date: str, date_str: Optional[str] = None) -> Iterator[Dict]:
+        """
+        오늘의 한잔 후보를 우선순위 순서대로 반환 (결정적)
+        첫 번째 후보는 suggest_drink() 결과와 같고, 이후 같은 종류의 나머지 음료,
+        다른 종류의 음료 순서로 이어짐
+        
+        Args:
+            birth_date: 생년월일 (YYYY-MM-DD)
+            date_str: 날짜 (YYYY-MM-DD), None이면 오늘 날짜
+        """
         if date_str is None:
             date_str = get_kst_now().strftime('%Y-%m-%d')
         
         # 날짜와 생년월일을 조합하여 시드 생성
         seed_str = f"{date_str}_{birth_date}_drink"
-        seed_hash = int(hashlib.md5(seed_str.encode()).hexdigest(), 16)
+        seed_hash = seed_to_int(seed_str)
         
-        # 생년월일에서 정보 추출
+        # 생년월일 형식 검증
         birth_dt = datetime.strptime(birth_date, '%Y-%m-%d')
-        month = birth_dt.month
-        day = birth_dt.day
         
+        return self.iter_from_seed(birth_dt, seed_hash, birth_date, date_str)
+    
+    def iter_from_seed(self, birth_dt: datetime, seed_hash: int, birth_date: str, date_str: str) -> Iterator[Dict]:
+        """
+        이미 파싱한 생년월일과 시드로 후보 반환 (DailyBundle에서 사용)
+        
+        Args:
+            birth_dt: 파싱된 생년월일
+            seed_hash: 음료 선택 시드 (정수)
+            birth_date: 생년월일 문자열 (응답용)
+            date_str: 날짜 (YYYY-MM-DD)
+        """
         # 시간대별 추천 (오전/오후/저녁) - 한국시간 기준
-        current_hour = get_kst_now().hour
-        if current_hour < 12:
-            time_of_day = 'morning'
-        elif current_hour < 18:
-            time_of_day = 'afternoon'
-        else:
-            time_of_day = 'evening'
+        time_of_day = self.get_time_of_day()
         
         # 커피 vs 차 선택 (시드 기반, 50:50 확률)
         is_coffee = (seed_hash % 2 == 0)
         
+        # 선택된 종류를 먼저, 다른 종류를 나중에
         if is_coffee:
-            # 커피 선택
-            drink_list = self.COFFEES
-            drink_type = 'coffee'
-            drink_type_korean = '커피'
+            drink_lists = [self.COFFEES, self.TEAS]
         else:
-            # 차 선택
-            drink_list = self.TEAS
-            drink_type = 'tea'
-            drink_type_korean = '차'
-        
-        # 특정 음료 선택 (시드 기반)
-        drink_idx = seed_hash % len(drink_list)
-        selected_drink = drink_list[drink_idx].copy()
+            drink_lists = [self.TEAS, self.COFFEES]
         
-        # 시간대별 설명 추가
-        time_messages = {
-            'morning': '아침에 마시기 좋은',
-            'afternoon': '오후에 즐기기 좋은',
-            'evening': '저녁에 마시기 좋은'
-        }
+        for drink_list in drink_lists:
+            # 특정 음료 선택 (시드 기반), 이후 순환하며 나머지 음료
+            drink_idx = seed_hash % len(drink_list)
+            for offset in range(len(drink_list)):
+                selected_drink = drink_list[(drink_idx + offset) % len(drink_list)]
+                yield self._build_drink_info(selected_drink, time_of_day, date_str, birth_date)
+    
+    def get_time_of_day(self) -> str:
+        """현재 시간대 반환 (한국시간 기준 morning/afternoon/evening)"""
+        current_hour = get_kst_now().hour
+        if current_hour < 12:
+            return 'morning'
+        elif current_hour < 18:
+            return 'afternoon'
+        return 'evening'
+    
+    def _build_drink_info(self, selected_drink: Dict, time_of_day: str, date_str: str, birth_date: str) -> Dict:
+        """선택된 음료로 응답용 음료 정보 구성"""
+        is_coffee = (selected_drink['type'] == 'coffee')
         
         # 추가 정보
         drink_info = {
             'name': selected_drink['name'],
-            'type': drink_type,
-            'type_korean': drink_type_korean,
+            'type': selected_drink['type'],
+            'type_korean': '커피' if is_coffee else '차',
             'description': selected_drink['description'],
             'time_of_day': time_of_day,
-            'time_message': time_messages[time_of_day],
+            'time_message': self.TIME_MESSAGES[time_of_day],
             'date': date_str,
             'birth_date': birth_date,
             'emoji': '☕' if is_coffee else '🍵',
@@ -196,7 +223,6 @@ class DrinkSuggester:
         
         return drink_info
 
-
 if __name__ == '__main__':
     # 테스트
     suggester = DrinkSuggester()
@@ -2,10 +2,11 @@
 """
 생년월일 기반 오늘의 꽃 추천 모듈
 """
-import hashlib
 from datetime import datetime
 import pytz
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional
+from seeded_random import seed_to_int
+import astro_attributes
 
 # 한국시간대 설정
 KST = pytz.timezone('Asia/Seoul')
@@ -110,98 +111,86 @@ class FlowerSuggester:
         Returns:
             꽃 정보 딕셔너리
         """
+        return next(self.iter_candidates(birth_date, date_str))
+    
+    def iter_candidates(self, birth_date: str, date_str: Optional[str] = None) -> Iterator[Dict]:
+        """
+        오늘의 꽃 후보를 우선순위 순서대로 반환 (결정적, 꽃 이름 중복 없음)
+        첫 번째 후보는 suggest_flower() 결과와 같음
+        
+        Args:
+            birth_date: 생년월일 (YYYY-MM-DD)
+            date_str: 날짜 (YYYY-MM-DD), None이면 오늘 날짜
+        """
         if date_str is None:
             date_str = get_kst_now().strftime('%Y-%m-%d')
         
         # 날짜와 생년월일을 조합하여 시드 생성
         seed_str = f"{date_str}_{birth_date}_flower"
-        seed_hash = int(hashlib.md5(seed_str.encode()).hexdigest(), 16)
+        seed_hash = seed_to_int(seed_str)
         
-        # 생년월일에서 정보 추출
         birth_dt = datetime.strptime(birth_date, '%Y-%m-%d')
-        month = birth_dt.month
-        day = birth_dt.day
-        
-        # 계절 결정
-        if month in [12, 1, 2]:
-            season = '겨울'
-        elif month in [3, 4, 5]:
-            season = '봄'
-        elif month in [6, 7, 8]:
-            season = '여름'
-        else:
-            season = '가을'
-        
-        # 별자리 결정
-        zodiac_korean = self._get_zodiac_from_month_day(month, day)
+        return self.iter_from_seed(birth_dt, seed_hash, birth_date, date_str)
+    
+    def iter_from_seed(self, birth_dt: datetime, seed_hash: int, birth_date: str, date_str: str) -> Iterator[Dict]:
+        """
+        이미 파싱한 생년월일과 시드로 후보 반환 (DailyBundle에서 사용)
         
-        # 타로 카드 결정 (생일 숫자 기반)
-        tarot_number = ((month + day) % 22) or 22
-        tarot_name = self._get_tarot_name(tarot_number)
+        Args:
+            birth_dt: 파싱된 생년월일
+            seed_hash: 꽃 선택 시드 (정수)
+            birth_date: 생년월일 문자열 (응답용)
+            date_str: 날짜 (YYYY-MM-DD)
+        """
+        # 계절, 별자리, 타로 카드 (생일 숫자 기반)
+        astro = astro_attributes.lookup(birth_dt.month, birth_dt.day)
+        season = astro.season
+        zodiac_korean = astro.zodiac_korean
+        tarot_name = astro.tarot_korean
         
         # 꽃 선택 소스 결정 (시드 기반)
         source_type = seed_hash % 3  # 0: 별자리, 1: 계절, 2: 타로
         
-        if source_type == 0 and zodiac_korean in self.ZODIAC_FLOWERS:
-            # 별자리 꽃
-            flower = self.ZODIAC_FLOWERS[zodiac_korean].copy()
-            flower['source'] = f'{zodiac_korean}의 꽃'
-        elif source_type == 1:
-            # 계절 꽃
-            season_flowers = self.SEASON_FLOWERS.get(season, self.SEASON_FLOWERS['봄'])
-            flower_idx = seed_hash % len(season_flowers)
-            flower = season_flowers[flower_idx].copy()
+        # 별자리 꽃
+        zodiac_flower = self.ZODIAC_FLOWERS[zodiac_korean].copy()
+        zodiac_flower['source'] = f'{zodiac_korean}의 꽃'
+        
+        # 계절 꽃 (시드 기반 인덱스부터 순환)
+        season_flowers = self.SEASON_FLOWERS.get(season, self.SEASON_FLOWERS['봄'])
+        flower_idx = seed_hash % len(season_flowers)
+        season_candidates = []
+        for offset in range(len(season_flowers)):
+            flower = season_flowers[(flower_idx + offset) % len(season_flowers)].copy()
             flower['source'] = f'{season} 계절의 꽃'
-        else:
-            # 타로 꽃
-            if tarot_name in self.TAROT_FLOWERS:
-                flower = self.TAROT_FLOWERS[tarot_name].copy()
-                flower['source'] = f'{tarot_name} 카드의 꽃'
-            else:
-                # 기본 꽃
-                flower = {'name': '해바라기', 'emoji': '🌻', 'meaning': '긍정과 희망을 상징합니다. 밝은 하루입니다.', 'source': '기본 꽃'}
+            season_candidates.append(flower)
         
-        # 추가 정보
-        flower['date'] = date_str
-        flower['birth_date'] = birth_date
+        # 타로 꽃
+        if tarot_name in self.TAROT_FLOWERS:
+            tarot_flower = self.TAROT_FLOWERS[tarot_name].copy()
+            tarot_flower['source'] = f'{tarot_name} 카드의 꽃'
+        else:
+            # 기본 꽃
+            tarot_flower = {'name': '해바라기', 'emoji': '🌻', 'meaning': '긍정과 희망을 상징합니다. 밝은 하루입니다.', 'source': '기본 꽃'}
         
-        return flower
-    
-    def _get_zodiac_from_month_day(self, month: int, day: int) -> str:
-        """월과 일로 별자리 결정"""
-        if (month == 1 and day >= 20) or (month == 2 and day < 19):
-            return '물병자리'
-        elif (month == 2 and day >= 19) or (month == 3 and day < 21):
-            return '물고기자리'
-        elif (month == 3 and day >= 21) or (month == 4 and day < 20):
-            return '양자리'
-        elif (month == 4 and day >= 20) or (month == 5 and day < 21):
-            return '황소자리'
-        elif (month == 5 and day >= 21) or (month == 6 and day < 21):
-            return '쌍둥이자리'
-        elif (month == 6 and day >= 21) or (month == 7 and day < 23):
-            return '게자리'
-        elif (month == 7 and day >= 23) or (month == 8 and day < 23):
-            return '사자자리'
-        elif (month == 8 and day >= 23) or (month == 9 and day < 23):
-            return '처녀자리'
-        elif (month == 9 and day >= 23) or (month == 10 and day < 23):
-            return '천칭자리'
-        elif (month == 10 and day >= 23) or (month == 11 and day < 22):
-            return '전갈자리'
-        elif (month == 11 and day >= 22) or (month == 12 and day < 22):
-            return '사수자리'
+        # 시드로 선택된 소스를 먼저, 나머지 소스를 나중에
+        if source_type == 0:
+            candidates = [zodiac_flower] + season_candidates + [tarot_flower]
+        elif source_type == 1:
+            candidates = season_candidates + [zodiac_flower, tarot_flower]
         else:
-            return '염소자리'
-    
-    def _get_tarot_name(self, number: int) -> str:
-        """타로 카드 번호로 이름 반환"""
-        tarot_names = [
-            '마법사', '여교황', '여황제', '황제', '교황', '연인', '전차', '힘', '은둔자',
-            '운명의 바퀴', '정의', '매달린 사람', '죽음', '절제', '악마', '탑', '별', '달',
-            '태양', '심판', '세계', '바보'
-        ]
-        return tarot_names[number - 1] if 1 <= number <= 22 else '바보'
+            candidates = [tarot_flower] + season_candidates + [zodiac_flower]
+        
+        # 같은 꽃은 한 번만 (히스토리는 꽃 이름 기준)
+        seen_names = set()
+        for flower in candidates:
+            if flower['name'] in seen_names:
+                continue
+            seen_names.add(flower['name'])
+            
+            # 추가 정보
+            flower['date'] = date_str
+            flower['birth_date'] = birth_date
+            yield flower
 
 
 if __name__ == '__main__':
@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
-import hashlib
 from datetime import datetime
 import pytz
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional
+from seeded_random import seed_to_int
 
 KST = pytz.timezone('Asia/Seoul')
 
@@ -464,29 +464,55 @@ class GreetingSuggester:
         Returns:
             인사말 정보 딕셔너리
         """
+        return next(self.iter_candidates(birth_date, date_str))
+    
+    def iter_candidates(self, birth_date: str, date_str: Optional[str] = None) -> Iterator[Dict]:
+        """
+        오늘의 인사말 후보를 우선순위 순서대로 반환 (결정적)
+        첫 번째 후보는 suggest_greeting() 결과와 같고, 이후 같은 카테고리의
+        나머지 인사말, 다음 카테고리 순서로 이어짐
+        
+        Args:
+            birth_date: 생년월일 (YYYY-MM-DD)
+            date_str: 날짜 (YYYY-MM-DD), None이면 오늘
+        """
         if date_str is None:
             date_str = get_kst_now().strftime('%Y-%m-%d')
         
         # 날짜와 생년월일을 조합하여 시드 생성
         seed_str = f"{date_str}_{birth_date}_greeting"
-        seed_hash = int(hashlib.md5(seed_str.encode()).hexdigest(), 16)
+        seed_hash = seed_to_int(seed_str)
         
-        # 카테고리 선택 (생년월일의 일자 기반)
         birth_dt = datetime.strptime(birth_date, '%Y-%m-%d')
+        return self.iter_from_seed(birth_dt, seed_hash, birth_date, date_str)
+    
+    def iter_from_seed(self, birth_dt: datetime, seed_hash: int, birth_date: str, date_str: str) -> Iterator[Dict]:
+        """
+        이미 파싱한 생년월일과 시드로 후보 반환 (DailyBundle에서 사용)
+        
+        Args:
+            birth_dt: 파싱된 생년월일
+            seed_hash: 인사말 선택 시드 (정수)
+            birth_date: 생년월일 문자열 (응답용)
+            date_str: 날짜 (YYYY-MM-DD)
+        """
+        # 카테고리 선택 (생년월일의 일자 기반)
         day = birth_dt.day
         categories = list(self.GREETINGS.keys())
         category_index = (day + seed_hash) % len(categories)
-        category = categories[category_index]
-        
-        # 해당 카테고리의 인사말 중 하나 선택
-        greetings_in_category = self.GREETINGS[category]
-        greeting_index = seed_hash % len(greetings_in_category)
-        greeting = greetings_in_category[greeting_index].copy()
         
-        # 추가 정보
-        greeting['category'] = category
-        greeting['date'] = date_str
-        greeting['birth_date'] = birth_date
-        
-        return greeting
-
+        for category_offset in range(len(categories)):
+            category = categories[(category_index + category_offset) % len(categories)]
+            
+            # 해당 카테고리의 인사말 중 하나 선택, 이후 순환
+            greetings_in_category = self.GREETINGS[category]
+            greeting_index = seed_hash % len(greetings_in_category)
+            for offset in range(len(greetings_in_category)):
+                greeting = greetings_in_category[(greeting_index + offset) % len(greetings_in_category)].copy()
+                
+                # 추가 정보
+                greeting['category'] = category
+                greeting['date'] = date_str
+                greeting['birth_date'] = birth_date
+                
+                yield greeting
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+HTTP 조건부 캐시 모듈
+결정적 입력(날짜, 생년월일, 콘텐츠 버전)으로 강한 ETag를 만들고, If-None-Match /
+If-Modified-Since가 일치하면 내용을 계산하지 않고 304로 응답.
+내용이 바뀌는 KST 자정까지를 Cache-Control max-age로 지정하여 브라우저/CDN이 재사용
+"""
+import hashlib
+import json
+import sys
+from datetime import datetime, timedelta
+from typing import Optional
+
+import pytz
+from flask import current_app, request
+from werkzeug.http import is_resource_modified
+
+# 한국시간대 설정
+KST = pytz.timezone('Asia/Seoul')
+
+def get_kst_now():
+    """한국시간(KST) 기준 현재 시간 반환"""
+    return datetime.now(KST)
+
+
+def content_version(*module_names: str) -> str:
+    """
+    추천/분석 코드와 데이터의 버전 (모듈 소스 해시)
+    배포로 결과가 바뀌면 ETag도 바뀌어 이전 캐시를 재사용하지 않음
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for name in module_names:
+        module = sys.modules.get(name) or __import__(name)
+        with open(module.__file__, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def make_etag(*parts) -> str:
+    """결정적 입력으로 강한 ETag 값 생성"""
+    data = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.blake2b(data.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def kst_day_start(now: Optional[datetime] = None) -> datetime:
+    """오늘 KST 자정 (날짜 기반 응답의 Last-Modified)"""
+    now = now or get_kst_now()
+    return KST.localize(datetime.combine(now.date(), datetime.min.time()))
+
+
+def seconds_until_kst_midnight(now: Optional[datetime] = None) -> int:
+    """다음 KST 자정까지 남은 초 (최소 1초)"""
+    now = now or get_kst_now()
+    midnight = kst_day_start(now) + timedelta(days=1)
+    return max(int((midnight - now).total_seconds()), 1)
+
+
+def not_modified_response(etag: str, last_modified: Optional[datetime] = None,
+                          max_age: Optional[int] = None):
+    """
+    클라이언트 캐시가 유효하면 304 응답 반환 (아니면 None)
+    GET/HEAD 요청에만 적용
+
+    사용 예:
+        etag = make_etag('quote', date_str, birth_date)
+        cached = not_modified_response(etag, max_age=seconds_until_kst_midnight())
+        if cached is not None:
+            return cached
+        ...
+        return add_cache_headers(jsonify(result), etag, max_age=...)
+    """
+    if request.method not in ('GET', 'HEAD'):
+        return None
+    if is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+        return None
+    response = current_app.response_class(status=304)
+    return add_cache_headers(response, etag, last_modified, max_age)
+
+
+def add_cache_headers(response, etag: str, last_modified: Optional[datetime] = None,
+                      max_age: Optional[int] = None):
+    """
+    응답에 검증자와 캐시 정책 설정
+
+    Args:
+        response: Flask 응답
+        etag: 강한 ETag 값
+        last_modified: Last-Modified 시각
+        max_age: 공유 캐시 허용 시간(초). None이면 사용자 상태에 따라 바뀌는 응답으로 보고
+                 매번 재검증 (private, no-cache)
+    """
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    if max_age is None:
+        response.cache_control.private = True
+        response.cache_control.no_cache = True
+    else:
+        response.cache_control.public = True
+        response.cache_control.max_age = max_age
+    return response
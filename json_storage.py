@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+JSON 파일 저장 공용 모듈
+임시 파일에 쓰고 fsync 후 os.replace로 교체하여, 동시 쓰기나 쓰기 도중 종료에도
+대상 파일이 잘린 상태로 남지 않도록 보장
+"""
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+# fcntl 임포트 (선택적, POSIX 전용)
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+
+def read_json(file_path: str, default: Any = None) -> Any:
+    """
+    JSON 파일 읽기
+
+    Args:
+        file_path: 파일 경로
+        default: 파일이 없을 때 반환할 값
+    """
+    if not os.path.exists(file_path):
+        return default
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def atomic_write_json(file_path: str, data: Any, **dump_kwargs):
+    """
+    JSON 파일 원자적 저장 (임시 파일 쓰기 + fsync + os.replace)
+
+    Args:
+        file_path: 대상 파일 경로
+        data: 저장할 데이터
+        dump_kwargs: json.dump 추가 옵션 (기본: ensure_ascii=False, 압축 구분자)
+    """
+    dump_kwargs.setdefault('ensure_ascii', False)
+    dump_kwargs.setdefault('separators', (',', ':'))
+
+    directory = os.path.dirname(file_path) or '.'
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f'.{os.path.basename(file_path)}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, **dump_kwargs)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, file_path)
+    except BaseException:
+        # 실패 시 임시 파일 정리 (대상 파일은 그대로 유지)
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+    # 디렉터리 엔트리 변경도 디스크에 반영 (지원하지 않는 플랫폼은 무시)
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+@contextmanager
+def file_lock(file_path: str) -> Iterator[None]:
+    """
+    파일 단위 배타적 잠금 (읽기-수정-쓰기 구간 보호용)
+    '{file_path}.lock' 파일에 flock을 걸어 여러 워커 프로세스 간에도 직렬화.
+    fcntl이 없는 플랫폼에서는 잠금 없이 진행
+
+    사용 예:
+        with file_lock(path):
+            data = read_json(path, {})
+            data['key'] = 'value'
+            atomic_write_json(path, data)
+    """
+    if not HAS_FCNTL:
+        yield
+        return
+
+    with open(f'{file_path}.lock', 'a') as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _stress_worker(args):
+    """스트레스 테스트 작업자: 잠금 하에 카운터 증가, 잠금 없이 큰 파일 덮어쓰기"""
+    counter_path, blob_path, worker_id, iterations = args
+    for i in range(iterations):
+        with file_lock(counter_path):
+            data = read_json(counter_path, {'count': 0})
+            data['count'] += 1
+            atomic_write_json(counter_path, data)
+        atomic_write_json(blob_path, {'worker': worker_id, 'items': [i] * 2000})
+        # 다른 프로세스가 쓰는 도중에도 항상 완전한 JSON이어야 함
+        assert len(read_json(blob_path)['items']) == 2000
+    return worker_id
+
+
+if __name__ == '__main__':
+    # 스트레스 테스트: 여러 프로세스가 동시에 같은 파일에 쓰기
+    from multiprocessing import Pool
+
+    folder = tempfile.mkdtemp()
+    counter_path = os.path.join(folder, 'counter.json')
+    blob_path = os.path.join(folder, 'blob.json')
+    workers, iterations = 8, 200
+
+    with Pool(workers) as pool:
+        pool.map(_stress_worker, [(counter_path, blob_path, w, iterations) for w in range(workers)])
+
+    count = read_json(counter_path)['count']
+    leftovers = [name for name in os.listdir(folder) if name.endswith('.tmp')]
+    assert count == workers * iterations, count
+    assert not leftovers, leftovers
+    print(f"스트레스 테스트 통과: {workers}개 프로세스, 카운터 {count}, 남은 임시 파일 없음")
@@ -0,0 +1,377 @@
+# -*- coding: utf-8 -*-
+"""
+네이버 쇼핑 검색 API 클라이언트 모듈
+- 연결 풀을 쓰는 세션 (keep-alive)
+- 검색어별 TTL 캐시 (상품 검색 결과는 사용자와 무관)
+- 같은 검색어의 동시 요청은 한 번만 호출하고 결과 공유 (request coalescing)
+- 초당/일일 토큰 버킷으로 API 호출량 제한
+- 서킷 브레이커와 요청 기한 (API 장애 시 타임아웃을 매번 기다리지 않음)
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from resilience import CircuitBreaker, DeadlineExceeded, call_timeout, get_breaker, remaining
+
+
+class TokenBucket:
+    """토큰 버킷 호출량 제한기 (스레드 안전)"""
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Args:
+            rate: 초당 토큰 충전량
+            capacity: 최대 토큰 수 (순간 허용량)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self, timeout: float = 0.0) -> bool:
+        """
+        토큰 하나 사용 (없으면 최대 timeout초 동안 충전을 기다림)
+
+        Returns:
+            토큰을 얻었으면 True
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+            if now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    def release(self):
+        """사용하지 않은 토큰 반환 (토큰을 얻은 뒤 호출하지 못했을 때)"""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + 1)
+
+
+class _InflightCall:
+    """진행 중인 검색 (같은 검색어의 다른 요청은 결과를 기다림)"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[Dict] = None
+
+
+class NaverShoppingClient:
+    """캐시/호출 병합/호출량 제한이 적용된 네이버 쇼핑 검색 클라이언트"""
+
+    API_URL = "https://openapi.naver.com/v1/search/shop.json"
+
+    def __init__(self, client_id: Optional[str], client_secret: Optional[str], api_url: str = API_URL,
+                 cache_ttl: float = 6 * 3600, negative_ttl: float = 300, timeout: float = 5.0,
+                 rate_per_second: float = 10.0, daily_quota: int = 25000, rate_wait: float = 1.0,
+                 pool_size: int = 10, breaker: Optional[CircuitBreaker] = None):
+        """
+        Args:
+            client_id: 네이버 API Client ID
+            client_secret: 네이버 API Client Secret
+            api_url: 검색 API 주소 (테스트 시 로컬 가짜 서버)
+            cache_ttl: 검색 결과 캐시 시간(초)
+            negative_ttl: 검색 결과가 없을 때의 캐시 시간(초)
+            timeout: API 호출 타임아웃(초)
+            rate_per_second: 초당 최대 호출 수
+            daily_quota: 일일 호출 한도 (네이버 검색 API 기본 25,000회)
+            rate_wait: 호출량 제한에 걸렸을 때 기다리는 최대 시간(초), 넘으면 결과 없음으로 처리
+            pool_size: 연결 풀 크기
+            breaker: 서킷 브레이커 (None이면 공유 'naver_shopping' 브레이커)
+        """
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.api_url = api_url
+        self.cache_ttl = cache_ttl
+        self.negative_ttl = negative_ttl
+        self.timeout = timeout
+        self.rate_wait = rate_wait
+        self.breaker = breaker or get_breaker('naver_shopping')
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'X-Naver-Client-Id': client_id or '',
+            'X-Naver-Client-Secret': client_secret or ''
+        })
+
+        self._rate_limiter = TokenBucket(rate_per_second, max(rate_per_second, 1.0))
+        self._quota = TokenBucket(daily_quota / 86400.0, daily_quota)
+        self._cache: Dict[str, Tuple[Optional[Dict], float]] = {}  # query -> (결과, 만료 시각)
+        self._inflight: Dict[str, _InflightCall] = {}
+        self._lock = threading.Lock()
+        self._stats = {'requests': 0, 'cache_hits': 0, 'coalesced': 0, 'rate_limited': 0, 'errors': 0,
+                       'circuit_open': 0, 'deadline_exceeded': 0}
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.client_id and self.client_secret)
+
+    def search(self, query: str, refresh: bool = False) -> Optional[Dict]:
+        """
+        검색어의 첫 번째 상품 정보 반환 (없거나 실패하면 None)
+        반환값은 호출자가 수정해도 되는 새 딕셔너리
+
+        Args:
+            query: 검색어
+            refresh: True면 캐시를 건너뛰고 API를 다시 호출 (결과는 캐시에 반영)
+        """
+        if not self.configured:
+            return None
+
+        with self._lock:
+            entry = self._cache.get(query)
+            if not refresh and entry is not None and entry[1] > time.monotonic():
+                self._stats['cache_hits'] += 1
+                return dict(entry[0]) if entry[0] else None
+            call = self._inflight.get(query)
+            leader = call is None
+            if leader:
+                call = self._inflight[query] = _InflightCall()
+            else:
+                self._stats['coalesced'] += 1
+
+        if not leader:
+            # 먼저 시작한 요청의 결과를 기다림 (요청 기한 이내)
+            wait = self.timeout + self.rate_wait
+            left = remaining()
+            call.done.wait(wait if left is None else max(min(wait, left), 0))
+            return dict(call.result) if call.result else None
+
+        result, ttl = None, 0.0
+        try:
+            result, ttl = self._fetch(query)
+        finally:
+            with self._lock:
+                if ttl > 0:
+                    self._cache[query] = (result, time.monotonic() + ttl)
+                call.result = result
+                del self._inflight[query]
+            call.done.set()
+        return dict(result) if result else None
+
+    def _fetch(self, query: str) -> Tuple[Optional[Dict], float]:
+        """
+        API 호출 (결과, 캐시 시간)
+        오류, 호출량 초과, 브레이커 열림, 요청 기한 초과는 캐시하지 않음
+        """
+        try:
+            rate_wait = call_timeout(self.rate_wait)
+        except DeadlineExceeded:
+            self._count('deadline_exceeded')
+            return None, 0.0
+        # 초당 제한을 먼저 확인하여 호출하지 않은 요청이 일일 한도를 쓰지 않도록 함
+        if not self._rate_limiter.try_acquire(rate_wait) or not self._quota.try_acquire():
+            self._count('rate_limited')
+            return None, 0.0
+        try:
+            timeout = call_timeout(self.timeout)
+        except DeadlineExceeded:
+            self._quota.release()
+            self._count('deadline_exceeded')
+            return None, 0.0
+        if not self.breaker.allow():
+            self._quota.release()
+            self._count('circuit_open')
+            return None, 0.0
+
+        self._count('requests')
+        try:
+            response = self.session.get(
+                self.api_url,
+                params={'query': query, 'display': 1, 'start': 1},  # 첫 번째 결과만
+                timeout=timeout
+            )
+            response.raise_for_status()
+            data = response.json()
+        except Exception as e:
+            self.breaker.record_failure()
+            self._count('errors')
+            print(f"네이버 쇼핑 API 호출 오류: {e}")
+            return None, 0.0
+        self.breaker.record_success()
+
+        if data.get('items') and len(data['items']) > 0:
+            return self.parse_item(data['items'][0]), self.cache_ttl
+        return None, self.negative_ttl
+
+    @staticmethod
+    def parse_item(item: Dict) -> Dict:
+        """API 응답 상품 항목을 상품 정보로 변환 (제목의 강조 태그 제거)"""
+        return {
+            'title': item.get('title', '').replace('<b>', '').replace('</b>', ''),
+            'link': item.get('link', ''),
+            'image': item.get('image', ''),
+            'lprice': item.get('lprice', ''),
+            'hprice': item.get('hprice', ''),
+            'mallName': item.get('mallName', ''),
+            'productId': item.get('productId', ''),
+            'productType': item.get('productType', ''),
+            'brand': item.get('brand', ''),
+            'maker': item.get('maker', ''),
+            'category1': item.get('category1', ''),
+            'category2': item.get('category2', ''),
+            'category3': item.get('category3', ''),
+            'category4': item.get('category4', '')
+        }
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self) -> Dict:
+        """호출/캐시 통계"""
+        with self._lock:
+            return dict(self._stats, cached_queries=len(self._cache))
+
+
+class FakeNaverShoppingServer:
+    """
+    로컬 가짜 네이버 쇼핑 API 서버 (테스트/벤치마크용)
+
+    사용 예:
+        with FakeNaverShoppingServer(latency=0.1) as server:
+            client = NaverShoppingClient('id', 'secret', api_url=server.url)
+            client.search('니트')
+            assert server.request_counts['니트'] == 1
+    """
+
+    def __init__(self, latency: float = 0.0, fail: bool = False):
+        """
+        Args:
+            latency: 응답 지연(초)
+            fail: True면 500 응답
+        """
+        self.latency = latency
+        self.fail = fail
+        self.request_counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                query = parse_qs(urlparse(self.path).query).get('query', [''])[0]
+                with fake._lock:
+                    fake.request_counts[query] = fake.request_counts.get(query, 0) + 1
+                if fake.latency:
+                    time.sleep(fake.latency)
+                if fake.fail:
+                    self.send_response(500)
+                    self.end_headers()
+                    return
+                body = json.dumps({'items': [{
+                    'title': f'<b>{query}</b> 추천 상품',
+                    'link': f'https://shopping.example.com/{query}',
+                    'image': f'https://shopping.example.com/{query}.jpg',
+                    'lprice': '10000',
+                    'mallName': '테스트몰',
+                    'brand': '테스트'
+                }]}, ensure_ascii=False).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self.url = f'http://127.0.0.1:{self._server.server_address[1]}/v1/search/shop.json'
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def total_requests(self) -> int:
+        with self._lock:
+            return sum(self.request_counts.values())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+if __name__ == '__main__':
+    # 가짜 서버로 캐시/호출 병합/호출량 제한 확인
+    from concurrent.futures import ThreadPoolExecutor
+    from shopping_suggester import ShoppingSuggester
+
+    with FakeNaverShoppingServer(latency=0.2) as server:
+        client = NaverShoppingClient('id', 'secret', api_url=server.url, rate_per_second=50)
+
+        # 같은 검색어 동시 요청 32개 -> API 호출 1번
+        with ThreadPoolExecutor(32) as pool:
+            results = list(pool.map(lambda _: client.search('니트'), range(32)))
+        assert all(r and r['title'] == '니트 추천 상품' for r in results)
+        assert server.request_counts['니트'] == 1, server.request_counts
+
+        # 캐시 적중 -> 추가 호출 없음, 반환값을 수정해도 캐시는 그대로
+        results[0]['title'] = 'changed'
+        assert client.search('니트')['title'] == '니트 추천 상품'
+        assert server.request_counts['니트'] == 1
+
+        # 전체 검색어 (약 120개) 조회: 초당 50회 제한으로 약 (120 - 50) / 50초 이상 소요
+        queries = sorted({item for items in ShoppingSuggester.SHOPPING_ITEMS.values() for item in items})
+        server.latency = 0.0
+        start = time.perf_counter()
+        with ThreadPoolExecutor(16) as pool:
+            list(pool.map(client.search, queries))
+        elapsed = time.perf_counter() - start
+        print(f"검색어 {len(queries)}개: {elapsed:.2f}초, API 호출 {server.total_requests}회")
+
+        # 두 번째 전체 조회는 모두 캐시
+        start = time.perf_counter()
+        for query in queries:
+            client.search(query)
+        print(f"캐시 조회 평균: {(time.perf_counter() - start) / len(queries) * 1e6:.1f}us")
+
+        # 제한 시간 안에 토큰을 못 얻으면 결과 없음 (대기 없이 바로 반환)
+        limited = NaverShoppingClient('id', 'secret', api_url=server.url, rate_per_second=1, rate_wait=0)
+        assert limited.search('코트') is not None and limited.search('가방') is None
+        # 초당 제한으로 호출하지 않은 요청은 일일 한도를 쓰지 않음
+        assert limited._quota._tokens > limited._quota.capacity - 2, limited._quota._tokens
+        print(f"통계: {client.stats()} / 제한: {limited.stats()}")
+
+    # API 장애: 연속 3회 실패하면 브레이커가 열려 이후 요청은 API를 기다리지 않음
+    with FakeNaverShoppingServer(latency=0.2, fail=True) as server:
+        breaker = CircuitBreaker('naver_shopping_demo', failure_threshold=3, reset_timeout=60)
+        client = NaverShoppingClient('id', 'secret', api_url=server.url, breaker=breaker)
+        start = time.perf_counter()
+        for query in queries[:20]:
+            client.search(query)
+        elapsed = time.perf_counter() - start
+        assert server.total_requests == 3 and breaker.state == CircuitBreaker.OPEN
+        # 브레이커가 막은 요청은 일일 한도 토큰을 반환
+        assert client._quota._tokens > client._quota.capacity - 4, client._quota._tokens
+        print(f"장애 시 20회 조회: {elapsed:.2f}초, API 호출 {server.total_requests}회, 브레이커 {breaker.stats()}")
+
+        # 요청 기한이 API 타임아웃보다 짧으면 기한까지만 기다림
+        from resilience import deadline
+        server.fail = False
+        server.latency = 1.0
+        client = NaverShoppingClient('id', 'secret', api_url=server.url,
+                                     breaker=CircuitBreaker('naver_shopping_deadline'))
+        start = time.perf_counter()
+        with deadline(0.3):
+            assert client.search('코트') is None
+        print(f"기한 0.3초 요청: {time.perf_counter() - start:.2f}초 만에 반환")
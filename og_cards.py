@@ -0,0 +1,418 @@
+# -*- coding: utf-8 -*-
+"""
+공유 링크별 OG 카드 모듈
+단축 URL로 공유한 오늘의 명언과 컬러를 1200x630 카드 이미지로 그려서 반환.
+같은 (명언, 컬러, 템플릿 버전)이면 같은 이미지이므로 메모리(LRU)와 디스크(data/og_cards)에
+저장해 두고, 새로 그리는 작업은 워커당 동시 실행 수를 제한 (폰트는 시작 시 한 번만 로드)
+"""
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from io import BytesIO
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from resilience import remaining
+
+# PIL 임포트 (선택적)
+try:
+    from PIL import Image, ImageDraw, ImageFont
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
+
+class CardContent(NamedTuple):
+    """카드에 그릴 내용"""
+    text: str
+    author: str
+    color_hex: str
+    color_name: str = ''
+
+
+class RenderBusy(Exception):
+    """동시 렌더링 수가 가득 차서 기다리는 시간 안에 그리지 못함"""
+
+
+# 한글 폰트 후보 (FONT_SETUP.md 참고, 앞에서부터 처음 찾은 폰트 사용): (굵게, 보통)
+FONT_CANDIDATES = (
+    ('NotoSansKR-Bold.otf', 'NotoSansKR-Regular.otf'),
+    ('NanumGothic-Bold.ttf', 'NanumGothic-Regular.ttf'),
+    ('/usr/share/fonts/opentype/noto/NotoSansCJK-Bold.ttc', '/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc'),
+    ('/usr/share/fonts/truetype/noto/NotoSansCJK-Bold.ttc', '/usr/share/fonts/truetype/noto/NotoSansCJK-Regular.ttc'),
+    ('/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf', '/usr/share/fonts/truetype/nanum/NanumGothic.ttf'),
+    ('/usr/share/fonts/truetype/nanum/NanumGothic-Bold.ttf', '/usr/share/fonts/truetype/nanum/NanumGothic-Regular.ttf'),
+)
+
+DEFAULT_COLOR = '#6C5CE7'
+SITE_NAME = '오늘, 나에게 들려주는 한 줄'
+
+
+def _parse_hex(color_hex: str) -> Optional[Tuple[int, int, int]]:
+    value = (color_hex or '').strip().lstrip('#')
+    if len(value) != 6:
+        return None
+    try:
+        return tuple(int(value[i:i + 2], 16) for i in (0, 2, 4))
+    except ValueError:
+        return None
+
+
+def content_from_share_url(url: str) -> Tuple[CardContent, Optional[str]]:
+    """
+    공유 URL(generateShareUrl)에서 카드 내용 추출
+    공유 URL의 텍스트 값은 프런트엔드에서 한 번 더 인코딩되어 있으므로 한 번 더 디코딩
+
+    Returns:
+        (카드 내용 (명언 없이 공유했으면 text가 빈 문자열), 생년월일 또는 None)
+    """
+    params = parse_qs(urlsplit(url).query)
+
+    def param(name: str) -> str:
+        values = params.get(name)
+        return unquote(values[0]).strip() if values else ''
+
+    color_hex = param('color_hex')
+    if _parse_hex(color_hex) is None:
+        color_hex = DEFAULT_COLOR
+    content = CardContent(param('quote_text'), param('quote_author'), color_hex.upper(), param('color_name'))
+    return content, param('birth_date') or None
+
+
+class OgCardRenderer:
+    """OG 카드 렌더러 (메모리 LRU + 디스크 캐시, 워커당 동시 렌더링 제한)"""
+
+    # 카드 디자인을 바꾸면 올려서 이전 캐시를 쓰지 않도록
+    TEMPLATE_VERSION = 1
+
+    WIDTH = 1200
+    HEIGHT = 630
+    MARGIN = 40
+    PADDING = 64
+
+    # 디스크 캐시 정리 간격 (새로 그린 카드 수)
+    PRUNE_EVERY = 50
+
+    def __init__(self, cache_folder: Optional[str] = None, font_folder: Optional[str] = None,
+                 memory_size: int = 256, disk_max_files: int = 5000, max_concurrent: int = 2,
+                 render_wait: float = 2.0):
+        """
+        Args:
+            cache_folder: 디스크 캐시 폴더 (None이면 메모리에만)
+            font_folder: 프로젝트 폰트 폴더 (static/fonts)
+            memory_size: 메모리 캐시 최대 카드 수
+            disk_max_files: 디스크 캐시 최대 파일 수 (초과 시 오래 안 쓴 파일부터 삭제)
+            max_concurrent: 워커당 동시 렌더링 수
+            render_wait: 렌더링 차례를 기다리는 최대 시간(초, 요청 기한이 더 이르면 기한)
+        """
+        self.cache_folder = cache_folder
+        self.memory_size = memory_size
+        self.disk_max_files = disk_max_files
+        self.render_wait = render_wait
+        if cache_folder and not os.path.exists(cache_folder):
+            os.makedirs(cache_folder)
+
+        self._memory: 'OrderedDict[str, bytes]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._semaphore = threading.BoundedSemaphore(max_concurrent)
+        self._writes = 0
+        self._stats = {'memory_hits': 0, 'disk_hits': 0, 'renders': 0, 'busy': 0, 'render_seconds': 0.0}
+        self.font_name, self.fonts = self._load_fonts(font_folder)
+
+    @staticmethod
+    def _load_fonts(font_folder: Optional[str]) -> Tuple[str, Dict]:
+        """카드에 쓰는 모든 크기의 폰트를 한 번만 로드 (한글 폰트가 없으면 기본 폰트)"""
+        if not HAS_PIL:
+            return '', {}
+        sizes = {'quote': ('bold', 54), 'quote_small': ('bold', 42), 'author': ('regular', 30),
+                 'footer': ('regular', 26)}
+        for bold, regular in FONT_CANDIDATES:
+            paths = {'bold': bold, 'regular': regular}
+            if font_folder:
+                paths = {weight: os.path.join(font_folder, path) for weight, path in paths.items()}
+            if not all(os.path.exists(path) for path in paths.values()):
+                continue
+            try:
+                fonts = {name: ImageFont.truetype(paths[weight], size) for name, (weight, size) in sizes.items()}
+                return os.path.basename(bold), fonts
+            except OSError as e:
+                print(f"폰트 로드 오류 ({bold}): {e}")
+        print("한글 폰트를 찾지 못했습니다. OG 카드의 한글이 깨질 수 있습니다 (FONT_SETUP.md 참고)")
+        try:
+            return 'default', {name: ImageFont.load_default(size) for name, (_, size) in sizes.items()}
+        except TypeError:
+            # Pillow 10.1 미만은 기본 폰트 크기를 지정할 수 없음
+            return 'default', {name: ImageFont.load_default() for name in sizes}
+
+    @classmethod
+    def cache_key(cls, content: CardContent) -> str:
+        """(명언/컬러 이름 해시, 컬러, 템플릿 버전) 캐시 키 (같은 키면 같은 이미지이므로 ETag로도 사용)"""
+        # 카드에 그리는 글자(명언, 저자, 컬러 이름)는 모두 해시에 포함
+        quote_hash = hashlib.md5(
+            f'{content.text}\n{content.author}\n{content.color_name}'.encode('utf-8')
+        ).hexdigest()[:16]
+        return f'{quote_hash}-{content.color_hex.lstrip("#").lower()}-v{cls.TEMPLATE_VERSION}'
+
+    def render(self, content: CardContent) -> Tuple[bytes, str]:
+        """
+        카드 PNG 반환 (메모리 -> 디스크 -> 새로 그리기)
+
+        Returns:
+            (PNG 바이트, 캐시 키)
+
+        Raises:
+            RenderBusy: 동시 렌더링 수가 가득 차서 기다리는 시간 안에 차례가 오지 않을 때
+        """
+        key = self.cache_key(content)
+        data = self._memory_get(key)
+        if data is not None:
+            return data, key
+
+        data = self._disk_get(key)
+        if data is not None:
+            self._memory_set(key, data)
+            return data, key
+
+        wait = self.render_wait
+        left = remaining()
+        if left is not None:
+            wait = max(min(wait, left), 0)
+        if not self._semaphore.acquire(timeout=wait):
+            with self._lock:
+                self._stats['busy'] += 1
+            raise RenderBusy(f"OG 카드 렌더링 대기 시간 초과 ({wait:.2f}초)")
+        try:
+            # 기다리는 동안 같은 카드를 다른 요청이 그렸을 수 있음
+            data = self._memory_get(key, count=False)
+            if data is None:
+                start = time.perf_counter()
+                data = self._draw(content)
+                with self._lock:
+                    self._stats['renders'] += 1
+                    self._stats['render_seconds'] += time.perf_counter() - start
+                self._memory_set(key, data)
+                self._disk_set(key, data)
+        finally:
+            self._semaphore.release()
+        return data, key
+
+    def _memory_get(self, key: str, count: bool = True) -> Optional[bytes]:
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                if count:
+                    self._stats['memory_hits'] += 1
+            return data
+
+    def _memory_set(self, key: str, data: bytes):
+        with self._lock:
+            self._memory[key] = data
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    def _disk_path(self, key: str) -> Optional[str]:
+        return os.path.join(self.cache_folder, f'{key}.png') if self.cache_folder else None
+
+    def _disk_get(self, key: str) -> Optional[bytes]:
+        path = self._disk_path(key)
+        if path is None:
+            return None
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            # 수정 시각을 마지막 사용 시각으로 사용 (정리 시 오래 안 쓴 파일부터 삭제)
+            os.utime(path)
+        except OSError:
+            return None
+        with self._lock:
+            self._stats['disk_hits'] += 1
+        return data
+
+    def _disk_set(self, key: str, data: bytes):
+        path = self._disk_path(key)
+        if path is None:
+            return
+        temp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"OG 카드 저장 오류: {e}")
+            return
+        with self._lock:
+            self._writes += 1
+            prune = self._writes % self.PRUNE_EVERY == 0
+        if prune:
+            self.prune()
+
+    def prune(self) -> int:
+        """디스크 캐시가 disk_max_files를 넘으면 오래 안 쓴 파일부터 90%까지 삭제"""
+        if not self.cache_folder:
+            return 0
+        files = []
+        with os.scandir(self.cache_folder) as entries:
+            for entry in entries:
+                if entry.name.endswith('.png'):
+                    try:
+                        files.append((entry.stat().st_mtime, entry.path))
+                    except OSError:
+                        continue
+        if len(files) <= self.disk_max_files:
+            return 0
+        files.sort()
+        removed = 0
+        for _, path in files[:len(files) - int(self.disk_max_files * 0.9)]:
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def _wrap(self, draw, text: str, font, max_width: int) -> List[str]:
+        """단어 단위 줄바꿈 (한 단어가 한 줄보다 길면 글자 단위)"""
+        lines, line = [], ''
+        for word in text.split():
+            candidate = f'{line} {word}' if line else word
+            if draw.textlength(candidate, font=font) <= max_width:
+                line = candidate
+                continue
+            if line:
+                lines.append(line)
+            line = ''
+            for char in word:
+                if line and draw.textlength(line + char, font=font) > max_width:
+                    lines.append(line)
+                    line = ''
+                line += char
+        if line:
+            lines.append(line)
+        return lines
+
+    def _fit_quote(self, draw, text: str, max_width: int, max_height: int):
+        """명언이 들어가는 폰트와 줄 목록 (작은 폰트로도 넘치면 마지막 줄 말줄임)"""
+        for name in ('quote', 'quote_small'):
+            font = self.fonts[name]
+            line_height = int(font.size * 1.45)
+            lines = self._wrap(draw, text, font, max_width)
+            if len(lines) * line_height <= max_height:
+                return font, line_height, lines
+        max_lines = max(max_height // line_height, 1)
+        lines = lines[:max_lines]
+        last = lines[-1]
+        while last and draw.textlength(last + '…', font=font) > max_width:
+            last = last[:-1]
+        lines[-1] = last + '…'
+        return font, line_height, lines
+
+    def _draw(self, content: CardContent) -> bytes:
+        """카드 그리기: 컬러 배경 위 흰 패널에 명언/작가, 아래에 컬러 이름과 사이트 이름"""
+        color = _parse_hex(content.color_hex) or _parse_hex(DEFAULT_COLOR)
+        image = Image.new('RGB', (self.WIDTH, self.HEIGHT), color)
+        draw = ImageDraw.Draw(image)
+
+        left, top = self.MARGIN, self.MARGIN
+        right, bottom = self.WIDTH - self.MARGIN, self.HEIGHT - self.MARGIN
+        draw.rounded_rectangle((left, top, right, bottom), radius=32, fill=(255, 255, 255))
+        draw.rounded_rectangle((left + 36, top + 56, left + 48, bottom - 110), radius=6, fill=color)
+
+        text_left = left + self.PADDING + 24
+        text_width = right - self.PADDING - text_left
+        author_font, footer_font = self.fonts['author'], self.fonts['footer']
+        quote_area = (bottom - 110) - (top + 56) - int(author_font.size * 1.8)
+        font, line_height, lines = self._fit_quote(draw, content.text, text_width, quote_area)
+
+        y = top + 56
+        for line in lines:
+            draw.text((text_left, y), line, font=font, fill=(45, 52, 54))
+            y += line_height
+        if content.author:
+            draw.text((text_left, y + 12), f'- {content.author}', font=author_font, fill=(99, 110, 114))
+
+        footer_y = bottom - 78
+        draw.ellipse((text_left, footer_y + 2, text_left + 28, footer_y + 30), fill=color)
+        if content.color_name:
+            draw.text((text_left + 44, footer_y), f'오늘의 컬러 {content.color_name}',
+                      font=footer_font, fill=(99, 110, 114))
+        site_width = draw.textlength(SITE_NAME, font=footer_font)
+        draw.text((right - self.PADDING - site_width, footer_y), SITE_NAME, font=footer_font, fill=(178, 190, 195))
+
+        output = BytesIO()
+        image.save(output, 'PNG', compress_level=6)
+        return output.getvalue()
+
+    def stats(self) -> Dict:
+        """캐시/렌더링 통계"""
+        with self._lock:
+            renders = self._stats['renders']
+            return dict(self._stats, memory_cached=len(self._memory), font=self.font_name,
+                        render_seconds=round(self._stats['render_seconds'], 3),
+                        avg_render_ms=round(self._stats['render_seconds'] / renders * 1000, 1) if renders else None)
+
+
+if __name__ == '__main__':
+    # 벤치마크: 새로 그리기 / 메모리 캐시 / 디스크 캐시(다른 워커, 재시작) 지연 시간
+    import tempfile
+
+    def percentile(samples, p):
+        samples = sorted(samples)
+        return samples[min(int(len(samples) * p), len(samples) - 1)] * 1000
+
+    base = os.path.dirname(os.path.abspath(__file__))
+    folder = tempfile.mkdtemp()
+    renderer = OgCardRenderer(folder, os.path.join(base, 'static', 'fonts'))
+    print(f"폰트: {renderer.font_name}")
+
+    contents = [CardContent(f'오늘 하루도 충분히 잘하고 있어요. 작은 걸음이 모여 큰 길이 됩니다 #{i}',
+                            '작자 미상', '#FF6B6B', '빨간색') for i in range(40)]
+    contents.append(CardContent('A' * 40 + ' ' + 'long words ' * 60, 'Someone', '#87CEEB', '하늘색'))
+
+    def measure(target, items):
+        samples = []
+        for content in items:
+            start = time.perf_counter()
+            target.render(content)
+            samples.append(time.perf_counter() - start)
+        return samples
+
+    miss = measure(renderer, contents)
+    hit = measure(renderer, contents * 5)
+    other = OgCardRenderer(folder, os.path.join(base, 'static', 'fonts'))
+    disk = measure(other, contents)
+    for label, samples in (('새로 그리기', miss), ('메모리 캐시', hit), ('디스크 캐시', disk)):
+        print(f"{label}: p50 {percentile(samples, 0.5):.3f}ms, p99 {percentile(samples, 0.99):.3f}ms")
+    assert renderer.stats()['renders'] == len(contents) and other.stats()['renders'] == 0
+
+    # 같은 내용이면 같은 이미지, 컬러가 다르면 다른 키
+    data, key = renderer.render(contents[0])
+    assert key == OgCardRenderer.cache_key(contents[0])
+    assert key != OgCardRenderer.cache_key(contents[0]._replace(color_hex='#87CEEB'))
+    with Image.open(BytesIO(data)) as image:
+        assert image.size == (OgCardRenderer.WIDTH, OgCardRenderer.HEIGHT)
+
+    # 동시 렌더링 제한: 차례가 오지 않으면 RenderBusy
+    busy = OgCardRenderer(max_concurrent=1, render_wait=0.05)
+    busy._semaphore.acquire()
+    try:
+        busy.render(contents[1])
+        raise AssertionError('RenderBusy 예상')
+    except RenderBusy:
+        pass
+    busy._semaphore.release()
+
+    # 디스크 캐시 크기 제한
+    small = OgCardRenderer(tempfile.mkdtemp(), memory_size=4, disk_max_files=20)
+    small.PRUNE_EVERY = 10
+    measure(small, contents[:30])
+    assert len(os.listdir(small.cache_folder)) <= 20 and len(small._memory) == 4
+
+    url = ('https://example.com/?birth_date=1990-05-15&quote_text=%25EC%2598%25A4%25EB%258A%2598+x'
+           '&quote_author=A&color_name=%25ED%2595%2598%25EB%258A%2598&color_hex=%2387CEEB')
+    content, birth_date = content_from_share_url(url)
+    assert content == CardContent('오늘 x', 'A', '#87CEEB', '하늘') and birth_date == '1990-05-15', content
+    print(f"통계: {renderer.stats()}")
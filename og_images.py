@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""
+OG 이미지 변환본 모듈
+원본 OG 이미지를 최적화된 PNG/WebP/JPEG 변환본으로 한 번만 만들어 메모리에 두고,
+Accept 헤더에 맞는 변환본을 내용 해시 ETag와 함께 반환.
+변환본은 디스크(data/og_cache)에도 저장하여 재시작이나 다른 워커는 다시 인코딩하지 않음
+(배포 시 미리 생성: python og_images.py build)
+"""
+import hashlib
+import os
+import threading
+from io import BytesIO
+from typing import Dict, NamedTuple, Optional
+
+# PIL 임포트 (선택적)
+try:
+    from PIL import Image
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+    print("PIL/Pillow가 설치되지 않았습니다. OG 이미지는 원본 그대로 반환합니다.")
+
+
+class OgImageVariant(NamedTuple):
+    """인코딩된 OG 이미지 변환본"""
+    format: str  # 'png' / 'webp' / 'jpeg'
+    mimetype: str
+    data: bytes
+    etag: str  # 내용 해시
+
+
+class OgImageStore:
+    """OG 이미지 변환본 저장소 (메모리, 디스크 캐시)"""
+
+    # 인코딩 설정을 바꾸면 올려서 디스크 캐시를 무효화
+    PIPELINE_VERSION = 1
+
+    MIMETYPES = {'png': 'image/png', 'webp': 'image/webp', 'jpeg': 'image/jpeg'}
+    EXTENSIONS = {'png': 'png', 'webp': 'webp', 'jpeg': 'jpg'}
+
+    # 원본이 없을 때 만드는 기본 이미지
+    FALLBACK_SIZE = (1200, 630)
+    FALLBACK_COLOR = '#f8f9fa'
+
+    def __init__(self, source_path: str, cache_folder: Optional[str] = None,
+                 webp_quality: int = 85, jpeg_quality: int = 85):
+        """
+        Args:
+            source_path: 원본 이미지 경로 (없으면 기본 이미지 생성)
+            cache_folder: 변환본 디스크 캐시 폴더 (None이면 메모리에만)
+            webp_quality: WebP 품질
+            jpeg_quality: JPEG 품질
+        """
+        self.source_path = source_path
+        self.cache_folder = cache_folder
+        self.webp_quality = webp_quality
+        self.jpeg_quality = jpeg_quality
+        self.original_size = 0
+        self._variants: Dict[str, OgImageVariant] = {}
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = {'requests': 0, 'not_modified': 0, 'bytes_served': 0, 'bytes_saved': 0}
+        self._served: Dict[str, int] = {}
+
+    @staticmethod
+    def _content_etag(data: bytes) -> str:
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def variants(self) -> Dict[str, OgImageVariant]:
+        """변환본 반환 (처음 호출 시 디스크 캐시에서 읽거나 인코딩)"""
+        if not self._variants:
+            with self._lock:
+                if not self._variants:
+                    self._variants = self._build()
+        return self._variants
+
+    def warm_async(self):
+        """백그라운드 스레드에서 변환본 준비 (첫 요청이 인코딩을 기다리지 않도록)"""
+        def run():
+            try:
+                self.variants()
+            except Exception as e:
+                print(f"OG 이미지 변환본 생성 오류: {e}")
+
+        threading.Thread(target=run, name='og-images', daemon=True).start()
+
+    def _build(self) -> Dict[str, OgImageVariant]:
+        """원본(또는 기본 이미지)에서 변환본 생성"""
+        if os.path.exists(self.source_path):
+            with open(self.source_path, 'rb') as f:
+                source = f.read()
+        elif HAS_PIL:
+            # 기본 이미지는 한 번만 만들어 변환본으로 보관
+            output = BytesIO()
+            Image.new('RGB', self.FALLBACK_SIZE, color=self.FALLBACK_COLOR).save(output, 'PNG', optimize=True)
+            source = output.getvalue()
+        else:
+            return {}
+        self.original_size = len(source)
+
+        if not HAS_PIL:
+            # 인코딩할 수 없으면 원본 그대로
+            return {'png': OgImageVariant('png', 'image/png', source, self._content_etag(source))}
+
+        source_key = hashlib.blake2b(source, digest_size=8).hexdigest()
+        variants = {}
+        image = None
+        for fmt in ('png', 'webp', 'jpeg'):
+            data = self._read_cache(source_key, fmt)
+            if data is None:
+                if image is None:
+                    image = Image.open(BytesIO(source))
+                    image.load()
+                data = self._encode(image, fmt)
+                # 최적화 결과가 원본보다 크면 원본 사용 (PNG)
+                if fmt == 'png' and len(data) >= len(source):
+                    data = source
+                self._write_cache(source_key, fmt, data)
+            variants[fmt] = OgImageVariant(fmt, self.MIMETYPES[fmt], data, self._content_etag(data))
+        return variants
+
+    def _encode(self, image, fmt: str) -> bytes:
+        """한 가지 형식으로 인코딩"""
+        output = BytesIO()
+        if fmt == 'png':
+            # 알파 채널이 모두 불투명이면 제거하여 크기 절약
+            if image.mode == 'RGBA' and image.getchannel('A').getextrema() == (255, 255):
+                image = image.convert('RGB')
+            image.save(output, 'PNG', optimize=True)
+        elif fmt == 'webp':
+            image.save(output, 'WEBP', quality=self.webp_quality, method=6)
+        else:
+            # JPEG는 알파 채널이 없으므로 흰 배경에 합성
+            if image.mode in ('RGBA', 'LA', 'P'):
+                rgba = image.convert('RGBA')
+                background = Image.new('RGB', rgba.size, (255, 255, 255))
+                background.paste(rgba, mask=rgba.getchannel('A'))
+                image = background
+            image.save(output, 'JPEG', quality=self.jpeg_quality, optimize=True, progressive=True)
+        return output.getvalue()
+
+    def _cache_path(self, source_key: str, fmt: str) -> Optional[str]:
+        if not self.cache_folder:
+            return None
+        return os.path.join(self.cache_folder,
+                            f'og_{source_key}_v{self.PIPELINE_VERSION}.{self.EXTENSIONS[fmt]}')
+
+    def _read_cache(self, source_key: str, fmt: str) -> Optional[bytes]:
+        path = self._cache_path(source_key, fmt)
+        if path is None or not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def _write_cache(self, source_key: str, fmt: str, data: bytes):
+        path = self._cache_path(source_key, fmt)
+        if path is None:
+            return
+        os.makedirs(self.cache_folder, exist_ok=True)
+        # 다른 워커가 읽는 중에도 완전한 파일만 보이도록 임시 파일 후 교체
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+    def choose(self, accept_mimetypes) -> Optional[OgImageVariant]:
+        """
+        Accept 헤더에 맞는 변환본 선택
+        WebP는 명시적으로 받는 클라이언트에만, 그 외에는 PNG (og:image:type과 같은 형식),
+        PNG를 받지 않고 JPEG만 받는 클라이언트에는 JPEG
+
+        Args:
+            accept_mimetypes: werkzeug MIMEAccept (request.accept_mimetypes)
+        """
+        variants = self.variants()
+        if not variants:
+            return None
+        explicit = {value for value, quality in accept_mimetypes if quality > 0}
+        if 'image/webp' in explicit and 'webp' in variants:
+            return variants['webp']
+        if not accept_mimetypes or accept_mimetypes.quality('image/png') > 0 or 'jpeg' not in variants:
+            return variants['png']
+        if accept_mimetypes.quality('image/jpeg') > 0:
+            return variants['jpeg']
+        return variants['png']
+
+    def record(self, variant: OgImageVariant, not_modified: bool = False) -> int:
+        """
+        응답 통계 기록
+
+        Returns:
+            원본 대비 절약한 바이트 수
+        """
+        served = 0 if not_modified else len(variant.data)
+        saved = max(self.original_size - served, 0)
+        with self._stats_lock:
+            self._stats['requests'] += 1
+            self._stats['not_modified'] += int(not_modified)
+            self._stats['bytes_served'] += served
+            self._stats['bytes_saved'] += saved
+            self._served[variant.format] = self._served.get(variant.format, 0) + 1
+        return saved
+
+    def stats(self) -> Dict:
+        """변환본 크기와 응답 통계"""
+        variants = self._variants
+        with self._stats_lock:
+            return dict(
+                self._stats,
+                served_by_format=dict(self._served),
+                original_bytes=self.original_size,
+                variant_bytes={fmt: len(variant.data) for fmt, variant in variants.items()}
+            )
+
+
+if __name__ == '__main__':
+    # 명령행: 변환본 미리 생성(build) / 크기와 선택 확인(check)
+    import argparse
+    import tempfile
+    import time
+    from werkzeug.datastructures import MIMEAccept
+    from werkzeug.http import parse_accept_header
+
+    base = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description='OG 이미지 변환본')
+    parser.add_argument('command', choices=('build', 'check'))
+    parser.add_argument('--source', default=os.path.join(base, 'static', 'images', 'og_image.png'))
+    parser.add_argument('--cache', default=os.path.join('data', 'og_cache'))
+    args = parser.parse_args()
+
+    cache_folder = args.cache if args.command == 'build' else tempfile.mkdtemp()
+    store = OgImageStore(args.source, cache_folder)
+    start = time.perf_counter()
+    store.variants()
+    print(f"변환본 생성: {time.perf_counter() - start:.2f}초")
+    print(f"원본 {store.original_size:,}B -> " +
+          ', '.join(f"{fmt} {size:,}B" for fmt, size in store.stats()['variant_bytes'].items()))
+
+    if args.command == 'check':
+        # 디스크 캐시가 있으면 인코딩 없이 로드
+        start = time.perf_counter()
+        OgImageStore(args.source, cache_folder).variants()
+        print(f"디스크 캐시 로드: {(time.perf_counter() - start) * 1000:.1f}ms")
+
+        def accept(header):
+            return parse_accept_header(header, MIMEAccept)
+
+        assert store.choose(accept('image/webp,image/apng,image/*,*/*;q=0.8')).format == 'webp'
+        assert store.choose(accept('*/*')).format == 'png'
+        assert store.choose(accept('')).format == 'png'
+        assert store.choose(accept('image/jpeg')).format == 'jpeg'
+        # 원본이 없으면 기본 이미지를 한 번만 생성
+        fallback = OgImageStore(os.path.join(cache_folder, 'missing.png'))
+        assert fallback.variants() is fallback.variants()
+        print(f"검증 통과 (기본 이미지 PNG {len(fallback.variants()['png'].data)}B)")
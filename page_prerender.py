@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+메인 페이지 서버 렌더링 모듈
+쿠키의 사용자 ID로 오늘의 /api/daily 응답을 서버에서 미리 계산하여 index.html에 JSON으로 넣고,
+프런트엔드는 이 데이터로 바로 화면을 그림 (/api/birthday, /api/daily 왕복 두 번 생략).
+렌더링한 페이지는 (사용자, KST 날짜) 단위로 캐시 (PRERENDER_INDEX=1일 때만)
+
+벤치마크 (첫 화면 표시까지의 시간, 왕복 지연 가정):
+    python page_prerender.py
+"""
+import json
+import re
+from typing import Optional
+
+from markupsafe import Markup
+
+# 프런트엔드(app.js)가 저장하는 사용자 ID 쿠키
+USER_COOKIE = 'user_id'
+
+# 파일 이름에 쓰이므로 안전한 문자만 허용 (app.js는 'user_<타임스탬프>' 형식)
+_USER_ID = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
+
+# <script> 안에 넣을 JSON에서 태그/엔티티로 해석될 수 있는 문자
+_HTML_UNSAFE = {'<': '\\u003c', '>': '\\u003e', '&': '\\u0026', '\u2028': '\\u2028', '\u2029': '\\u2029'}
+_HTML_UNSAFE_PATTERN = re.compile('[<>&\u2028\u2029]')
+
+
+def user_id_from_cookie(value: Optional[str]) -> Optional[str]:
+    """쿠키 값이 올바른 사용자 ID면 반환 (아니면 None)"""
+    if value and _USER_ID.match(value):
+        return value
+    return None
+
+
+def initial_data(user_id: str, birth_date: Optional[str], daily_body: Optional[bytes]) -> Markup:
+    """
+    페이지에 넣을 초기 데이터 JSON (<script type="application/json"> 안에 그대로 넣을 수 있게 이스케이프)
+
+    Args:
+        user_id: 사용자 ID (프런트엔드가 자신의 ID와 같을 때만 사용)
+        birth_date: 저장된 생년월일 (없으면 None -> 생년월일 입력 화면)
+        daily_body: 직렬화된 /api/daily 응답 본문 (다시 직렬화하지 않고 그대로 삽입)
+    """
+    text = '{"user_id":%s,"birth_date":%s,"daily":%s}' % (
+        json.dumps(user_id), json.dumps(birth_date),
+        daily_body.decode('utf-8').strip() if daily_body else 'null'
+    )
+    return Markup(_HTML_UNSAFE_PATTERN.sub(lambda m: _HTML_UNSAFE[m.group()], text))
+
+
+if __name__ == '__main__':
+    # 첫 화면 표시까지의 시간(TTFC) 비교: 기존(HTML -> 자산 -> /api/birthday -> /api/daily) vs
+    # 서버 렌더링(HTML -> 자산). 서버 처리 시간은 테스트 클라이언트로 측정하고 왕복 지연은 가정값 사용
+    import os
+    import shutil
+    import statistics
+    import tempfile
+    import time
+
+    os.environ.setdefault('DAILY_TABLE', '0')
+    os.environ.setdefault('SHOPPING_CATALOG', '0')
+    os.environ['PRERENDER_INDEX'] = '1'
+    folder = tempfile.mkdtemp()
+    cwd = os.getcwd()
+    os.chdir(folder)  # data/ 폴더를 임시 폴더에 생성
+    shutil.copytree(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures'), 'fixtures')
+    try:
+        import app as app_module
+        from quote_ingest import FixtureTransport, ingest
+
+        ingest(app_module.quote_fetcher.store, FixtureTransport(os.path.join('fixtures', 'quotes')))
+        client = app_module.app.test_client()
+
+        def timed(method, path, **kwargs):
+            start = time.perf_counter()
+            response = getattr(client, method)(path, **kwargs)
+            return time.perf_counter() - start, response
+
+        def run(users, prerender, register):
+            samples = []
+            for i in range(users):
+                user_id = f'user_bench{i}_{int(prerender)}'
+                if register:
+                    client.post('/api/birthday', json={'user_id': user_id,
+                                                       'birth_date': f'19{70 + i % 30}-0{1 + i % 9}-15'})
+                client.set_cookie(USER_COOKIE, user_id)
+                html_time, page = timed('get', '/')
+                page_text = page.get_data(as_text=True)
+                if prerender:
+                    assert '"daily":{' in page_text, '서버 렌더링 데이터 없음'
+                    samples.append((html_time, 0.0, 0))
+                    continue
+                birthday_time, _ = timed('get', f'/api/birthday/{user_id}')
+                daily_time, response = timed('get', f'/api/daily?user_id={user_id}')
+                assert response.status_code == 200
+                samples.append((html_time, birthday_time + daily_time, 2))
+            return samples
+
+        settings = app_module.settings
+        for prerender in (False, True):
+            app_module.settings = settings._replace(prerender_index=prerender)
+            cold = run(30, prerender, register=True)
+            # 같은 날 다시 방문 (응답/페이지 캐시 적중)
+            warm = run(30, prerender, register=False)
+            for label, samples in (('첫 방문', cold), ('재방문', warm)):
+                server = statistics.median(html + api for html, api, _ in samples) * 1000
+                round_trips = 2 + samples[0][2]  # HTML + 자산(병렬) + API 왕복
+                mode = '서버 렌더링' if prerender else '기존'
+                for rtt in (50, 150):
+                    print(f"{mode} {label}: 서버 {server:.2f}ms + 왕복 {round_trips}회 x {rtt}ms "
+                          f"= TTFC 약 {server + round_trips * rtt:.0f}ms")
+        app_module.settings = settings
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(folder, ignore_errors=True)
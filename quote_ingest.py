@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+"""
+영어 명언 수집(ingestion) 모듈
+외부 명언 API(zenquotes, quotable)에서 명언을 묶음으로 받아 정규화하고 텍스트 해시로
+중복을 제거한 뒤, 출처 정보(provenance)와 함께 로컬 명언 저장소에 추가.
+요청 처리 중에는 로컬 저장소만 읽음 (외부 API는 수집 명령에서만 호출)
+
+파일 구성:
+- ingested_quotes.jsonl: 수집한 명언 (한 줄에 하나, 추가 전용)
+
+명령행:
+    python quote_ingest.py ingest                      # 외부 API에서 수집
+    python quote_ingest.py ingest --fixtures fixtures/quotes  # 기록된 응답으로 수집 (네트워크 없음)
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import unicodedata
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Tuple
+
+import pytz
+import requests
+
+from json_storage import file_lock
+from quote_corpus import QuoteRecord
+from resilience import get_breaker
+
+# 한국시간대 설정
+KST = pytz.timezone('Asia/Seoul')
+
+def get_kst_now():
+    """한국시간(KST) 기준 현재 시간 반환"""
+    return datetime.now(KST)
+
+
+class QuoteSource(NamedTuple):
+    """외부 명언 API 정의"""
+    name: str  # 외부 소스 이름 (서킷 브레이커/기록 응답 파일 이름)
+    label: str  # 응답의 source 값
+    url: str  # 묶음 조회 주소
+    parse: Callable[[Any], List[Tuple[str, str]]]  # 응답 -> [(text, author)]
+
+
+def _parse_zenquotes(data: Any) -> List[Tuple[str, str]]:
+    return [(item.get('q', ''), item.get('a', '')) for item in data or []]
+
+
+def _parse_quotable(data: Any) -> List[Tuple[str, str]]:
+    # /quotes/random?limit=N은 리스트, 예전 /random은 단일 객체
+    items = data if isinstance(data, list) else [data] if data else []
+    return [(item.get('content', ''), item.get('author', '')) for item in items]
+
+
+SOURCES = (
+    QuoteSource('zenquotes', 'Zen Quotes', 'https://zenquotes.io/api/quotes', _parse_zenquotes),
+    QuoteSource('quotable', 'Quotable', 'https://api.quotable.io/quotes/random?limit=50', _parse_quotable),
+)
+
+# 소스가 명언 대신 돌려주는 안내 문구의 작가 (호출량 초과 등)
+_SERVICE_AUTHORS = {'zenquotes.io'}
+
+_QUOTE_MARKS = '"\'“”‘’「」『』'
+_WHITESPACE = re.compile(r'\s+')
+
+# 너무 긴 문장은 카드에 맞지 않으므로 제외
+MAX_TEXT_LENGTH = 300
+
+
+def normalize_text(text: str) -> str:
+    """유니코드 정규화(NFC), 공백 정리, 앞뒤 따옴표 제거"""
+    text = unicodedata.normalize('NFC', text or '')
+    text = _WHITESPACE.sub(' ', text).strip()
+    return text.strip(_QUOTE_MARKS).strip()
+
+
+def text_hash(text: str) -> str:
+    """중복 판정용 텍스트 해시 (대소문자/공백/앞뒤 따옴표 무시)"""
+    return hashlib.md5(normalize_text(text).casefold().encode('utf-8')).hexdigest()[:16]
+
+
+class HttpTransport:
+    """외부 API 조회 (소스별 서킷 브레이커 적용)"""
+
+    def __init__(self, timeout: float = 10.0):
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'})
+
+    def get_json(self, source: QuoteSource) -> Any:
+        breaker = get_breaker(source.name)
+        if not breaker.allow():
+            raise ConnectionError(f"{source.name} 서킷 브레이커가 열려 있습니다")
+        try:
+            response = self.session.get(source.url, timeout=self.timeout)
+            response.raise_for_status()
+            data = response.json()
+        except Exception:
+            breaker.record_failure()
+            raise
+        breaker.record_success()
+        return data
+
+
+class FixtureTransport:
+    """기록된 응답 파일 조회 (테스트용, 네트워크 없음): {folder}/{source.name}.json"""
+
+    def __init__(self, folder: str):
+        self.folder = folder
+
+    def get_json(self, source: QuoteSource) -> Any:
+        with open(os.path.join(self.folder, f'{source.name}.json'), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+
+class IngestedQuoteStore:
+    """수집한 명언 저장소 (추가 전용 JSON Lines, 조회는 메모리 레코드)"""
+
+    # 다른 프로세스(수집 명령)가 추가한 내용 확인 간격(초)
+    RELOAD_CHECK_INTERVAL = 30.0
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 저장 파일 경로 (.jsonl)
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self._lock = threading.Lock()
+        self._records: Tuple[QuoteRecord, ...] = ()
+        self._ids: set = set()
+        self._file_state = None
+        self._next_reload_check = 0.0
+        self._reload()
+
+    def _reload(self):
+        """파일이 바뀌었으면 다시 읽기"""
+        self._next_reload_check = time.time() + self.RELOAD_CHECK_INTERVAL
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return
+        state = (st.st_ino, st.st_size, st.st_mtime_ns)
+        if state == self._file_state:
+            return
+
+        records, ids = [], set()
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                # 쓰는 중인 마지막 줄은 다음에 읽음
+                if not line.endswith('\n') or not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError as e:
+                    print(f"수집 명언 항목 오류: {e}")
+                    continue
+                if entry['id'] in ids:
+                    continue
+                ids.add(entry['id'])
+                records.append(QuoteRecord(text=entry['text'], author=entry['author'],
+                                           source=entry['source'], type=entry.get('type', 'quote')))
+        with self._lock:
+            self._records = tuple(records)
+            self._ids = ids
+            self._file_state = state
+
+    def records(self) -> Tuple[QuoteRecord, ...]:
+        """수집한 명언 레코드 (요청 처리 중 호출, 디스크 확인은 주기적으로만)"""
+        if time.time() >= self._next_reload_check:
+            self._reload()
+        return self._records
+
+    def append(self, entries: Iterable[Dict]) -> int:
+        """
+        새 명언 추가 (이미 있는 id는 건너뜀)
+
+        Args:
+            entries: {'id', 'text', 'author', 'source', 'type', 'provenance'} 딕셔너리
+
+        Returns:
+            추가한 개수
+        """
+        with file_lock(self.path):
+            # 다른 수집 작업이 먼저 추가했을 수 있으므로 잠금 안에서 최신 상태 확인
+            self._reload()
+            lines = []
+            ids = set(self._ids)
+            for entry in entries:
+                if entry['id'] in ids:
+                    continue
+                ids.add(entry['id'])
+                lines.append(json.dumps(entry, ensure_ascii=False) + '\n')
+            if not lines:
+                return 0
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, ''.join(lines).encode('utf-8'))
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            self._reload()
+        return len(lines)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+
+def ingest(store: IngestedQuoteStore, transport, sources: Iterable[QuoteSource] = SOURCES,
+           batches: int = 1) -> Dict[str, Dict]:
+    """
+    외부 소스에서 명언을 받아 정규화/중복 제거 후 저장소에 추가
+
+    Args:
+        store: 로컬 명언 저장소
+        transport: HttpTransport 또는 FixtureTransport
+        sources: 수집할 외부 소스
+        batches: 소스별 묶음 조회 횟수
+
+    Returns:
+        소스별 통계 {'fetched', 'rejected', 'duplicates', 'added', 'errors'}
+    """
+    stats = {}
+    for source in sources:
+        counts = {'fetched': 0, 'rejected': 0, 'duplicates': 0, 'added': 0, 'errors': 0}
+        stats[source.name] = counts
+        for _ in range(batches):
+            try:
+                data = transport.get_json(source)
+            except Exception as e:
+                print(f"{source.name} 수집 오류: {e}")
+                counts['errors'] += 1
+                break
+
+            fetched_at = get_kst_now().isoformat()
+            existing = {text_hash(record.text) for record in store.records()}
+            entries = []
+            for raw_text, raw_author in source.parse(data):
+                counts['fetched'] += 1
+                text = normalize_text(raw_text)
+                author = normalize_text(raw_author) or 'Unknown'
+                if not text or len(text) > MAX_TEXT_LENGTH or author in _SERVICE_AUTHORS:
+                    counts['rejected'] += 1
+                    continue
+                quote_id = text_hash(text)
+                if quote_id in existing:
+                    counts['duplicates'] += 1
+                    continue
+                existing.add(quote_id)
+                entries.append({
+                    'id': quote_id,
+                    'text': text,
+                    'author': author,
+                    'source': source.label,
+                    'type': 'quote',
+                    'provenance': {'upstream': source.name, 'url': source.url, 'fetched_at': fetched_at}
+                })
+            counts['added'] += store.append(entries)
+    return stats
+
+
+if __name__ == '__main__':
+    import argparse
+    import tempfile
+
+    parser = argparse.ArgumentParser(description='영어 명언 수집')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    ingest_parser = subparsers.add_parser('ingest', help='외부 명언 API에서 수집')
+    ingest_parser.add_argument('--store', default=os.path.join('data', 'ingested_quotes.jsonl'))
+    ingest_parser.add_argument('--fixtures', help='기록된 응답 폴더 (지정하면 네트워크를 쓰지 않음)')
+    ingest_parser.add_argument('--batches', type=int, default=1, help='소스별 묶음 조회 횟수')
+    subparsers.add_parser('check', help='기록된 응답으로 정규화/중복 제거 확인')
+    args = parser.parse_args()
+
+    if args.command == 'ingest':
+        store = IngestedQuoteStore(args.store)
+        transport = FixtureTransport(args.fixtures) if args.fixtures else HttpTransport()
+        for name, counts in ingest(store, transport, batches=args.batches).items():
+            print(f"{name}: {counts}")
+        print(f"저장소: {len(store)}개 ({args.store})")
+    else:
+        fixtures = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'quotes')
+        store = IngestedQuoteStore(os.path.join(tempfile.mkdtemp(), 'ingested_quotes.jsonl'))
+        stats = ingest(store, FixtureTransport(fixtures))
+        print(stats)
+        # 빈 문장/안내 문구/작가 없는 문장 처리, 소스 간 같은 문장은 한 번만
+        assert stats['zenquotes'] == {'fetched': 7, 'rejected': 2, 'duplicates': 0, 'added': 5, 'errors': 0}
+        assert stats['quotable'] == {'fetched': 5, 'rejected': 0, 'duplicates': 1, 'added': 4, 'errors': 0}
+        texts = {record.text: record for record in store.records()}
+        assert "It always seems impossible until it's done." in texts
+        assert 'The best time to plant a tree was 20 years ago. The second best time is now.' in texts
+        assert texts['What we think, we become.'].source == 'Quotable'
+        assert texts['In the middle of difficulty lies opportunity.'].author == 'Unknown'
+
+        # 다시 수집해도 추가되지 않음 (다른 인스턴스 = 다른 워커도 같은 내용)
+        again = ingest(store, FixtureTransport(fixtures))
+        assert all(counts['added'] == 0 for counts in again.values())
+        assert len(IngestedQuoteStore(store.path)) == 9
+        with open(store.path, encoding='utf-8') as f:
+            print(json.loads(f.readline())['provenance'])
+        print("검증 통과")
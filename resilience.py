@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+외부 API 호출 안정화 모듈
+- 외부 소스(upstream)별 서킷 브레이커: 연속 실패하면 일정 시간 호출하지 않고 바로 실패 처리
+- 요청 단위 기한(deadline): 요청 처리 중의 모든 외부 호출 타임아웃을 남은 시간 이내로 제한
+
+사용 예:
+    breaker = get_breaker('zenquotes')
+    with deadline(2.0):
+        if breaker.allow():
+            response = session.get(url, timeout=call_timeout(5))
+"""
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+
+class DeadlineExceeded(Exception):
+    """요청 기한이 지나 외부 호출을 시작하지 않음"""
+
+
+class CircuitBreaker:
+    """
+    외부 소스별 서킷 브레이커 (스레드 안전)
+
+    closed: 정상 호출, 연속 실패가 failure_threshold에 이르면 open
+    open: 호출하지 않음, reset_timeout초 뒤 half_open
+    half_open: 시험 호출 하나만 허용, 성공하면 closed / 실패하면 다시 open
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name: str, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        """
+        Args:
+            name: 외부 소스 이름
+            failure_threshold: open으로 바꿀 연속 실패 횟수
+            reset_timeout: open 상태 유지 시간(초)
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._probe_started = 0.0
+        self._lock = threading.Lock()
+        self._stats = {'successes': 0, 'failures': 0, 'rejected': 0, 'trips': 0}
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        """현재 상태 (open 유지 시간이 지났으면 half_open, 잠금 안에서 호출)"""
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def allow(self) -> bool:
+        """호출해도 되는지 확인 (half_open이면 시험 호출 하나만 허용)"""
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            # 시험 호출 결과가 기록되지 않은 채 reset_timeout이 지나면 다시 시험 호출 허용
+            if state == self.HALF_OPEN and (not self._probe_in_flight or
+                                            time.monotonic() - self._probe_started >= self.reset_timeout):
+                self._probe_in_flight = True
+                self._probe_started = time.monotonic()
+                return True
+            self._stats['rejected'] += 1
+            return False
+
+    def record_success(self):
+        """호출 성공 기록"""
+        with self._lock:
+            self._stats['successes'] += 1
+            self._consecutive_failures = 0
+            self._state = self.CLOSED
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        """호출 실패 기록 (연속 실패가 기준에 이르거나 시험 호출이 실패하면 open)"""
+        with self._lock:
+            self._stats['failures'] += 1
+            self._consecutive_failures += 1
+            state = self._current_state()
+            if state == self.HALF_OPEN or (state == self.CLOSED and
+                                           self._consecutive_failures >= self.failure_threshold):
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+                self._stats['trips'] += 1
+
+    def stats(self) -> Dict:
+        """상태/호출 통계"""
+        with self._lock:
+            state = self._current_state()
+            retry_in = None
+            if state == self.OPEN:
+                retry_in = round(self.reset_timeout - (time.monotonic() - self._opened_at), 1)
+            return dict(self._stats, state=state, consecutive_failures=self._consecutive_failures,
+                        retry_in=retry_in)
+
+
+# 외부 소스 이름 -> 서킷 브레이커 (프로세스 내 공유)
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name: str, failure_threshold: int = 3, reset_timeout: float = 30.0) -> CircuitBreaker:
+    """외부 소스의 서킷 브레이커 반환 (처음 요청할 때 생성, 이후 설정 인자는 무시)"""
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = _breakers[name] = CircuitBreaker(name, failure_threshold, reset_timeout)
+        return breaker
+
+
+def breaker_stats() -> Dict[str, Dict]:
+    """모든 서킷 브레이커의 상태/통계 (모니터링용)"""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.stats() for breaker in breakers}
+
+
+# 현재 요청의 기한 (time.monotonic() 기준, 없으면 None)
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar('deadline', default=None)
+
+# 이보다 적게 남았으면 외부 호출을 시작하지 않음(초)
+MIN_CALL_TIMEOUT = 0.05
+
+
+def start_deadline(seconds: float) -> contextvars.Token:
+    """
+    현재 컨텍스트에 기한 설정 (이미 더 이른 기한이 있으면 유지)
+    반환된 토큰을 clear_deadline()에 넘겨 해제
+    """
+    new_deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        new_deadline = min(new_deadline, current)
+    return _deadline.set(new_deadline)
+
+
+def clear_deadline(token: contextvars.Token):
+    """start_deadline()으로 설정한 기한 해제"""
+    _deadline.reset(token)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """with 구간 동안 기한 설정"""
+    token = start_deadline(seconds)
+    try:
+        yield
+    finally:
+        clear_deadline(token)
+
+
+def remaining() -> Optional[float]:
+    """기한까지 남은 시간(초), 기한이 없으면 None"""
+    current = _deadline.get()
+    if current is None:
+        return None
+    return current - time.monotonic()
+
+
+def call_timeout(default: float) -> float:
+    """
+    외부 호출 타임아웃 (기본값과 남은 시간 중 작은 값)
+
+    Raises:
+        DeadlineExceeded: 남은 시간이 MIN_CALL_TIMEOUT보다 적을 때
+    """
+    left = remaining()
+    if left is None:
+        return default
+    if left < MIN_CALL_TIMEOUT:
+        raise DeadlineExceeded(f"요청 기한 초과 (남은 시간 {left:.3f}초)")
+    return min(default, left)
+
+
+if __name__ == '__main__':
+    # 동작 확인: 브레이커 상태 전환, 기한 전파
+    breaker = CircuitBreaker('test', failure_threshold=2, reset_timeout=0.2)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN and not breaker.allow()
+    time.sleep(0.25)
+    assert breaker.allow() and not breaker.allow()  # half_open: 시험 호출 하나만
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    time.sleep(0.25)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    print(f"브레이커: {breaker.stats()}")
+
+    assert call_timeout(5) == 5
+    with deadline(1.0):
+        assert call_timeout(5) <= 1.0
+        with deadline(10.0):
+            assert call_timeout(5) <= 1.0  # 바깥 기한이 더 이르면 유지
+    try:
+        with deadline(0.0):
+            call_timeout(5)
+        raise AssertionError('DeadlineExceeded 예상')
+    except DeadlineExceeded:
+        pass
+    print("검증 통과")
@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+"""
+응답 캐시 모듈
+/api/daily의 직렬화된 JSON 응답을 (사용자, KST 날짜) 단위로 캐시하고 KST 자정에 만료.
+캐시 항목에는 저장 당시 생년월일/히스토리 버전을 함께 기록하여, 어느 워커에서든
+생년월일이나 히스토리가 바뀌면 다음 조회에서 자동으로 무효화
+
+캐시 백엔드 (교체 가능):
+- MemoryResponseCache: 프로세스 내 LRU
+- SqliteResponseCache: 워커 간 공유되는 로컬 SQLite 파일 (WAL 모드)
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+import pytz
+
+from storage_backend import StorageBackend
+
+# 한국시간대 설정
+KST = pytz.timezone('Asia/Seoul')
+
+def get_kst_now():
+    """한국시간(KST) 기준 현재 시간 반환"""
+    return datetime.now(KST)
+
+
+def next_kst_midnight(now: Optional[datetime] = None) -> datetime:
+    """다음 KST 자정 시각"""
+    now = now or get_kst_now()
+    return KST.localize(datetime.combine(now.date() + timedelta(days=1), datetime.min.time()))
+
+
+class ResponseCache:
+    """응답 캐시 백엔드 인터페이스"""
+
+    def get(self, key: str) -> Optional[Tuple[bytes, str]]:
+        """캐시된 (응답 본문, 버전) 반환 (없거나 만료되면 None)"""
+        raise NotImplementedError
+
+    def set(self, key: str, payload: bytes, version: str, expires_at: float):
+        """
+        응답 저장
+
+        Args:
+            key: 캐시 키
+            payload: 직렬화된 응답 본문
+            version: 검증용 버전 문자열
+            expires_at: 만료 시각 (epoch 초)
+        """
+        raise NotImplementedError
+
+
+class MemoryResponseCache(ResponseCache):
+    """프로세스 내 LRU 응답 캐시"""
+
+    def __init__(self, max_size: int = 10000):
+        """
+        Args:
+            max_size: 최대 항목 수 (초과 시 가장 오래 안 쓴 항목 제거)
+        """
+        self.max_size = max_size
+        self._entries: 'OrderedDict[str, Tuple[bytes, str, float]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Tuple[bytes, str]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            payload, version, expires_at = entry
+            if time.time() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload, version
+
+    def set(self, key: str, payload: bytes, version: str, expires_at: float):
+        with self._lock:
+            self._entries[key] = (payload, version, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SqliteResponseCache(ResponseCache):
+    """로컬 SQLite 응답 캐시 (여러 워커가 같은 파일 공유)"""
+
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            payload BLOB NOT NULL,
+            version TEXT NOT NULL,
+            expires_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_responses_expires_at ON responses (expires_at);
+    '''
+
+    # 이 횟수만큼 저장할 때마다 만료 항목 정리
+    PURGE_INTERVAL = 1000
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self._local = threading.local()
+        self._writes = 0
+        conn = self._connect()
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.executescript(self.SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """현재 스레드의 연결 반환 (없으면 생성)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None, cached_statements=64)
+            # 캐시는 잃어도 다시 계산하면 되므로 fsync 최소화
+            conn.execute('PRAGMA synchronous=OFF')
+            conn.execute('PRAGMA busy_timeout=30000')
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[Tuple[bytes, str]]:
+        row = self._connect().execute(
+            'SELECT payload, version FROM responses WHERE key = ? AND expires_at > ?', (key, time.time())
+        ).fetchone()
+        return (bytes(row[0]), row[1]) if row else None
+
+    def set(self, key: str, payload: bytes, version: str, expires_at: float):
+        conn = self._connect()
+        conn.execute(
+            'INSERT OR REPLACE INTO responses (key, payload, version, expires_at) VALUES (?, ?, ?, ?)',
+            (key, payload, version, expires_at)
+        )
+        self._writes += 1
+        if self._writes % self.PURGE_INTERVAL == 0:
+            conn.execute('DELETE FROM responses WHERE expires_at <= ?', (time.time(),))
+
+
+def create_response_cache(name: str = 'memory', data_folder: str = 'data',
+                          db_path: Optional[str] = None, max_size: int = 10000) -> ResponseCache:
+    """
+    응답 캐시 백엔드 생성
+
+    Args:
+        name: 'memory' 또는 'sqlite'
+        data_folder: 데이터 폴더
+        db_path: SQLite 파일 경로 (None이면 data_folder/response_cache.db)
+        max_size: 메모리 캐시 최대 항목 수
+    """
+    if name == 'memory':
+        return MemoryResponseCache(max_size)
+    if name == 'sqlite':
+        return SqliteResponseCache(db_path or os.path.join(data_folder, 'response_cache.db'))
+    raise ValueError(f"지원하지 않는 응답 캐시 백엔드입니다: {name} (memory 또는 sqlite)")
+
+
+class DailyResponseCache:
+    """(사용자, KST 날짜) 단위 /api/daily 응답 캐시 (서버 렌더링한 메인 페이지도 같은 규칙으로 캐시)"""
+
+    def __init__(self, cache: ResponseCache, storage: StorageBackend, prefix: str = 'daily'):
+        """
+        Args:
+            cache: 응답 캐시 백엔드
+            storage: 저장소 백엔드 (생년월일/히스토리 버전 확인용)
+            prefix: 캐시 키 접두어 (같은 백엔드를 여러 용도로 쓸 때 구분)
+        """
+        self.cache = cache
+        self.storage = storage
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, user_id: str, date_str: str) -> str:
+        return f'{self.prefix}:{date_str}:{user_id}'
+
+    def version(self, user_id: str) -> str:
+        """생년월일/히스토리 버전 (둘 중 하나라도 바뀌면 다른 값)"""
+        return json.dumps(
+            [self.storage.birthday_version(user_id), self.storage.history_version(user_id)],
+            ensure_ascii=False, sort_keys=True, default=str
+        )
+
+    def get(self, user_id: str, date_str: str, variant: str = '') -> Optional[bytes]:
+        """
+        캐시된 응답 본문 반환 (없거나 생년월일/히스토리가 바뀌었으면 None)
+
+        Args:
+            variant: 본문을 결정하는 그 밖의 값 (저장할 때와 다르면 None, 예: 페이지 URL/템플릿 버전)
+        """
+        entry = self.cache.get(self._key(user_id, date_str))
+        if entry is not None:
+            payload, version = entry
+            if version == self.version(user_id) + variant:
+                self.hits += 1
+                return payload
+        self.misses += 1
+        return None
+
+    def set(self, user_id: str, date_str: str, payload: bytes, variant: str = ''):
+        """
+        응답 저장 (히스토리 저장이 끝난 뒤 호출해야 현재 버전이 기록됨)
+        만료는 다음 KST 자정
+        """
+        self.cache.set(self._key(user_id, date_str), payload, self.version(user_id) + variant,
+                       next_kst_midnight().timestamp())
+
+    def stats(self) -> Dict:
+        """캐시 적중/실패 통계"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 4) if total else 0.0
+        }
+
+
+if __name__ == '__main__':
+    # 워커 간 무효화 확인: 두 캐시 인스턴스(=두 워커)가 같은 SQLite 캐시와 저장소를 공유
+    import tempfile
+    from storage_backend import JsonFileBackend
+
+    folder = tempfile.mkdtemp()
+    storage = JsonFileBackend(folder)
+    storage.save_birthday('u1', {'birth_date': '1990-05-15'})
+    worker_a = DailyResponseCache(SqliteResponseCache(os.path.join(folder, 'cache.db')), storage)
+    worker_b = DailyResponseCache(SqliteResponseCache(os.path.join(folder, 'cache.db')), storage)
+
+    worker_a.set('u1', '2025-06-15', b'{"data":1}')
+    assert worker_b.get('u1', '2025-06-15') == b'{"data":1}'
+    assert worker_b.get('u1', '2025-06-16') is None
+
+    # 다른 워커가 히스토리를 바꾸면 무효화
+    storage.save_history('u1', {'viewed_quotes': ['x']})
+    assert worker_a.get('u1', '2025-06-15') is None
+
+    # 메모리 캐시도 버전 확인으로 같은 방식으로 무효화
+    memory = DailyResponseCache(MemoryResponseCache(), storage)
+    memory.set('u1', '2025-06-15', b'{"data":2}')
+    assert memory.get('u1', '2025-06-15') == b'{"data":2}'
+    storage.save_birthday('u1', {'birth_date': '1991-01-01'})
+    assert memory.get('u1', '2025-06-15') is None
+
+    start = time.perf_counter()
+    memory.set('u1', '2025-06-15', b'{"data":3}')
+    for _ in range(10000):
+        memory.get('u1', '2025-06-15')
+    print(f"검증 통과 / 메모리 캐시 조회 평균 {(time.perf_counter() - start) / 10000 * 1e6:.1f}us")
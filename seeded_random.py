@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+시드 기반 결정적 선택 모듈
+전역 random.seed() 대신 호출마다 독립된 random.Random 인스턴스를 사용하여
+멀티스레드 워커에서도 같은 시드는 항상 같은 결과를 보장
+"""
+import hashlib
+
+
+def seed_to_int(seed_str: str) -> int:
+    """시드 문자열을 MD5 해시하여 정수로 변환"""
+    return int(hashlib.md5(seed_str.encode()).hexdigest(), 16)
+
+
+if __name__ == '__main__':
+    # 동시성 테스트: 64개 스레드에서 동시에 호출해도 순차 호출과 결과가 같아야 함
+    from concurrent.futures import ThreadPoolExecutor
+    from quote_fetcher import QuoteFetcher
+    from shopping_suggester import ShoppingSuggester
+
+    fetcher = QuoteFetcher()
+    shopping = ShoppingSuggester()
+    cases = [(f'2025-{m:02d}-{d:02d}', f'19{80 + m}-{m:02d}-{d:02d}') for m in range(1, 13) for d in (1, 15, 28)]
+
+    def run(case):
+        date_str, birth_date = case
+        return (
+            fetcher.fetch_daily_quote(date_str, birth_date)['text'],
+            fetcher.fetch_random_quote(birth_date, date_str)['text'],
+            shopping.suggest_shopping_items(birth_date, date_str)[0]['search_query'],
+        )
+
+    expected = [run(case) for case in cases]
+    with ThreadPoolExecutor(max_workers=64) as executor:
+        for _ in range(20):
+            assert list(executor.map(run, cases * 4)) == expected * 4
+    print(f"동시성 테스트 통과: {len(cases) * 4 * 20}회 병렬 호출")
@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+"""
+쇼핑 상품 카탈로그 스냅숏 모듈
+추천될 수 있는 검색어는 SHOPPING_ITEMS의 닫힌 집합(약 120개)이므로, 백그라운드에서
+모든 검색어의 상품 정보를 미리 받아 로컬 스냅숏 파일에 저장하고 요청 처리 중에는
+스냅숏만 조회 (네이버 API 호출/타임아웃이 /api/daily 응답 경로에서 빠짐)
+
+- stale-while-revalidate: 스냅숏이 오래되어도 그대로 응답하고 갱신은 백그라운드에서
+- 갱신 중 API 호출이 실패한 검색어는 이전 상품 정보를 유지
+- 여러 워커 중 한 곳만 갱신하고 (파일 잠금), 다른 워커는 파일이 바뀌면 다시 읽음
+"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+import pytz
+
+from config import Settings, load_settings
+from json_storage import atomic_write_json, file_lock, read_json
+from naver_shopping_client import NaverShoppingClient
+
+# 한국시간대 설정
+KST = pytz.timezone('Asia/Seoul')
+
+def get_kst_now():
+    """한국시간(KST) 기준 현재 시간 반환"""
+    return datetime.now(KST)
+
+
+class ShoppingCatalog:
+    """검색어별 상품 정보 스냅숏 (조회는 메모리에서만, 갱신은 백그라운드)"""
+
+    # 다른 워커가 쓴 스냅숏 파일 변경 확인 간격(초)
+    RELOAD_CHECK_INTERVAL = 5.0
+
+    # 갱신이 모두 실패했을 때 다시 시도하기까지의 대기 시간(초)
+    RETRY_INTERVAL = 300.0
+
+    def __init__(self, client: NaverShoppingClient, snapshot_path: str, queries: Iterable[str],
+                 max_age: float = 6 * 3600, workers: int = 4):
+        """
+        Args:
+            client: 네이버 쇼핑 클라이언트 (호출량 제한은 클라이언트가 담당)
+            snapshot_path: 스냅숏 JSON 파일 경로
+            queries: 미리 받아 둘 검색어 목록
+            max_age: 스냅숏 갱신 주기(초), 지나면 오래된 스냅숏으로 보고 백그라운드 갱신
+            workers: 갱신 시 동시 API 호출 수
+        """
+        self.client = client
+        self.snapshot_path = snapshot_path
+        self.queries = list(dict.fromkeys(queries))
+        self.max_age = max_age
+        self.workers = workers
+
+        self._items: Dict[str, Dict] = {}  # query -> 상품 정보
+        self._updated_at = 0.0  # 스냅숏 갱신 시각 (epoch 초)
+        self._file_mtime: Optional[int] = None
+        self._next_reload_check = 0.0
+        self._retry_at = 0.0
+        self._lock = threading.Lock()
+        self._refreshing = threading.Lock()
+        self._refresher: Optional[threading.Thread] = None
+        self._stats = {'hits': 0, 'misses': 0, 'stale_hits': 0, 'refreshes': 0}
+
+        directory = os.path.dirname(snapshot_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self._reload()
+
+    def get(self, query: str) -> Optional[Dict]:
+        """
+        스냅숏의 상품 정보 반환 (없으면 None, API는 호출하지 않음)
+        스냅숏이 오래되었으면 그대로 반환하고 백그라운드 갱신 시작
+        반환값은 호출자가 수정해도 되는 새 딕셔너리
+        """
+        now = time.time()
+        if now >= self._next_reload_check:
+            self._reload()
+
+        with self._lock:
+            product = self._items.get(query)
+            stale = now - self._updated_at >= self.max_age
+            if product is None:
+                self._stats['misses'] += 1
+            else:
+                self._stats['hits'] += 1
+                if stale:
+                    self._stats['stale_hits'] += 1
+
+        if stale and now >= self._retry_at:
+            self.refresh_async()
+        return dict(product) if product else None
+
+    def _reload(self):
+        """스냅숏 파일이 바뀌었으면 다시 읽기 (다른 워커가 갱신한 경우)"""
+        self._next_reload_check = time.time() + self.RELOAD_CHECK_INTERVAL
+        try:
+            mtime = os.stat(self.snapshot_path).st_mtime_ns
+        except OSError:
+            return
+        if mtime == self._file_mtime:
+            return
+        try:
+            snapshot = read_json(self.snapshot_path, {})
+        except (OSError, ValueError) as e:
+            print(f"쇼핑 카탈로그 스냅숏 읽기 오류: {e}")
+            return
+        with self._lock:
+            self._items = snapshot.get('items', {})
+            self._updated_at = snapshot.get('updated_at', 0.0)
+            self._file_mtime = mtime
+
+    @property
+    def age(self) -> Optional[float]:
+        """스냅숏 경과 시간(초), 스냅숏이 없으면 None"""
+        return time.time() - self._updated_at if self._updated_at else None
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        모든 검색어의 상품 정보를 API로 다시 받아 스냅숏 저장
+
+        Args:
+            force: True면 스냅숏이 아직 새로워도 갱신
+
+        Returns:
+            갱신했으면 True (다른 워커가 이미 갱신했거나, API 키가 없거나, 모두 실패하면 False)
+        """
+        if not self.client.configured:
+            return False
+
+        with file_lock(self.snapshot_path):
+            # 잠금을 기다리는 동안 다른 워커가 갱신했을 수 있음
+            self._reload()
+            if not force and self.age is not None and self.age < self.max_age:
+                return False
+
+            with ThreadPoolExecutor(self.workers) as pool:
+                results = list(pool.map(lambda q: self.client.search(q, refresh=True), self.queries))
+
+            with self._lock:
+                items = dict(self._items)
+            fetched = 0
+            for query, product in zip(self.queries, results):
+                # 실패(또는 결과 없음)한 검색어는 이전 상품 정보 유지
+                if product:
+                    items[query] = product
+                    fetched += 1
+
+            if fetched == 0:
+                # API 장애: 기존 스냅숏을 그대로 두고 잠시 후 다시 시도
+                self._retry_at = time.time() + self.RETRY_INTERVAL
+                print(f"쇼핑 카탈로그 갱신 실패: {self.RETRY_INTERVAL:.0f}초 후 다시 시도")
+                return False
+
+            updated_at = time.time()
+            atomic_write_json(self.snapshot_path, {
+                'updated_at': updated_at,
+                'updated_at_kst': get_kst_now().isoformat(),
+                'items': items
+            })
+            with self._lock:
+                self._items = items
+                self._updated_at = updated_at
+                self._file_mtime = os.stat(self.snapshot_path).st_mtime_ns
+                self._stats['refreshes'] += 1
+
+        print(f"쇼핑 카탈로그 갱신: {fetched}/{len(self.queries)}개 검색어")
+        return True
+
+    def refresh_async(self):
+        """백그라운드 스레드에서 갱신 (이미 갱신 중이면 무시)"""
+        if not self._refreshing.acquire(blocking=False):
+            return
+
+        def run():
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"쇼핑 카탈로그 갱신 오류: {e}")
+            finally:
+                self._refreshing.release()
+
+        threading.Thread(target=run, name='shopping-catalog-refresh', daemon=True).start()
+
+    def start_refresher(self, check_interval: float = 600):
+        """
+        백그라운드 스레드에서 시작 시 스냅숏을 준비하고 이후 주기적으로 갱신
+        (요청이 없어도 스냅숏이 max_age보다 오래되지 않도록)
+
+        Args:
+            check_interval: 스냅숏 나이 확인 간격(초)
+        """
+        if self._refresher is not None:
+            return
+
+        def run():
+            while True:
+                self._reload()
+                if self.age is None or self.age >= self.max_age:
+                    with self._refreshing:
+                        try:
+                            self.refresh()
+                        except Exception as e:
+                            print(f"쇼핑 카탈로그 갱신 오류: {e}")
+                time.sleep(check_interval)
+
+        self._refresher = threading.Thread(target=run, name='shopping-catalog', daemon=True)
+        self._refresher.start()
+
+    def stats(self) -> Dict:
+        """조회/갱신 통계"""
+        with self._lock:
+            age = self.age
+            return dict(self._stats, queries=len(self.queries), cached=len(self._items),
+                        age_seconds=round(age) if age is not None else None)
+
+
+def _create_catalog(snapshot_path: str, api_url: Optional[str] = None,
+                    settings: Optional[Settings] = None) -> ShoppingCatalog:
+    """
+    앱과 같은 설정으로 카탈로그 생성 (명령행 작업용)
+
+    Args:
+        snapshot_path: 스냅숏 파일 경로
+        api_url: 네이버 쇼핑 API 주소 (None이면 기본 주소)
+        settings: 앱 설정 (None이면 환경 변수 설정, 검증 오류는 ConfigError)
+    """
+    from shopping_suggester import ShoppingSuggester
+    settings = settings or load_settings()
+    client = NaverShoppingClient(
+        settings.naver_client_id, settings.naver_client_secret,
+        api_url=api_url or NaverShoppingClient.API_URL
+    )
+    return ShoppingCatalog(client, snapshot_path, ShoppingSuggester.all_queries(),
+                           max_age=settings.shopping_snapshot_max_age)
+
+
+if __name__ == '__main__':
+    # 명령행: 스냅숏 갱신(refresh, cron이나 별도 워커에서 실행) / 가짜 서버로 동작 확인(demo)
+    import argparse
+    import tempfile
+
+    parser = argparse.ArgumentParser(description='쇼핑 상품 카탈로그 스냅숏')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    refresh_parser = subparsers.add_parser('refresh', help='스냅숏 갱신')
+    refresh_parser.add_argument('--path', default=os.path.join('data', 'shopping_catalog.json'))
+    refresh_parser.add_argument('--force', action='store_true', help='스냅숏이 새로워도 갱신')
+    subparsers.add_parser('demo', help='가짜 네이버 서버로 스냅숏 조회 확인')
+    args = parser.parse_args()
+
+    if args.command == 'refresh':
+        catalog = _create_catalog(args.path)
+        if not catalog.client.configured:
+            raise SystemExit('NAVER_CLIENT_ID / NAVER_CLIENT_SECRET 설정이 필요합니다')
+        start = time.perf_counter()
+        refreshed = catalog.refresh(force=args.force)
+        status = '갱신' if refreshed else '이미 최신'
+        print(f"{status} ({time.perf_counter() - start:.1f}초, {args.path}): {catalog.stats()}")
+    else:
+        from naver_shopping_client import FakeNaverShoppingServer
+        from shopping_suggester import ShoppingSuggester
+
+        path = os.path.join(tempfile.mkdtemp(), 'shopping_catalog.json')
+        with FakeNaverShoppingServer() as server:
+            # 스냅숏이 없으면 상품 없음 -> 검색 URL로 대체 (API 키가 없어 갱신도 하지 않음)
+            empty = ShoppingCatalog(NaverShoppingClient(None, None), path, ShoppingSuggester.all_queries())
+            suggester = ShoppingSuggester(client=empty.client, catalog=empty)
+            item = suggester.suggest_shopping_items('1990-05-15', '2025-06-15')[0]
+            assert 'search.shopping.naver.com' in item['link'], item
+
+            client = NaverShoppingClient('id', 'secret', api_url=server.url, rate_per_second=200)
+            catalog = ShoppingCatalog(client, path, ShoppingSuggester.all_queries())
+            start = time.perf_counter()
+            assert catalog.refresh()
+            print(f"워밍업: {time.perf_counter() - start:.2f}초, API 호출 {server.total_requests}회")
+            assert not catalog.refresh()  # 아직 새로우면 건너뜀
+
+            # 다른 워커는 파일에서 스냅숏을 읽고 API를 호출하지 않음
+            other = ShoppingCatalog(NaverShoppingClient('id', 'secret', api_url=server.url), path,
+                                    ShoppingSuggester.all_queries())
+            suggester = ShoppingSuggester(client=other.client, catalog=other)
+            requests_before = server.total_requests
+            start = time.perf_counter()
+            for day in range(1, 29):
+                item = suggester.suggest_shopping_items('1990-05-15', f'2025-06-{day:02d}')[0]
+                assert item['link'].startswith('https://shopping.example.com/'), item
+            elapsed = time.perf_counter() - start
+            assert server.total_requests == requests_before
+            print(f"스냅숏 조회 평균: {elapsed / 28 * 1e6:.1f}us")
+
+            # 갱신 실패 시 이전 상품 정보 유지, 오래된 스냅숏도 그대로 응답하며 백그라운드 갱신
+            server.fail = True
+            other.max_age = 0
+            assert other.get('니트')['title'] == '니트 추천 상품'
+            assert not other.refresh()
+            assert other.get('니트')['title'] == '니트 추천 상품'
+            print(f"통계: {other.stats()}")
@@ -3,11 +3,13 @@
 생년월일 기반 오늘의 쇼핑 아이템 추천 모듈
 네이버 쇼핑 API 연동
 """
-import hashlib
-import requests
+import random
 from datetime import datetime
 import pytz
-from typing import Dict, Optional, List
+from typing import Dict, Iterator, Optional, List
+from seeded_random import seed_to_int
+from naver_shopping_client import NaverShoppingClient
+from shopping_catalog import ShoppingCatalog
 import urllib.parse
 
 # 한국시간대 설정
@@ -55,19 +57,31 @@ class ShoppingSuggester:
         ]
     }
     
-    def __init__(self, client_id: Optional[str] = None, client_secret: Optional[str] = None):
+    def __init__(self, client_id: Optional[str] = None, client_secret: Optional[str] = None,
+                 client: Optional[NaverShoppingClient] = None, catalog: Optional[ShoppingCatalog] = None):
         """
         Args:
             client_id: 네이버 API Client ID
             client_secret: 네이버 API Client Secret
+            client: 네이버 쇼핑 클라이언트 (None이면 client_id/client_secret으로 생성)
+            catalog: 미리 받아 둔 상품 스냅숏 (있으면 상품 조회는 스냅숏에서만)
         """
         self.client_id = client_id
         self.client_secret = client_secret
-        self.api_url = "https://openapi.naver.com/v1/search/shop.json"
+        self.client = client or NaverShoppingClient(client_id, client_secret)
+        self.catalog = catalog
+        self.api_url = self.client.api_url
+    
+    @classmethod
+    def all_queries(cls) -> List[str]:
+        """추천될 수 있는 모든 검색어 (중복 제거, 정렬)"""
+        return sorted({item for items in cls.SHOPPING_ITEMS.values() for item in items})
     
     def _search_naver_shopping(self, query: str) -> Optional[Dict]:
         """
-        네이버 쇼핑 API로 상품 검색
+        네이버 쇼핑 상품 검색
+        카탈로그 스냅숏이 있으면 스냅숏에서만 조회 (요청 경로에서 API를 기다리지 않음),
+        없으면 API 클라이언트로 조회 (검색어별 캐시, 연결 재사용, 호출량 제한)
         
         Args:
             query: 검색어
@@ -75,49 +89,9 @@ class ShoppingSuggester:
         Returns:
             첫 번째 상품 정보 또는 None
         """
-        if not self.client_id or not self.client_secret:
-            return None
-        
-        try:
-            headers = {
-                'X-Naver-Client-Id': self.client_id,
-                'X-Naver-Client-Secret': self.client_secret
-            }
-            
-            params = {
-                'query': query,
-                'display': 1,  # 첫 번째 결과만
-                'start': 1
-            }
-            
-            response = requests.get(self.api_url, headers=headers, params=params, timeout=5)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if data.get('items') and len(data['items']) > 0:
-                item = data['items'][0]
-                return {
-                    'title': item.get('title', '').replace('<b>', '').replace('</b>', ''),
-                    'link': item.get('link', ''),
-                    'image': item.get('image', ''),
-                    'lprice': item.get('lprice', ''),
-                    'hprice': item.get('hprice', ''),
-                    'mallName': item.get('mallName', ''),
-                    'productId': item.get('productId', ''),
-                    'productType': item.get('productType', ''),
-                    'brand': item.get('brand', ''),
-                    'maker': item.get('maker', ''),
-                    'category1': item.get('category1', ''),
-                    'category2': item.get('category2', ''),
-                    'category3': item.get('category3', ''),
-                    'category4': item.get('category4', '')
-                }
-        except Exception as e:
-            print(f"네이버 쇼핑 API 호출 오류: {e}")
-            return None
-        
-        return None
+        if self.catalog is not None:
+            return self.catalog.get(query)
+        return self.client.search(query)
     
     def suggest_shopping_items(self, birth_date: str, date_str: Optional[str] = None, num_items: int = 1) -> List[Dict]:
         """
@@ -135,51 +109,87 @@ class ShoppingSuggester:
         if date_str is None:
             date_str = get_kst_now().strftime('%Y-%m-%d')
         
+        candidate = next(self.iter_candidates(birth_date, date_str))
+        return [self.build_item(candidate, date_str)]
+    
+    def iter_candidates(self, birth_date: str, date_str: Optional[str] = None) -> Iterator[Dict]:
+        """
+        오늘의 쇼핑 검색어 후보를 우선순위 순서대로 반환 (결정적, API 호출 없음)
+        첫 번째 후보는 suggest_shopping_items()가 고르는 검색어와 같고, 이후 같은
+        카테고리의 나머지 아이템, 다음 카테고리 순서로 이어짐
+        
+        Args:
+            birth_date: 생년월일 (YYYY-MM-DD)
+            date_str: 날짜 (YYYY-MM-DD), None이면 오늘 날짜
+        
+        Returns:
+            {'category', 'search_query'} 딕셔너리 이터레이터 (build_item()으로 상품 정보 구성)
+        """
+        if date_str is None:
+            date_str = get_kst_now().strftime('%Y-%m-%d')
+        
         # 날짜와 생년월일을 조합하여 시드 생성
         seed_str = f"{date_str}_{birth_date}_shopping"
-        seed_hash = int(hashlib.md5(seed_str.encode()).hexdigest(), 16)
-        
-        # 생년월일에서 정보 추출
-        birth_dt = datetime.strptime(birth_date, '%Y-%m-%d')
-        month = birth_dt.month
-        day = birth_dt.day
-        
-        # 계절 결정
-        if month in [12, 1, 2]:
-            season = '겨울'
-        elif month in [3, 4, 5]:
-            season = '봄'
-        elif month in [6, 7, 8]:
-            season = '여름'
-        else:
-            season = '가을'
+        seed_hash = seed_to_int(seed_str)
         
-        # 카테고리 선택 (시드 기반 - 날짜가 바뀌면 다른 카테고리 선택)
-        categories = list(self.SHOPPING_ITEMS.keys())
-        selected_items = []
+        # 생년월일 형식 검증
+        datetime.strptime(birth_date, '%Y-%m-%d')
         
-        # 날짜별로 다른 카테고리와 아이템 조합 생성
-        import random
-        random.seed(seed_hash)  # 시드 설정으로 동일한 날짜면 동일한 결과
+        return self.iter_from_seed(seed_hash)
+    
+    def iter_from_seed(self, seed_hash: int) -> Iterator[Dict]:
+        """
+        시드로 검색어 후보 반환 (DailyBundle에서 사용, 생년월일 자체는 사용하지 않음)
         
-        # 카테고리 선택 (시드 기반 - 날짜가 바뀌면 다른 카테고리)
+        Args:
+            seed_hash: 쇼핑 선택 시드 (정수, 하위 32비트 사용)
+        """
+        # 카테고리 선택 (시드 기반 - 날짜가 바뀌면 다른 카테고리 선택)
+        categories = list(self.SHOPPING_ITEMS.keys())
         category_seed = seed_hash % (2**16)  # 하위 16비트 사용
         category_idx = category_seed % len(categories)
-        category = categories[category_idx]
         
-        # 해당 카테고리에서 아이템 선택 (날짜별로 다른 아이템)
-        items = self.SHOPPING_ITEMS[category]
+        # 해당 카테고리에서 아이템 선택 (날짜별로 다른 아이템, 동일한 날짜면 동일한 결과)
         item_seed = (seed_hash >> 16) % (2**16)  # 상위 16비트 사용
-        random.seed(item_seed)
-        item_idx = random.randint(0, len(items) - 1)
-        item_name = items[item_idx]
+        # 전역 random.seed() 대신 호출별 난수 생성기 사용 (스레드 안전)
+        item_rng = random.Random(item_seed)
+        
+        seen_queries = set()
+        for category_offset in range(len(categories)):
+            category = categories[(category_idx + category_offset) % len(categories)]
+            items = self.SHOPPING_ITEMS[category]
+            if category_offset == 0:
+                item_idx = item_rng.randint(0, len(items) - 1)
+            else:
+                item_idx = item_seed % len(items)
+            
+            for offset in range(len(items)):
+                item_name = items[(item_idx + offset) % len(items)]
+                if item_name in seen_queries:
+                    continue
+                seen_queries.add(item_name)
+                yield {'category': category, 'search_query': item_name}
+    
+    def build_item(self, candidate: Dict, date_str: Optional[str] = None) -> Dict:
+        """
+        검색어 후보로 쇼핑 아이템 구성 (네이버 쇼핑 API 조회, 실패 시 검색 URL)
+        
+        Args:
+            candidate: iter_candidates()가 반환한 후보
+            date_str: 날짜 (YYYY-MM-DD), None이면 오늘 날짜
+        """
+        if date_str is None:
+            date_str = get_kst_now().strftime('%Y-%m-%d')
+        
+        category = candidate['category']
+        item_name = candidate['search_query']
         
         # 네이버 쇼핑 API로 실제 상품 검색
         product_data = self._search_naver_shopping(item_name)
         
         if product_data:
             # API에서 받은 실제 상품 정보 사용
-            selected_items.append({
+            return {
                 'name': product_data.get('title', item_name),
                 'category': category,
                 'link': product_data.get('link', ''),
@@ -189,20 +199,17 @@ class ShoppingSuggester:
                 'brand': product_data.get('brand', ''),
                 'search_query': item_name,  # 원본 검색어
                 'date': date_str
-            })
-        else:
-            # API 호출 실패 시 기본 검색 URL 사용
-            search_url = f"https://search.shopping.naver.com/search/all?query={urllib.parse.quote(item_name)}"
-            selected_items.append({
-                'name': item_name,
-                'category': category,
-                'link': search_url,
-                'search_query': item_name,
-                'date': date_str
-            })
+            }
         
-        return selected_items
-
+        # API 호출 실패 시 기본 검색 URL 사용
+        search_url = f"https://search.shopping.naver.com/search/all?query={urllib.parse.quote(item_name)}"
+        return {
+            'name': item_name,
+            'category': category,
+            'link': search_url,
+            'search_query': item_name,
+            'date': date_str
+        }
 
 if __name__ == '__main__':
     # 테스트
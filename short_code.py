@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+단축 코드 생성 모듈
+단조 증가 순번을 키 기반 순열(Feistel 암호)로 섞은 뒤 base62로 인코딩.
+순번 -> 코드 변환이 전단사이므로 재시도 없이 항상 고유하며,
+현재 길이의 코드 공간이 모두 차면 자동으로 한 글자 긴 코드를 사용
+"""
+import hashlib
+import string
+
+# base62 문자 집합
+BASE62 = string.digits + string.ascii_letters
+
+
+class ShortCodeGenerator:
+    """순번 기반 결정적 단축 코드 생성 클래스"""
+
+    def __init__(self, secret: bytes, min_length: int = 4, rounds: int = 4):
+        """
+        Args:
+            secret: 순열 키 (같은 키면 같은 순번에 항상 같은 코드)
+            min_length: 최소 코드 길이
+            rounds: Feistel 라운드 수
+        """
+        # blake2b 키는 최대 64바이트
+        self.key = hashlib.blake2b(secret, digest_size=32).digest()
+        self.min_length = min_length
+        self.rounds = rounds
+
+    def code_for(self, sequence: int) -> str:
+        """
+        순번으로 단축 코드 생성
+
+        Args:
+            sequence: 0부터 시작하는 고유 순번 (서로 다른 순번은 항상 서로 다른 코드)
+        """
+        if sequence < 0:
+            raise ValueError("순번은 0 이상이어야 합니다.")
+
+        # 길이별 코드 공간 (min_length 공간을 다 쓰면 한 글자씩 늘어남)
+        length = self.min_length
+        index = sequence
+        while index >= 62 ** length:
+            index -= 62 ** length
+            length += 1
+
+        value = self._permute(index, 62 ** length)
+
+        chars = []
+        for _ in range(length):
+            value, remainder = divmod(value, 62)
+            chars.append(BASE62[remainder])
+        return ''.join(reversed(chars))
+
+    def _permute(self, index: int, domain: int) -> int:
+        """[0, domain) 범위의 키 기반 전단사 순열 (Feistel + cycle walking)"""
+        # 도메인을 덮는 짝수 비트 폭
+        bits = max(domain - 1, 1).bit_length()
+        bits += bits % 2
+        half_bits = bits // 2
+        half_mask = (1 << half_bits) - 1
+
+        value = index
+        while True:
+            left, right = value >> half_bits, value & half_mask
+            for round_number in range(self.rounds):
+                left, right = right, left ^ self._round(right, round_number, half_mask)
+            value = (left << half_bits) | right
+            # 범위를 벗어나면 다시 섞어 범위 안으로 (전단사 유지)
+            if value < domain:
+                return value
+
+    def _round(self, half: int, round_number: int, half_mask: int) -> int:
+        """Feistel 라운드 함수"""
+        digest = hashlib.blake2b(
+            half.to_bytes(8, 'big') + bytes((round_number,)),
+            key=self.key,
+            digest_size=8
+        ).digest()
+        return int.from_bytes(digest, 'big') & half_mask
+
+
+if __name__ == '__main__':
+    # 벤치마크: 100만 개 코드 생성 및 고유성 확인
+    import time
+
+    generator = ShortCodeGenerator(b'benchmark', min_length=4)
+    total = 1_000_000
+    start = time.perf_counter()
+    codes = [generator.code_for(sequence) for sequence in range(total)]
+    elapsed = time.perf_counter() - start
+    assert len(set(codes)) == total
+
+    # 길이 증가 확인: 4글자 공간(62^4)을 넘으면 5글자
+    assert len(generator.code_for(62 ** 4 - 1)) == 4
+    assert len(generator.code_for(62 ** 4)) == 5
+
+    print(f"코드 {total}개 생성: {elapsed:.2f}초 (평균 {elapsed / total * 1e6:.2f}us), 모두 고유")
+    print(f"예시: {codes[:5]}")
@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+"""
+단축 URL 저장소 모듈
+코드→URL, URL 해시→코드 두 개의 메모리 인덱스로 조회/역조회를 O(1)에 처리하고,
+변경은 추가 전용 로그(JSON Lines)에 기록한 뒤 주기적으로 스냅숏으로 압축
+
+파일 구성:
+- short_urls.json: 압축된 스냅숏 ({code: {'original_url', 'created_at'}}, 다음 순번은 META_KEY 항목)
+- short_urls.log: 스냅숏 이후 추가된 레코드 (한 줄에 하나, 코드를 만든 순번 포함)
+"""
+import hashlib
+import json
+import os
+import threading
+from typing import Callable, Dict, Optional
+
+from json_storage import atomic_write_json, file_lock, read_json
+
+
+class ShortUrlStore:
+    """메모리 인덱스 + 추가 전용 로그 기반 단축 URL 저장소"""
+
+    # 스냅숏에서 코드가 아닌 메타데이터 항목 (original_url이 없으므로 레코드로 읽히지 않음)
+    META_KEY = '__meta__'
+
+    def __init__(self, snapshot_path: str, compact_threshold: int = 1000):
+        """
+        Args:
+            snapshot_path: 스냅숏 JSON 파일 경로 (로그는 같은 위치의 .log 파일)
+            compact_threshold: 로그 레코드가 이 수를 넘으면 스냅숏으로 압축
+        """
+        self.snapshot_path = snapshot_path
+        self.log_path = os.path.splitext(snapshot_path)[0] + '.log'
+        self.compact_threshold = compact_threshold
+        # new_code()가 잠금 안에서 get()을 호출할 수 있으므로 재진입 가능 잠금 사용
+        self._lock = threading.RLock()
+        self._load()
+
+    @staticmethod
+    def _url_key(original_url: str) -> bytes:
+        """역조회 인덱스 키 (URL 길이와 무관한 고정 크기 해시)"""
+        return hashlib.sha1(original_url.encode('utf-8')).digest()
+
+    def _apply(self, code: str, record: Dict):
+        """레코드를 메모리 인덱스에 반영"""
+        self._codes[code] = record
+        self._by_url.setdefault(self._url_key(record['original_url']), code)
+
+    def _load(self):
+        """스냅숏과 로그 전체를 읽어 인덱스 재구축"""
+        self._codes: Dict[str, Dict] = {}
+        self._by_url: Dict[bytes, str] = {}
+        self._log_ident = None
+        self._log_offset = 0
+        self._log_records = 0
+
+        try:
+            snapshot = read_json(self.snapshot_path, {})
+        except (OSError, ValueError) as e:
+            print(f"단축 URL 스냅숏 로드 오류: {e}")
+            snapshot = {}
+        for code, record in snapshot.items():
+            if record.get('original_url'):
+                self._apply(code, record)
+        # 다음 코드 순번 (한 번 쓴 순번은 다시 시도하지 않음, 순번이 없던 이전 파일은 레코드 수부터)
+        self._next_sequence = max(snapshot.get(self.META_KEY, {}).get('next_sequence', 0), len(self._codes))
+
+        try:
+            with open(self.log_path, 'rb') as f:
+                st = os.fstat(f.fileno())
+                self._log_ident = (st.st_dev, st.st_ino)
+                self._read_log(f)
+        except FileNotFoundError:
+            pass
+
+    def _read_log(self, f):
+        """현재 오프셋부터 완결된 로그 줄만 읽어 반영 (쓰는 중인 마지막 줄은 다음에)"""
+        f.seek(self._log_offset)
+        data = f.read()
+        end = data.rfind(b'\n') + 1
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+                self._apply(entry['code'], {'original_url': entry['original_url'], 'created_at': entry.get('created_at')})
+                if 'sequence' in entry:
+                    self._next_sequence = max(self._next_sequence, entry['sequence'] + 1)
+                self._log_records += 1
+            except (ValueError, KeyError) as e:
+                print(f"단축 URL 로그 항목 오류: {e}")
+        self._log_offset += end
+
+    def _refresh(self):
+        """다른 워커가 추가한 로그를 따라잡기 (압축으로 로그가 교체되었으면 전체 재로드)"""
+        try:
+            st = os.stat(self.log_path)
+        except FileNotFoundError:
+            st = None
+        ident = (st.st_dev, st.st_ino) if st else None
+        if ident != self._log_ident:
+            self._load()
+        elif st is not None and st.st_size > self._log_offset:
+            with open(self.log_path, 'rb') as f:
+                self._read_log(f)
+
+    def get(self, code: str) -> Optional[Dict]:
+        """단축 코드로 레코드 조회 (메모리 적중 시 디스크 접근 없음)"""
+        record = self._codes.get(code)
+        if record is None:
+            with self._lock:
+                self._refresh()
+                record = self._codes.get(code)
+        return record
+
+    def find_code(self, original_url: str) -> Optional[str]:
+        """원본 URL로 기존 단축 코드 역조회"""
+        key = self._url_key(original_url)
+        code = self._by_url.get(key)
+        if code is None:
+            with self._lock:
+                self._refresh()
+                code = self._by_url.get(key)
+        return code
+
+    def get_or_add(self, original_url: str, created_at: str, new_code: Callable[[int], str]) -> str:
+        """
+        원본 URL의 단축 코드 반환 (없으면 new_code(순번)으로 코드를 만들어 로그에 추가)
+
+        Args:
+            original_url: 원본 URL
+            created_at: 생성 시각 (ISO 형식)
+            new_code: 순번 -> 단축 코드 함수. 순번은 로그/스냅숏에 기록되는 단조 증가 카운터로
+                      잠금 안에서 최신 상태 기준으로 정해지므로 워커 간에도 고유함
+        """
+        code = self.find_code(original_url)
+        if code is not None:
+            return code
+
+        with self._lock, file_lock(self.log_path):
+            # 잠금을 기다리는 동안 다른 워커가 추가했을 수 있으므로 다시 확인
+            self._refresh()
+            code = self._by_url.get(self._url_key(original_url))
+            if code is not None:
+                return code
+
+            # 다음 순번 사용 (기존 무작위/가져온 코드와 겹치면 다음 순번, 건너뛴 순번도 기록에 반영)
+            sequence = self._next_sequence
+            code = new_code(sequence)
+            while code in self._codes:
+                sequence += 1
+                code = new_code(sequence)
+            line = json.dumps({'code': code, 'original_url': original_url, 'created_at': created_at,
+                               'sequence': sequence}, ensure_ascii=False) + '\n'
+            fd = os.open(self.log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line.encode('utf-8'))
+                os.fsync(fd)
+                st = os.fstat(fd)
+            finally:
+                os.close(fd)
+
+            # 내 추가분까지 따라잡은 상태로 오프셋 갱신 (잠금 안이므로 다른 쓰기는 없음)
+            self._log_ident = (st.st_dev, st.st_ino)
+            self._log_offset = st.st_size
+            self._log_records += 1
+            self._next_sequence = sequence + 1
+            self._apply(code, {'original_url': original_url, 'created_at': created_at})
+
+            if self._log_records >= self.compact_threshold:
+                self._compact()
+        return code
+
+    def compact(self):
+        """로그를 스냅숏으로 압축"""
+        with self._lock, file_lock(self.log_path):
+            self._refresh()
+            self._compact()
+
+    def _compact(self):
+        """스냅숏 저장 후 로그를 빈 파일로 교체 (잠금 안에서 호출)"""
+        atomic_write_json(self.snapshot_path,
+                          dict(self._codes, **{self.META_KEY: {'next_sequence': self._next_sequence}}))
+        # 빈 로그로 교체 (inode가 바뀌므로 다른 워커는 다음 조회 시 전체 재로드)
+        with open(self.log_path + '.new', 'w', encoding='utf-8'):
+            pass
+        os.replace(self.log_path + '.new', self.log_path)
+        st = os.stat(self.log_path)
+        self._log_ident = (st.st_dev, st.st_ino)
+        self._log_offset = 0
+        self._log_records = 0
+
+    def load_all(self) -> Dict[str, Dict]:
+        """전체 매핑 복사본 반환"""
+        with self._lock:
+            self._refresh()
+            return dict(self._codes)
+
+    @property
+    def next_sequence(self) -> int:
+        """다음 단축 코드 순번"""
+        with self._lock:
+            self._refresh()
+            return self._next_sequence
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+
+if __name__ == '__main__':
+    # 벤치마크: 링크 수와 무관하게 단축/리다이렉트 시간이 일정한지 확인
+    import tempfile
+    import time
+
+    store = ShortUrlStore(os.path.join(tempfile.mkdtemp(), 'short_urls.json'), compact_threshold=5000)
+
+    def next_code(sequence):
+        return f'c{sequence + 1}'
+
+    for total in (1000, 10000, 50000):
+        added = total - len(store)
+        start = time.perf_counter()
+        while len(store) < total:
+            store.get_or_add(f'https://example.com/{len(store)}', '2025-01-01T00:00:00+09:00', next_code)
+        add_ms = (time.perf_counter() - start) * 1000 / added
+        start = time.perf_counter()
+        for i in range(10000):
+            store.get(f'c{i % total + 1}')
+            store.find_code(f'https://example.com/{i % total}')
+        lookup_us = (time.perf_counter() - start) * 1e6 / 20000
+        print(f"링크 {total}개: 추가 평균 {add_ms:.3f}ms, 조회 평균 {lookup_us:.2f}us")
+
+    reopened = ShortUrlStore(store.snapshot_path)
+    assert len(reopened) == len(store)
+    assert reopened.find_code('https://example.com/123') == store.find_code('https://example.com/123')
+    print(f"재로드 확인: {len(reopened)}개")
+
+    # 기존 코드와 겹친 순번은 다시 시도하지 않음 (압축/재로드 후에도 카운터 유지)
+    skip_path = os.path.join(tempfile.mkdtemp(), 'short_urls.json')
+    # 순번 카운터가 없던 이전 스냅숏: 다음 순번(50) 이후의 코드(c51~c60)가 이미 있음
+    atomic_write_json(skip_path, {f'c{i}': {'original_url': f'https://legacy.example.com/{i}',
+                                            'created_at': '2025-01-01T00:00:00+09:00'} for i in range(11, 61)})
+    skip_store = ShortUrlStore(skip_path)
+    calls = []
+
+    def counting_code(sequence):
+        calls.append(sequence)
+        return f'c{sequence + 1}'
+
+    skip_store.get_or_add('https://example.com/first', '2025-01-01T00:00:00+09:00', counting_code)
+    first_calls = len(calls)
+    skip_store.compact()
+    calls.clear()
+    skip_store = ShortUrlStore(skip_path)
+    skip_store.get_or_add('https://example.com/second', '2025-01-01T00:00:00+09:00', counting_code)
+    assert calls == [61], calls
+    print(f"순번 카운터 확인: 겹친 코드 {first_calls - 1}개 건너뛴 뒤 재로드 후 추가는 1회 시도")
@@ -7,6 +7,22 @@ let userId = localStorage.getItem('userId') || 'user_' + Date.now();
 if (!localStorage.getItem('userId')) {
     localStorage.setItem('userId', userId);
 }
+// 서버가 메인 페이지에 오늘의 데이터를 미리 넣을 수 있도록 쿠키에도 저장
+document.cookie = `user_id=${encodeURIComponent(userId)}; path=/; max-age=31536000; SameSite=Lax`;
+
+// 서버 렌더링한 초기 데이터 (이 브라우저의 사용자 데이터일 때만 사용, 없으면 null)
+function readInitialData() {
+    const element = document.getElementById('initialData');
+    if (!element) {
+        return null;
+    }
+    try {
+        const data = JSON.parse(element.textContent);
+        return data.user_id === userId ? data : null;
+    } catch (error) {
+        return null;
+    }
+}
 
 // 현재 표시 중인 데이터 저장 (공유용)
 let currentQuote = null;
@@ -120,8 +136,9 @@ document.addEventListener('DOMContentLoaded', async () => {
         return;
     }
     
-    // 저장된 생년월일 확인
-    const saved = await checkSavedBirthday();
+    // 저장된 생년월일 확인 (서버 렌더링 데이터가 있으면 API 호출 생략)
+    const initialData = readInitialData();
+    const saved = initialData ? Boolean(initialData.birth_date) : await checkSavedBirthday();
     if (saved) {
         birthdaySection.style.display = 'none';
         quoteSection.style.display = 'block';
@@ -134,8 +151,12 @@ document.addEventListener('DOMContentLoaded', async () => {
         if (topMenu) {
             topMenu.style.display = 'flex';
         }
-        updateSubtitle();
-        loadDailyQuote();
+        updateSubtitle(initialData ? initialData.birth_date : null);
+        if (initialData && initialData.daily) {
+            renderDaily(initialData.daily);
+        } else {
+            loadDailyQuote();
+        }
     } else {
         // 생년월일이 없으면 입력 섹션 표시
         birthdaySection.style.display = 'block';
@@ -143,17 +164,21 @@ document.addEventListener('DOMContentLoaded', async () => {
     }
     
     // 생년월일 정보 가져오기 (공유용)
-    try {
-        const response = await fetch(`${API_BASE}/api/birthday/${userId}`);
-        if (response.ok) {
-            const data = await response.json();
-            if (data.success && data.data.birth_date) {
-                currentBirthDate = data.data.birth_date;
+    if (initialData) {
+        currentBirthDate = initialData.birth_date;
+    } else {
+        try {
+            const response = await fetch(`${API_BASE}/api/birthday/${userId}`);
+            if (response.ok) {
+                const data = await response.json();
+                if (data.success && data.data.birth_date) {
+                    currentBirthDate = data.data.birth_date;
+                }
             }
+            // 404는 생년월일이 없는 정상적인 경우이므로 조용히 처리
+        } catch (error) {
+            // 네트워크 에러 등은 조용히 처리 (콘솔 에러 제거)
         }
-        // 404는 생년월일이 없는 정상적인 경우이므로 조용히 처리
-    } catch (error) {
-        // 네트워크 에러 등은 조용히 처리 (콘솔 에러 제거)
     }
     
     // 자정 자동 새로고침 설정
@@ -418,56 +443,7 @@ async function loadDailyQuote() {
             return;
         }
         
-        const data = await response.json();
-        
-        if (data.success) {
-            displayQuote(data.data.quote);
-            // 생년월일 분석 숨김 처리
-            // if (data.data.analysis) {
-            //     displayAnalysis(data.data.analysis);
-            // }
-            if (data.data.color) {
-                displayColor(data.data.color);
-            }
-            if (data.data.drink) {
-                displayDrink(data.data.drink);
-            }
-            if (data.data.flower) {
-                displayFlower(data.data.flower);
-            }
-            if (data.data.greeting) {
-                displayGreeting(data.data.greeting);
-            }
-            if (data.data.shopping_items && data.data.shopping_items.length > 0) {
-                displayShoppingItems(data.data.shopping_items);
-            }
-            
-            // 헤더 및 메뉴 표시
-            const headerSection = document.getElementById('headerSection');
-            const topMenu = document.getElementById('topMenu');
-            if (headerSection) {
-                headerSection.style.display = 'block';
-            }
-            if (topMenu) {
-                topMenu.style.display = 'flex';
-            }
-            
-            // 로드한 날짜 저장 (한국시간 기준)
-            const today = getKSTToday();
-            lastLoadedDate = today;
-            
-            // 자정 타이머 재설정 (새로운 날짜가 로드되었으므로)
-            setupMidnightAutoRefresh();
-        } else {
-            if (data.requires_birthday) {
-                // 생년월일 입력 필요
-                birthdaySection.style.display = 'block';
-                quoteSection.style.display = 'none';
-                showMessage(birthdayMessage, '생년월일을 먼저 입력해주세요.', 'error');
-            } else {
-                showError(data.error || '명언을 불러올 수 없습니다.');
-            }
-        }
+        renderDaily(await response.json());
     } catch (error) {
         showError('오류가 발생했습니다: ' + error.message);
     } finally {
@@ -475,6 +451,58 @@ async function loadDailyQuote() {
     }
 }
 
+// /api/daily 응답 표시 (서버 렌더링한 초기 데이터도 같은 형식)
+function renderDaily(data) {
+    if (data.success) {
+        displayQuote(data.data.quote);
+        // 생년월일 분석 숨김 처리
+        // if (data.data.analysis) {
+        //     displayAnalysis(data.data.analysis);
+        // }
+        if (data.data.color) {
+            displayColor(data.data.color);
+        }
+        if (data.data.drink) {
+            displayDrink(data.data.drink);
+        }
+        if (data.data.flower) {
+            displayFlower(data.data.flower);
+        }
+        if (data.data.greeting) {
+            displayGreeting(data.data.greeting);
+        }
+        if (data.data.shopping_items && data.data.shopping_items.length > 0) {
+            displayShoppingItems(data.data.shopping_items);
+        }
+        
+        // 헤더 및 메뉴 표시
+        const headerSection = document.getElementById('headerSection');
+        const topMenu = document.getElementById('topMenu');
+        if (headerSection) {
+            headerSection.style.display = 'block';
+        }
+        if (topMenu) {
+            topMenu.style.display = 'flex';
+        }
+        
+        // 로드한 날짜 저장 (한국시간 기준)
+        const today = getKSTToday();
+        lastLoadedDate = today;
+        
+        // 자정 타이머 재설정 (새로운 날짜가 로드되었으므로)
+        setupMidnightAutoRefresh();
+    } else {
+        if (data.requires_birthday) {
+            // 생년월일 입력 필요
+            birthdaySection.style.display = 'block';
+            quoteSection.style.display = 'none';
+            showMessage(birthdayMessage, '생년월일을 먼저 입력해주세요.', 'error');
+        } else {
+            showError(data.error || '명언을 불러올 수 없습니다.');
+        }
+    }
+}
+
 // 랜덤 명언/시 로드 (다른 한 줄 보기)
 async function loadRandomQuote() {
     showLoading(true);
@@ -0,0 +1,416 @@
+# -*- coding: utf-8 -*-
+"""
+정적 자산(JS/CSS) 빌드 모듈
+원본을 축소(minify)하고 내용 해시를 넣은 파일 이름(app.<hash>.js)으로 static/dist에 저장하며,
+미리 압축한 .gz/.br 파일을 함께 만듦. 파일 이름이 내용으로 정해지므로 1년 immutable 캐시로 제공하고,
+내용이 바뀌면 템플릿의 asset_url()이 새 파일 이름을 가리킴
+
+명령행:
+    python static_assets.py build   # 빌드 후 자산별 크기 감소 보고
+"""
+import gzip
+import hashlib
+import os
+import re
+from typing import Dict, Iterable, NamedTuple, Optional
+
+from json_storage import atomic_write_json, file_lock, read_json
+
+# brotli 임포트 (선택적, 없으면 .gz만 생성)
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+# 빌드 대상 (static 폴더 기준 경로)
+ASSETS = ('js/app.js', 'css/style.css')
+
+MIMETYPES = {'.js': 'text/javascript; charset=utf-8', '.css': 'text/css; charset=utf-8'}
+
+# 축소 방식을 바꾸면 올려서 다시 빌드
+PIPELINE_VERSION = 1
+
+
+# JS: 정규식 리터럴이 올 수 있는 위치 (직전 문자/키워드)
+_REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+_REGEX_KEYWORDS = {'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void', 'throw', 'case', 'do', 'else'}
+# 앞뒤 공백을 지워도 되는 구두점 (+, -, /, .은 a + +b, 정규식 등과 붙을 수 있으므로 제외)
+_JS_PUNCTUATION = set('{}()[];,:=<>?&|*%^~!')
+_IDENTIFIER_TAIL = re.compile(r'[A-Za-z_$][\w$]*$')
+
+
+def _skip_string(source: str, i: int) -> int:
+    """따옴표 문자열의 끝 다음 위치"""
+    quote = source[i]
+    i += 1
+    while i < len(source):
+        c = source[i]
+        if c == '\\':
+            i += 2
+            continue
+        i += 1
+        if c == quote or c == '\n':
+            break
+    return i
+
+
+def _skip_template(source: str, i: int) -> int:
+    """템플릿 리터럴(`...${...}...`)의 끝 다음 위치 (내용은 그대로 유지)"""
+    i += 1
+    depth = 0
+    while i < len(source):
+        c = source[i]
+        if c == '\\':
+            i += 2
+            continue
+        if depth == 0:
+            if c == '`':
+                return i + 1
+            if source.startswith('${', i):
+                depth = 1
+                i += 2
+                continue
+        elif c in '\'"':
+            i = _skip_string(source, i)
+            continue
+        elif c == '`':
+            i = _skip_template(source, i)
+            continue
+        elif c == '{':
+            depth += 1
+        elif c == '}':
+            depth -= 1
+        i += 1
+    return i
+
+
+def _skip_regex(source: str, i: int) -> int:
+    """정규식 리터럴(/.../flags)의 끝 다음 위치"""
+    i += 1
+    in_class = False
+    while i < len(source):
+        c = source[i]
+        if c == '\\':
+            i += 2
+            continue
+        if c == '\n':
+            return i
+        i += 1
+        if c == '[':
+            in_class = True
+        elif c == ']':
+            in_class = False
+        elif c == '/' and not in_class:
+            break
+    while i < len(source) and (source[i].isalnum() or source[i] == '_'):
+        i += 1
+    return i
+
+
+def minify_js(source: str) -> str:
+    """
+    보수적인 JS 축소: 주석 제거, 들여쓰기/빈 줄 제거, 구두점 주변 공백 제거
+    줄바꿈은 유지하므로 자동 세미콜론 삽입(ASI)에 기대는 코드도 의미가 바뀌지 않음.
+    문자열/템플릿 리터럴/정규식 리터럴 내용은 그대로 유지
+    """
+    out = []
+    i, n = 0, len(source)
+    pending = None  # 토큰 사이에 넣을 공백 (' ' 또는 '\n')
+
+    def last_char() -> str:
+        return out[-1][-1] if out else ''
+
+    def emit(token: str):
+        nonlocal pending
+        if pending == '\n':
+            if out and last_char() != '\n':
+                out.append('\n')
+        elif pending == ' ' and out and last_char() != '\n':
+            if last_char() not in _JS_PUNCTUATION and token[0] not in _JS_PUNCTUATION:
+                out.append(' ')
+        pending = None
+        out.append(token)
+
+    while i < n:
+        c = source[i]
+        if c in ' \t\r\n':
+            j = i
+            while j < n and source[j] in ' \t\r\n':
+                j += 1
+            if '\n' in source[i:j]:
+                pending = '\n'
+            elif pending is None:
+                pending = ' '
+            i = j
+        elif source.startswith('//', i):
+            end = source.find('\n', i)
+            i = n if end < 0 else end
+        elif source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            end = n if end < 0 else end + 2
+            if '\n' in source[i:end]:
+                pending = '\n'
+            elif pending is None:
+                pending = ' '
+            i = end
+        elif c in '\'"':
+            j = _skip_string(source, i)
+            emit(source[i:j])
+            i = j
+        elif c == '`':
+            j = _skip_template(source, i)
+            emit(source[i:j])
+            i = j
+        elif c == '/':
+            previous = ''.join(out[-3:]).rstrip()
+            word = _IDENTIFIER_TAIL.search(previous)
+            if not previous or previous[-1] in _REGEX_PRECEDERS or (word and word.group() in _REGEX_KEYWORDS):
+                j = _skip_regex(source, i)
+            else:
+                j = i + 1
+            emit(source[i:j])
+            i = j
+        else:
+            j = i + 1
+            # 식별자/숫자/구두점 연속은 한 번에 내보냄
+            while j < n and source[j] not in ' \t\r\n\'"`/':
+                j += 1
+            emit(source[i:j])
+            i = j
+    return ''.join(out).strip() + '\n'
+
+
+_CSS_TOKENS = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|(/\*.*?\*/)|(\s+)', re.S)
+_CSS_PUNCTUATION = re.compile(r'\s*([{};,>])\s*')
+_CSS_COLON = re.compile(r':\s+')
+
+
+def minify_css(source: str) -> str:
+    """
+    CSS 축소: 주석 제거, 공백 정리, { } ; , > 주변과 : 뒤 공백 제거, } 앞 ; 제거
+    문자열 내용은 그대로 유지 (calc()의 + - 주변 공백도 유지)
+    """
+    parts = []
+    position = 0
+    for match in _CSS_TOKENS.finditer(source):
+        parts.append(('code', source[position:match.start()]))
+        if match.group(1):
+            parts.append(('string', match.group(1)))
+        else:
+            # 주석은 공백으로 (앞뒤 토큰이 붙지 않도록)
+            parts.append(('code', ' '))
+        position = match.end()
+    parts.append(('code', source[position:]))
+
+    out = []
+    code = ''
+    for kind, text in parts:
+        if kind == 'code':
+            code += text
+            continue
+        out.append(_minify_css_code(code))
+        out.append(text)
+        code = ''
+    out.append(_minify_css_code(code))
+    return ''.join(out).strip() + '\n'
+
+
+def _minify_css_code(code: str) -> str:
+    code = re.sub(r'\s+', ' ', code)
+    code = _CSS_PUNCTUATION.sub(r'\1', code)
+    return _CSS_COLON.sub(':', code).replace(';}', '}')
+
+
+def minify(path: str, source: str) -> str:
+    """확장자에 맞는 축소 (그 외 형식은 그대로)"""
+    if path.endswith('.js'):
+        return minify_js(source)
+    if path.endswith('.css'):
+        return minify_css(source)
+    return source
+
+
+class BuiltAsset(NamedTuple):
+    """빌드된 자산 (인코딩별 내용은 메모리에 보관)"""
+    path: str  # dist 폴더 기준 해시 파일 이름 (js/app.<hash>.js)
+    mimetype: str
+    etag: str
+    encodings: Dict[str, bytes]  # 'identity' / 'gzip' / 'br' -> 내용
+
+
+class AssetPipeline:
+    """정적 자산 빌드/조회 (빌드 결과는 manifest.json으로 워커 간 공유)"""
+
+    def __init__(self, static_folder: str, assets: Iterable[str] = ASSETS, output: str = 'dist'):
+        """
+        Args:
+            static_folder: static 폴더 경로
+            assets: 빌드 대상 (static 폴더 기준 경로)
+            output: 빌드 결과 폴더 (static 폴더 기준)
+        """
+        self.static_folder = static_folder
+        self.assets = tuple(assets)
+        self.output_folder = os.path.join(static_folder, output)
+        self.manifest_path = os.path.join(self.output_folder, 'manifest.json')
+        self.manifest: Dict[str, Dict] = {}
+        self._by_logical: Dict[str, BuiltAsset] = {}
+        self._by_path: Dict[str, BuiltAsset] = {}
+
+    def _source_hash(self, logical: str) -> str:
+        with open(os.path.join(self.static_folder, logical), 'rb') as f:
+            data = f.read()
+        return hashlib.blake2b(data + f'v{PIPELINE_VERSION}'.encode(), digest_size=16).hexdigest()
+
+    def _is_stale(self, manifest: Dict) -> bool:
+        """원본이 바뀌었거나 빌드 파일이 없으면 True"""
+        for logical in self.assets:
+            entry = manifest.get(logical)
+            if not entry or entry.get('source_hash') != self._source_hash(logical):
+                return True
+            if not os.path.exists(os.path.join(self.output_folder, entry['path'])):
+                return True
+        return False
+
+    def build(self) -> Dict[str, Dict]:
+        """
+        모든 자산 빌드 (축소 -> 해시 파일 이름 -> .gz/.br) 후 manifest.json 저장
+
+        Returns:
+            manifest: {원본 경로: {'path', 'hash', 'source_hash', 'bytes': {'original', 'minified', 'gzip', 'br'}}}
+        """
+        manifest = {}
+        for logical in self.assets:
+            with open(os.path.join(self.static_folder, logical), 'r', encoding='utf-8') as f:
+                source = f.read()
+            data = minify(logical, source).encode('utf-8')
+            digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+            stem, ext = os.path.splitext(logical)
+            path = f'{stem}.{digest[:10]}{ext}'
+
+            sizes = {'original': len(source.encode('utf-8')), 'minified': len(data)}
+            files = {path: data, f'{path}.gz': gzip.compress(data, 9, mtime=0)}
+            sizes['gzip'] = len(files[f'{path}.gz'])
+            if HAS_BROTLI:
+                files[f'{path}.br'] = brotli.compress(data, quality=11)
+                sizes['br'] = len(files[f'{path}.br'])
+            for name, content in files.items():
+                target = os.path.join(self.output_folder, name)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                temp_path = f'{target}.{os.getpid()}.tmp'
+                with open(temp_path, 'wb') as f:
+                    f.write(content)
+                os.replace(temp_path, target)
+
+            manifest[logical] = {'path': path, 'hash': digest, 'source_hash': self._source_hash(logical),
+                                 'bytes': sizes}
+        atomic_write_json(self.manifest_path, manifest, indent=2)
+        return manifest
+
+    def load(self, build_if_stale: bool = True) -> bool:
+        """
+        manifest와 빌드 파일을 메모리로 로드 (원본이 바뀌었으면 먼저 빌드)
+
+        Returns:
+            빌드 결과가 있으면 True (없으면 asset_url()이 원본 경로 반환)
+        """
+        manifest = read_json(self.manifest_path, {})
+        if build_if_stale and self._is_stale(manifest):
+            os.makedirs(self.output_folder, exist_ok=True)
+            # 여러 워커가 동시에 시작해도 한 곳만 빌드
+            with file_lock(self.manifest_path):
+                manifest = read_json(self.manifest_path, {})
+                if self._is_stale(manifest):
+                    manifest = self.build()
+                    print(report(manifest))
+
+        by_logical, by_path = {}, {}
+        for logical, entry in manifest.items():
+            path = entry['path']
+            encodings = {}
+            for encoding, suffix in (('identity', ''), ('gzip', '.gz'), ('br', '.br')):
+                try:
+                    with open(os.path.join(self.output_folder, path + suffix), 'rb') as f:
+                        encodings[encoding] = f.read()
+                except FileNotFoundError:
+                    continue
+            if 'identity' not in encodings:
+                continue
+            asset = BuiltAsset(path, MIMETYPES.get(os.path.splitext(path)[1], 'application/octet-stream'),
+                               entry['hash'], encodings)
+            by_logical[logical] = asset
+            by_path[path] = asset
+        self.manifest = manifest
+        self._by_logical, self._by_path = by_logical, by_path
+        return bool(by_path)
+
+    def built_path(self, logical: str) -> Optional[str]:
+        """원본 경로의 해시 파일 이름 (빌드되지 않았으면 None)"""
+        asset = self._by_logical.get(logical)
+        return asset.path if asset else None
+
+    def get(self, path: str) -> Optional[BuiltAsset]:
+        """해시 파일 이름으로 빌드된 자산 조회"""
+        return self._by_path.get(path)
+
+    @staticmethod
+    def choose_encoding(asset: BuiltAsset, accept_encodings) -> str:
+        """
+        Accept-Encoding에 맞는 인코딩 (br > gzip > identity)
+
+        Args:
+            accept_encodings: werkzeug Accept (request.accept_encodings)
+        """
+        for encoding in ('br', 'gzip'):
+            if encoding in asset.encodings and accept_encodings[encoding] > 0:
+                return encoding
+        return 'identity'
+
+
+def report(manifest: Dict[str, Dict]) -> str:
+    """자산별 크기 감소 보고"""
+    lines = []
+    for logical, entry in manifest.items():
+        sizes = entry['bytes']
+        original = sizes['original']
+        parts = [f"{name} {size:,}B ({(1 - size / original) * 100:.0f}% 감소)"
+                 for name, size in sizes.items() if name != 'original']
+        lines.append(f"{logical} -> {entry['path']}: 원본 {original:,}B, " + ', '.join(parts))
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    import argparse
+    import subprocess
+    import shutil
+    import tempfile
+
+    parser = argparse.ArgumentParser(description='정적 자산 빌드')
+    parser.add_argument('command', choices=('build', 'check'))
+    parser.add_argument('--static', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static'))
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        print(report(AssetPipeline(args.static).build()))
+        if not HAS_BROTLI:
+            print("brotli가 설치되지 않아 .br 파일은 만들지 않았습니다")
+    else:
+        # 축소 결과 확인 (node가 있으면 JS 문법 검사)
+        assert minify_js("var a = 'x  //y' ; // c\n  if (a) { b = /[/]\\/*/g.test(a) }\nreturn  x\n") == \
+            "var a='x  //y';\nif(a){b=/[/]\\/*/g.test(a)}\nreturn x\n"
+        assert minify_js("a = b\n/* c */\n++d; e = f / g / h\nt = `x\n  ${ {a: 1}.a }  `") == \
+            "a=b\n++d;e=f / g / h\nt=`x\n  ${ {a: 1}.a }  `\n"
+        assert minify_css("a , b > c { color: red ; /* x */ content: ' a  b ' ; }\n.d { width: calc(100% - 2px); }") == \
+            "a,b>c{color:red;content:' a  b '}.d{width:calc(100% - 2px)}\n"
+        folder = tempfile.mkdtemp()
+        shutil.copytree(args.static, folder, dirs_exist_ok=True)
+        pipeline = AssetPipeline(folder)
+        assert pipeline.load()
+        if shutil.which('node'):
+            subprocess.run(['node', '--check', os.path.join(pipeline.output_folder, pipeline.built_path('js/app.js'))],
+                           check=True)
+            print("node --check 통과")
+        # 원본이 같으면 다시 빌드하지 않음
+        mtime = os.stat(pipeline.manifest_path).st_mtime_ns
+        assert AssetPipeline(folder).load() and os.stat(pipeline.manifest_path).st_mtime_ns == mtime
+        print("검증 통과")
@@ -0,0 +1,395 @@
+# -*- coding: utf-8 -*-
+"""
+사용자 데이터 저장소 백엔드 모듈
+생년월일, 히스토리, 단축 URL 저장을 교체 가능한 백엔드로 추상화
+- JsonFileBackend: data/ 폴더의 사용자별 JSON 파일 (기존 방식)
+- SqliteBackend: WAL 모드 SQLite 단일 파일 (인덱스 테이블)
+
+마이그레이션 (기존 JSON 파일을 SQLite로 일괄 이전):
+    python storage_backend.py migrate --data-folder data --db data/life_quotes.db
+"""
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from json_storage import atomic_write_json, file_lock, read_json
+from short_url_store import ShortUrlStore
+
+
+class StorageBackend:
+    """저장소 백엔드 인터페이스"""
+
+    # 히스토리
+    def load_history(self, user_id: str) -> Optional[Dict]:
+        """사용자 히스토리 로드 (없으면 None)"""
+        raise NotImplementedError
+
+    def save_history(self, user_id: str, history: Dict):
+        """사용자 히스토리 저장"""
+        raise NotImplementedError
+
+    def lock_history(self, user_id: str):
+        """히스토리 읽기-수정-쓰기 구간 잠금 (컨텍스트 매니저)"""
+        raise NotImplementedError
+
+    def history_version(self, user_id: str):
+        """
+        히스토리의 버전 (값이 바뀌면 히스토리가 바뀐 것, 캐시 검증용)
+        기본 구현은 히스토리 자체를 버전으로 사용
+        """
+        return self.load_history(user_id)
+
+    # 생년월일
+    def load_birthday(self, user_id: str) -> Optional[Dict]:
+        """생년월일 레코드 로드 ({'birth_date', 'saved_at'}, 없으면 None)"""
+        raise NotImplementedError
+
+    def save_birthday(self, user_id: str, record: Dict):
+        """생년월일 레코드 저장"""
+        raise NotImplementedError
+
+    def birthday_version(self, user_id: str):
+        """
+        생년월일 레코드의 버전 (값이 바뀌면 레코드가 바뀐 것, 캐시 검증용)
+        기본 구현은 레코드 자체를 버전으로 사용
+        """
+        return self.load_birthday(user_id)
+
+    # 단축 URL
+    def load_short_urls(self) -> Dict[str, Dict]:
+        """전체 단축 URL 매핑 로드 ({code: {'original_url', 'created_at'}})"""
+        raise NotImplementedError
+
+    def get_short_url(self, code: str) -> Optional[Dict]:
+        """단축 코드로 레코드 조회"""
+        raise NotImplementedError
+
+    def find_short_code(self, original_url: str) -> Optional[str]:
+        """원본 URL로 기존 단축 코드 조회"""
+        raise NotImplementedError
+
+    def get_or_add_short_url(self, original_url: str, created_at: str, new_code: Callable[[int], str]) -> str:
+        """
+        원본 URL의 단축 코드 반환 (없으면 new_code(순번)으로 만든 코드로 추가, 워커 간 원자적)
+
+        Args:
+            original_url: 원본 URL
+            created_at: 생성 시각 (ISO 형식)
+            new_code: 순번 -> 단축 코드 함수 (순번은 저장소가 쓰기 잠금 안에서 고유하게 정함)
+        """
+        raise NotImplementedError
+
+
+class JsonFileBackend(StorageBackend):
+    """
+    사용자별 JSON 파일 백엔드 (data/{user_id}_birthday.json, data/{user_id}_history.json)
+    단축 URL은 메모리 인덱스 + 추가 전용 로그 저장소 사용 (data/short_urls.json, data/short_urls.log)
+    """
+
+    def __init__(self, data_folder: str = 'data'):
+        self.data_folder = data_folder
+        if not os.path.exists(data_folder):
+            os.makedirs(data_folder)
+        self.short_urls = ShortUrlStore(os.path.join(data_folder, 'short_urls.json'))
+
+    def _history_path(self, user_id: str) -> str:
+        return os.path.join(self.data_folder, f'{user_id}_history.json')
+
+    def _birthday_path(self, user_id: str) -> str:
+        return os.path.join(self.data_folder, f'{user_id}_birthday.json')
+
+    def load_history(self, user_id: str) -> Optional[Dict]:
+        return read_json(self._history_path(user_id))
+
+    def save_history(self, user_id: str, history: Dict):
+        # 요청마다 쓰는 파일이므로 공백 없이 압축 저장
+        atomic_write_json(self._history_path(user_id), history)
+
+    def lock_history(self, user_id: str):
+        return file_lock(self._history_path(user_id))
+
+    def history_version(self, user_id: str):
+        return self._file_version(self._history_path(user_id))
+
+    def load_birthday(self, user_id: str) -> Optional[Dict]:
+        return read_json(self._birthday_path(user_id))
+
+    def save_birthday(self, user_id: str, record: Dict):
+        atomic_write_json(self._birthday_path(user_id), record, separators=None)
+
+    def birthday_version(self, user_id: str):
+        return self._file_version(self._birthday_path(user_id))
+
+    @staticmethod
+    def _file_version(path: str):
+        # 파일을 열지 않고 stat만으로 확인 (원자적 교체 시 mtime/inode가 바뀜)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def load_short_urls(self) -> Dict[str, Dict]:
+        return self.short_urls.load_all()
+
+    def get_short_url(self, code: str) -> Optional[Dict]:
+        return self.short_urls.get(code)
+
+    def find_short_code(self, original_url: str) -> Optional[str]:
+        return self.short_urls.find_code(original_url)
+
+    def get_or_add_short_url(self, original_url: str, created_at: str, new_code: Callable[[int], str]) -> str:
+        return self.short_urls.get_or_add(original_url, created_at, new_code)
+
+    def iter_birthdays(self) -> Iterator[Tuple[str, Dict]]:
+        """저장된 모든 생년월일 레코드 순회 (마이그레이션용)"""
+        yield from self._iter_user_files('_birthday.json')
+
+    def iter_histories(self) -> Iterator[Tuple[str, Dict]]:
+        """저장된 모든 히스토리 순회 (마이그레이션용)"""
+        yield from self._iter_user_files('_history.json')
+
+    def _iter_user_files(self, suffix: str) -> Iterator[Tuple[str, Dict]]:
+        with os.scandir(self.data_folder) as entries:
+            for entry in entries:
+                if not entry.name.endswith(suffix) or not entry.is_file():
+                    continue
+                try:
+                    yield entry.name[:-len(suffix)], read_json(entry.path)
+                except (OSError, ValueError) as e:
+                    print(f"파일 읽기 오류 ({entry.name}): {e}")
+
+
+class SqliteBackend(StorageBackend):
+    """
+    SQLite 백엔드 (WAL 모드)
+    스레드마다 연결을 하나씩 사용하며, 모든 쿼리는 고정 SQL + 파라미터 바인딩이라
+    sqlite3 모듈의 statement 캐시를 통해 준비된 구문으로 재사용됨
+    """
+
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS birthdays (
+            user_id TEXT PRIMARY KEY,
+            birth_date TEXT NOT NULL,
+            saved_at TEXT
+        );
+        CREATE TABLE IF NOT EXISTS histories (
+            user_id TEXT PRIMARY KEY,
+            data TEXT NOT NULL,
+            updated_at TEXT
+        );
+        CREATE TABLE IF NOT EXISTS short_urls (
+            code TEXT PRIMARY KEY,
+            original_url TEXT NOT NULL,
+            created_at TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_short_urls_original_url ON short_urls (original_url);
+        CREATE TABLE IF NOT EXISTS short_url_meta (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            next_sequence INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_birthdays_birth_date ON birthdays (birth_date);
+    '''
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self._local = threading.local()
+        conn = self._connect()
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.executescript(self.SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """현재 스레드의 연결 반환 (없으면 생성)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # isolation_level=None: 자동 커밋, 잠금 구간에서만 명시적 트랜잭션
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None, cached_statements=256)
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA busy_timeout=30000')
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """쓰기 트랜잭션 (BEGIN IMMEDIATE로 워커 간 직렬화, 중첩 시 바깥 트랜잭션에 합류)"""
+        conn = self._connect()
+        if conn.in_transaction:
+            yield conn
+            return
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+
+    def load_history(self, user_id: str) -> Optional[Dict]:
+        row = self._connect().execute(
+            'SELECT data FROM histories WHERE user_id = ?', (user_id,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_history(self, user_id: str, history: Dict):
+        self._connect().execute(
+            'INSERT OR REPLACE INTO histories (user_id, data, updated_at) VALUES (?, ?, ?)',
+            (user_id, json.dumps(history, ensure_ascii=False, separators=(',', ':')), history.get('last_updated'))
+        )
+
+    def lock_history(self, user_id: str):
+        return self._transaction()
+
+    def history_version(self, user_id: str):
+        # 저장할 때마다 갱신되는 last_updated 시각을 버전으로 사용 (JSON 파싱 없음)
+        row = self._connect().execute(
+            'SELECT updated_at FROM histories WHERE user_id = ?', (user_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def load_birthday(self, user_id: str) -> Optional[Dict]:
+        row = self._connect().execute(
+            'SELECT birth_date, saved_at FROM birthdays WHERE user_id = ?', (user_id,)
+        ).fetchone()
+        return {'birth_date': row[0], 'saved_at': row[1]} if row else None
+
+    def save_birthday(self, user_id: str, record: Dict):
+        self._connect().execute(
+            'INSERT OR REPLACE INTO birthdays (user_id, birth_date, saved_at) VALUES (?, ?, ?)',
+            (user_id, record['birth_date'], record.get('saved_at'))
+        )
+
+    def birthday_version(self, user_id: str):
+        # 저장할 때마다 갱신되는 저장 시각을 버전으로 사용 (saved_at이 없는 가져온 레코드를 위해 생년월일도 포함)
+        row = self._connect().execute(
+            'SELECT saved_at, birth_date FROM birthdays WHERE user_id = ?', (user_id,)
+        ).fetchone()
+        return tuple(row) if row else None
+
+    def load_short_urls(self) -> Dict[str, Dict]:
+        rows = self._connect().execute('SELECT code, original_url, created_at FROM short_urls')
+        return {code: {'original_url': url, 'created_at': created_at} for code, url, created_at in rows}
+
+    def get_short_url(self, code: str) -> Optional[Dict]:
+        row = self._connect().execute(
+            'SELECT original_url, created_at FROM short_urls WHERE code = ?', (code,)
+        ).fetchone()
+        return {'original_url': row[0], 'created_at': row[1]} if row else None
+
+    def find_short_code(self, original_url: str) -> Optional[str]:
+        row = self._connect().execute(
+            'SELECT code FROM short_urls WHERE original_url = ? LIMIT 1', (original_url,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def get_or_add_short_url(self, original_url: str, created_at: str, new_code: Callable[[int], str]) -> str:
+        code = self.find_short_code(original_url)
+        if code is not None:
+            return code
+        with self._transaction() as conn:
+            # 트랜잭션을 기다리는 동안 다른 워커가 추가했을 수 있으므로 다시 확인
+            code = self.find_short_code(original_url)
+            if code is None:
+                # 단조 증가 순번 사용 (기존 무작위 코드와 겹치면 다음 순번, 건너뛴 순번은 다시 시도하지 않음)
+                # 순번이 없던 이전 DB는 마지막 rowid부터 시작
+                row = conn.execute('SELECT next_sequence FROM short_url_meta WHERE id = 1').fetchone()
+                if row:
+                    sequence = row[0]
+                else:
+                    sequence = conn.execute('SELECT COALESCE(MAX(rowid), 0) FROM short_urls').fetchone()[0]
+                code = new_code(sequence)
+                while self.get_short_url(code) is not None:
+                    sequence += 1
+                    code = new_code(sequence)
+                self._advance_short_url_sequence(conn, sequence + 1)
+                # 겹치는 코드는 덮어쓰지 않고 오류로 드러나도록 일반 INSERT
+                conn.execute(
+                    'INSERT INTO short_urls (code, original_url, created_at) VALUES (?, ?, ?)',
+                    (code, original_url, created_at)
+                )
+        return code
+
+    @staticmethod
+    def _advance_short_url_sequence(conn: sqlite3.Connection, next_sequence: int):
+        """다음 단축 코드 순번 저장 (줄어들지 않음, 트랜잭션 안에서 호출)"""
+        conn.execute(
+            'INSERT INTO short_url_meta (id, next_sequence) VALUES (1, ?) '
+            'ON CONFLICT (id) DO UPDATE SET next_sequence = MAX(next_sequence, excluded.next_sequence)',
+            (next_sequence,)
+        )
+
+    def import_json(self, source: JsonFileBackend) -> Dict[str, int]:
+        """
+        JSON 파일 백엔드의 데이터를 일괄 가져오기 (단일 트랜잭션, executemany)
+
+        Returns:
+            가져온 레코드 수 {'birthdays', 'histories', 'short_urls'}
+        """
+        birthdays = [
+            (user_id, record['birth_date'], record.get('saved_at'))
+            for user_id, record in source.iter_birthdays()
+            if record and record.get('birth_date')
+        ]
+        histories = [
+            (user_id, json.dumps(history, ensure_ascii=False, separators=(',', ':')), history.get('last_updated'))
+            for user_id, history in source.iter_histories()
+            if isinstance(history, dict)
+        ]
+        short_urls = [
+            (code, record['original_url'], record.get('created_at'))
+            for code, record in source.load_short_urls().items()
+            if record.get('original_url')
+        ]
+
+        with self._transaction() as conn:
+            conn.executemany(
+                'INSERT OR REPLACE INTO birthdays (user_id, birth_date, saved_at) VALUES (?, ?, ?)', birthdays
+            )
+            conn.executemany(
+                'INSERT OR REPLACE INTO histories (user_id, data, updated_at) VALUES (?, ?, ?)', histories
+            )
+            conn.executemany(
+                'INSERT OR REPLACE INTO short_urls (code, original_url, created_at) VALUES (?, ?, ?)', short_urls
+            )
+            # JSON 저장소에서 이미 쓴 순번은 이어서 사용하지 않음
+            self._advance_short_url_sequence(conn, source.short_urls.next_sequence)
+
+        return {'birthdays': len(birthdays), 'histories': len(histories), 'short_urls': len(short_urls)}
+
+
+def create_backend(name: str = 'json', data_folder: str = 'data', db_path: Optional[str] = None) -> StorageBackend:
+    """
+    저장소 백엔드 생성
+
+    Args:
+        name: 'json' 또는 'sqlite'
+        data_folder: 데이터 폴더
+        db_path: SQLite 파일 경로 (None이면 data_folder/life_quotes.db)
+    """
+    if name == 'json':
+        return JsonFileBackend(data_folder)
+    if name == 'sqlite':
+        return SqliteBackend(db_path or os.path.join(data_folder, 'life_quotes.db'))
+    raise ValueError(f"지원하지 않는 저장소 백엔드입니다: {name} (json 또는 sqlite)")
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='저장소 백엔드 관리')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    migrate_parser = subparsers.add_parser('migrate', help='JSON 파일 데이터를 SQLite로 일괄 이전')
+    migrate_parser.add_argument('--data-folder', default='data', help='JSON 파일 폴더')
+    migrate_parser.add_argument('--db', default=None, help='SQLite 파일 경로 (기본: data/life_quotes.db)')
+    args = parser.parse_args()
+
+    if args.command == 'migrate':
+        target = SqliteBackend(args.db or os.path.join(args.data_folder, 'life_quotes.db'))
+        counts = target.import_json(JsonFileBackend(args.data_folder))
+        print(f"마이그레이션 완료: 생년월일 {counts['birthdays']}건, "
+              f"히스토리 {counts['histories']}건, 단축 URL {counts['short_urls']}건 -> {target.db_path}")
@@ -2,11 +2,10 @@
 """
 사용자 히스토리 및 선호도 관리 서비스
 """
-import os
-import json
 from datetime import datetime
-from typing import Dict, List, Optional, Set
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 import pytz
+from storage_backend import JsonFileBackend, StorageBackend
 
 # 한국시간대 설정
 KST = pytz.timezone('Asia/Seoul')
@@ -19,31 +18,32 @@ def get_kst_now():
 class UserHistoryService:
     """사용자 히스토리 및 선호도 관리 클래스"""
     
-    def __init__(self, data_folder: str = 'data'):
-        self.data_folder = data_folder
-        if not os.path.exists(data_folder):
-            os.makedirs(data_folder)
+    # 히스토리를 기록하는 콘텐츠 타입
+    CONTENT_TYPES = ('quote', 'color', 'drink', 'flower', 'greeting', 'shopping')
     
-    def _get_history_file_path(self, user_id: str) -> str:
-        """사용자 히스토리 파일 경로 반환"""
-        return os.path.join(self.data_folder, f'{user_id}_history.json')
+    def __init__(self, data_folder: str = 'data', backend: Optional[StorageBackend] = None):
+        """
+        Args:
+            data_folder: 데이터 폴더 (backend가 없을 때 JSON 파일 백엔드 위치)
+            backend: 저장소 백엔드 (None이면 JSON 파일 백엔드)
+        """
+        self.data_folder = data_folder
+        self.backend = backend or JsonFileBackend(data_folder)
     
     def _load_history(self, user_id: str) -> Dict:
         """사용자 히스토리 로드"""
-        file_path = self._get_history_file_path(user_id)
-        if os.path.exists(file_path):
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                return self._get_default_history()
-        return self._get_default_history()
+        try:
+            history = self.backend.load_history(user_id)
+        except (OSError, ValueError) as e:
+            print(f"히스토리 로드 오류 ({user_id}): {e}")
+            history = None
+        if history is None:
+            return self._get_default_history()
+        return history
     
     def _save_history(self, user_id: str, history: Dict):
         """사용자 히스토리 저장"""
-        file_path = self._get_history_file_path(user_id)
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(history, f, ensure_ascii=False, indent=2)
+        self.backend.save_history(user_id, history)
     
     def _get_default_history(self) -> Dict:
         """기본 히스토리 구조 반환"""
@@ -57,6 +57,18 @@ class UserHistoryService:
             'last_updated': get_kst_now().isoformat()
         }
     
+    def session(self, user_id: str) -> 'HistorySession':
+        """
+        요청 단위 히스토리 세션 생성
+        히스토리를 한 번만 로드하고, 변경은 메모리에서 처리한 뒤 flush() 시 한 번만 저장
+        
+        사용 예:
+            with history_service.session(user_id) as history:
+                if not history.is_viewed('drink', name):
+                    history.record_view('drink', name)
+        """
+        return HistorySession(self, user_id)
+    
     def record_view(self, user_id: str, content_type: str, content_id: str):
         """
         콘텐츠 조회 기록
@@ -66,21 +78,9 @@ class UserHistoryService:
             content_type: 콘텐츠 타입 ('quote', 'color', 'drink', 'flower', 'greeting', 'shopping')
             content_id: 콘텐츠 식별자 (텍스트 해시 또는 이름)
         """
-        history = self._load_history(user_id)
-        view_key = f'viewed_{content_type}s'
-        
-        if view_key not in history:
-            history[view_key] = []
-        
-        # 중복 방지
-        if content_id not in history[view_key]:
-            history[view_key].append(content_id)
-            # 최근 100개만 유지 (메모리 절약)
-            if len(history[view_key]) > 100:
-                history[view_key] = history[view_key][-100:]
-        
-        history['last_updated'] = get_kst_now().isoformat()
-        self._save_history(user_id, history)
+        # 저장(flush)은 워커 간 잠금 안에서 최신 히스토리에 합쳐서 처리
+        with self.session(user_id) as history:
+            history.record_view(content_type, content_id)
     
     def get_viewed_items(self, user_id: str, content_type: str) -> List[str]:
         """본 콘텐츠 목록 반환"""
@@ -101,6 +101,38 @@ class UserHistoryService:
         
         return False
     
+    def get_viewed_sets(self, user_id: str) -> Dict[str, Set[str]]:
+        """
+        모든 콘텐츠 타입의 본 목록을 한 번의 로드로 집합 형태로 반환
+        
+        Returns:
+            {content_type: 본 콘텐츠 식별자 집합}
+        """
+        history = self.session(user_id)
+        return {content_type: history.viewed(content_type) for content_type in self.CONTENT_TYPES}
+    
+    def select_unviewed(self, candidates: Iterable[Dict], viewed: Set[str],
+                        get_id: Callable[[Dict], str]) -> Tuple[Optional[Dict], Optional[str]]:
+        """
+        후보 스트림을 순서대로 확인하여 아직 보지 않은 첫 후보 선택
+        
+        Args:
+            candidates: 우선순위 순서의 후보 이터러블 (suggester의 iter_candidates())
+            viewed: 이미 본 콘텐츠 식별자 집합
+            get_id: 후보에서 콘텐츠 식별자를 만드는 함수
+        
+        Returns:
+            (후보, 콘텐츠 식별자) - 모두 본 경우 첫 번째 후보, 후보가 없으면 (None, None)
+        """
+        first = (None, None)
+        for candidate in candidates:
+            content_id = get_id(candidate)
+            if content_id not in viewed:
+                return candidate, content_id
+            if first[0] is None:
+                first = (candidate, content_id)
+        return first
+    
     def get_content_hash(self, text: str) -> str:
         """텍스트를 해시하여 고유 ID 생성"""
         import hashlib
@@ -118,36 +150,198 @@ class UserHistoryService:
             user_id: 사용자 ID
             content_type: 콘텐츠 타입 (None이면 전체 초기화)
         """
+        with self.backend.lock_history(user_id):
+            self._clear_history(user_id, content_type)
+    
+    def _clear_history(self, user_id: str, content_type: Optional[str]):
+        """히스토리 초기화 (잠금 내부에서 호출)"""
         history = self._load_history(user_id)
         
         if content_type is None:
             # 전체 초기화
             history = self._get_default_history()
+            cleared_types = self.CONTENT_TYPES
         else:
             # 특정 타입만 초기화
             view_key = f'viewed_{content_type}s'
             if view_key in history:
                 history[view_key] = []
+            cleared_types = (content_type,)
         
         history['last_updated'] = get_kst_now().isoformat()
+        # 초기화 전에 시작한 세션이 flush 시 지운 타입의 기록을 되살리지 않도록 타입별로 표시
+        for cleared_type in cleared_types:
+            history[f'cleared_at_{cleared_type}'] = history['last_updated']
         self._save_history(user_id, history)
 
 
+class HistorySession:
+    """
+    요청 단위 히스토리 세션 (Unit of Work)
+    생성 시 히스토리를 한 번 로드하고, 조회 확인은 메모리 집합에서, 조회 기록은 메모리에서 처리.
+    flush() (또는 with 블록 정상 종료) 시 변경이 있을 때만 잠금 안에서 최신 히스토리에
+    이번 세션의 기록만 합쳐 한 번 저장 (세션 중 다른 요청의 기록/초기화를 덮어쓰지 않음)
+    """
+    
+    def __init__(self, service: UserHistoryService, user_id: str):
+        self.service = service
+        self.user_id = user_id
+        self.history = service._load_history(user_id)
+        self._viewed_sets: Dict[str, Set[str]] = {}
+        # 이번 세션에서 기록한 식별자 (타입별, 기록 순서)
+        self._recorded: Dict[str, List[str]] = {}
+        self._dirty = False
+    
+    def __enter__(self) -> 'HistorySession':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        # 예외가 발생하면 부분 변경을 저장하지 않음
+        if exc_type is None:
+            self.flush()
+        return False
+    
+    def viewed(self, content_type: str) -> Set[str]:
+        """본 콘텐츠 식별자 집합 반환 (세션 내 기록이 바로 반영됨)"""
+        if content_type not in self._viewed_sets:
+            view_key = f'viewed_{content_type}s'
+            self._viewed_sets[content_type] = set(self.history.get(view_key, []))
+        return self._viewed_sets[content_type]
+    
+    def is_viewed(self, content_type: str, content_id: str) -> bool:
+        """콘텐츠를 이미 본 적이 있는지 확인"""
+        return content_id in self.viewed(content_type)
+    
+    def should_avoid(self, content_type: str, content_id: str) -> bool:
+        """콘텐츠를 피해야 하는지 확인 (이미 본 경우)"""
+        return self.is_viewed(content_type, content_id)
+    
+    def record_view(self, content_type: str, content_id: str):
+        """콘텐츠 조회 기록 (메모리에만 반영, flush() 시 저장)"""
+        view_key = f'viewed_{content_type}s'
+        
+        if view_key not in self.history:
+            self.history[view_key] = []
+        
+        viewed = self.viewed(content_type)
+        
+        # 중복 방지
+        if content_id not in viewed:
+            self._recorded.setdefault(content_type, []).append(content_id)
+            self.history[view_key].append(content_id)
+            # 최근 100개만 유지 (메모리 절약)
+            if len(self.history[view_key]) > 100:
+                self.history[view_key] = self.history[view_key][-100:]
+                self._viewed_sets[content_type] = set(self.history[view_key])
+            else:
+                viewed.add(content_id)
+        
+        self.history['last_updated'] = get_kst_now().isoformat()
+        self._dirty = True
+    
+    def flush(self):
+        """
+        변경 사항이 있으면 히스토리를 한 번 저장
+        잠금 안에서 히스토리를 다시 읽어 이번 세션의 기록만 합침 (외부 API 호출 중에는 잠그지 않음).
+        세션을 연 뒤 초기화된 타입의 기록은 버림 (다른 타입의 기록은 합침)
+        """
+        if not self._dirty:
+            return
+        service = self.service
+        with service.backend.lock_history(self.user_id):
+            current = service._load_history(self.user_id)
+            changed = False
+            for content_type, content_ids in self._recorded.items():
+                cleared_key = f'cleared_at_{content_type}'
+                if current.get(cleared_key) != self.history.get(cleared_key):
+                    continue
+                view_key = f'viewed_{content_type}s'
+                viewed = current.setdefault(view_key, [])
+                existing = set(viewed)
+                viewed.extend(content_id for content_id in content_ids if content_id not in existing)
+                # 최근 100개만 유지
+                if len(viewed) > 100:
+                    current[view_key] = viewed[-100:]
+                changed = True
+            if changed:
+                current['last_updated'] = get_kst_now().isoformat()
+                service._save_history(self.user_id, current)
+        self.history = current
+        self._viewed_sets.clear()
+        self._recorded.clear()
+        self._dirty = False
+
+
+def _stress_worker(args):
+    """스트레스 테스트 작업자: 세션마다 다른 식별자를 기록 (여러 프로세스가 같은 사용자에 동시에 저장)"""
+    data_folder, worker_id, iterations = args
+    service = UserHistoryService(data_folder=data_folder)
+    for i in range(iterations):
+        with service.session('stress_user') as history:
+            history.record_view('quote', f'{worker_id}_{i}')
+    return worker_id
+
+
 if __name__ == '__main__':
-    # 테스트
-    service = UserHistoryService()
+    # 테스트 및 벤치마크: 요청당 파일 입출력 횟수와 지연 시간 비교
+    import builtins
+    import tempfile
+    import time
+    
+    service = UserHistoryService(data_folder=tempfile.mkdtemp())
     user_id = 'test_user'
     
     # 조회 기록
     service.record_view(user_id, 'quote', 'quote_hash_123')
     service.record_view(user_id, 'color', '빨간색')
     
-    # 피드백 기록
-    service.record_feedback(user_id, 'quote', 'quote_hash_456', 'like')
-    service.record_feedback(user_id, 'color', '파란색', 'dislike')
-    
     # 조회
     print("본 명언:", service.get_viewed_items(user_id, 'quote'))
-    print("선호도:", service.get_preferences(user_id, 'quote'))
-    print("피해야 하는가:", service.should_avoid(user_id, 'color', '파란색'))
+    print("피해야 하는가:", service.should_avoid(user_id, 'color', '빨간색'))
+    
+    # 파일 열기(open) 횟수 집계
+    open_count = [0]
+    real_open = builtins.open
+    
+    def counting_open(*args, **kwargs):
+        open_count[0] += 1
+        return real_open(*args, **kwargs)
+    
+    builtins.open = counting_open
+    content_types = ['quote', 'drink', 'flower', 'greeting', 'shopping']
+    
+    def legacy_request(n):
+        # 기존 /api/daily 방식: 타입마다 should_avoid + record_view
+        for content_type in content_types:
+            if not service.should_avoid(user_id, content_type, f'{content_type}_{n}'):
+                service.record_view(user_id, content_type, f'{content_type}_{n}')
+    
+    def session_request(n):
+        # 세션 방식: 한 번 로드, 메모리에서 확인/기록, 한 번 저장
+        with service.session(user_id) as history:
+            for content_type in content_types:
+                if not history.should_avoid(content_type, f'{content_type}_{n}'):
+                    history.record_view(content_type, f'{content_type}_{n}')
+    
+    for name, request_func in [('기존 방식', legacy_request), ('세션 방식', session_request)]:
+        service.clear_history(user_id)
+        open_count[0] = 0
+        iterations = 200
+        start = time.perf_counter()
+        for n in range(iterations):
+            request_func(n)
+        elapsed = time.perf_counter() - start
+        print(f"{name}: 요청당 open {open_count[0] / iterations:.1f}회, "
+              f"평균 {elapsed / iterations * 1000:.3f}ms")
+    builtins.open = real_open
+
+    # 스트레스 테스트: 여러 프로세스의 세션 저장이 서로의 기록을 덮어쓰지 않아야 함
+    from multiprocessing import Pool
 
+    stress_folder = tempfile.mkdtemp()
+    workers, iterations = 4, 20
+    with Pool(workers) as pool:
+        pool.map(_stress_worker, [(stress_folder, w, iterations) for w in range(workers)])
+    recorded = UserHistoryService(data_folder=stress_folder).get_viewed_items('stress_user', 'quote')
+    assert len(recorded) == workers * iterations, len(recorded)
+    print(f"스트레스 테스트 통과: {workers}개 프로세스, 잃어버린 기록 없음 ({len(recorded)}개)")